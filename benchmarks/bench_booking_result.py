@@ -0,0 +1,67 @@
+"""Memória e alocações de BookingResult: classe com __dict__ versus a versão com __slots__ e singleton."""
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+INSTANCES = 100_000
+QUOTES = 200_000
+
+
+class DictBookingResult:
+    # Versão anterior de BookingResult, com __dict__ por instância
+    def __init__(self, confirmation, total_price, refund_amount, points_used):
+        self.confirmation = confirmation
+        self.total_price = total_price
+        self.refund_amount = refund_amount
+        self.points_used = points_used
+
+
+class DictFlightBookingSystem(FlightBookingSystem):
+    # book_flight como era antes: aloca um resultado novo até na rejeição por falta de assentos
+    def book_flight(self, passengers, booking_time, available_seats, *args):
+        if passengers > available_seats:
+            return DictBookingResult(False, 0.0, 0.0, False)
+        return super().book_flight(passengers, booking_time, available_seats, *args)
+
+
+def _bytes_per_instance(cls):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [cls(True, 123.45, 0.0, False) for _ in range(INSTANCES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Desconta a própria lista que segura as instâncias
+    growth -= instances.__sizeof__()
+    return growth / INSTANCES
+
+
+def _quote_load(system):
+    # Tráfego de busca: 3 em cada 4 cotações pedem mais assentos do que restam
+    now = datetime(2025, 1, 1, 8, 0)
+    departure = now + timedelta(hours=72)
+    retained = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(QUOTES):
+        retained.append(system.book_flight(3, now, 0 if i % 4 else 10, 500.0, 40, False, departure, 0))
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current, peak
+
+
+def main():
+    for label, cls in (("__dict__", DictBookingResult), ("__slots__", BookingResult)):
+        print(f"{label:10s} {_bytes_per_instance(cls):6.1f} bytes por resultado")
+
+    print(f"{QUOTES:,} cotações retidas (75% rejeitadas por falta de assentos), sob tracemalloc:")
+    for label, system in (("antes", DictFlightBookingSystem()), ("depois", FlightBookingSystem())):
+        elapsed, current, peak = _quote_load(system)
+        print(f"  {label:7s} {current / 2**20:6.1f} MiB retidos  pico {peak / 2**20:6.1f} MiB  {elapsed:5.2f}s")
+
+
+if __name__ == "__main__":
+    main()
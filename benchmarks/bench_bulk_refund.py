@@ -0,0 +1,67 @@
+"""Reembolso de um voo cancelado com 1M de reservas: laço escalar versus BulkRefundProcessor."""
+import os
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from itertools import cycle, islice
+from src.flight.BulkRefundProcessor import BulkRefundProcessor
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+BOOKINGS = 1_000_000
+DEPARTURE = datetime(2025, 3, 1, 9, 0)
+
+# Um conjunto fixo de reservas repetido até BOOKINGS, para medir o reembolso e não a geração dos dados
+_rng = random.Random(0)
+_POOL = [(_rng.randint(1, 6), DEPARTURE - timedelta(minutes=_rng.randint(60, 10_000)),
+          _rng.choice([180.0, 420.0, 950.0]), _rng.randint(0, 150), _rng.choice([0, 0, 500]))
+         for _ in range(50_000)]
+
+
+def _bookings(count):
+    return islice(cycle(_POOL), count)
+
+
+def _scalar(count):
+    system = FlightBookingSystem()
+    total = 0.0
+    for passengers, time_, price, sales, points in _bookings(count):
+        total += system.book_flight(passengers, time_, passengers, price, sales, True, DEPARTURE, points).refund_amount
+    return total
+
+
+def _bulk(count, workers, chunk_size=20_000):
+    processor = BulkRefundProcessor(chunk_size, workers)
+    return sum(float(batch.refund_amount.sum()) for batch in processor.refund_batches(_bookings(count), DEPARTURE))
+
+
+def _measure(label, function, *args):
+    start = time.perf_counter()
+    total = function(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:28s} {elapsed:6.2f}s  {BOOKINGS / elapsed:10,.0f} reservas/s  reembolso={total:,.2f}")
+
+
+def main():
+    start = time.perf_counter()
+    for _ in _bookings(BOOKINGS):
+        pass
+    print(f"{'só percorrer as reservas':28s} {time.perf_counter() - start:6.2f}s")
+
+    _measure("laço escalar", _scalar, BOOKINGS)
+    _measure("BulkRefundProcessor 1 proc", _bulk, BOOKINGS, 1)
+    workers = os.cpu_count() or 1
+    if workers > 1:
+        _measure(f"BulkRefundProcessor {workers} procs", _bulk, BOOKINGS, workers)
+
+    # Memória limitada ao bloco: o pico não depende do número de reservas
+    for count in (100_000, 400_000):
+        tracemalloc.start()
+        _bulk(count, 1)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"pico de memória com {count:,} reservas: {peak / 2**20:5.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""manage_energy com dict de prioridades versus DeviceRegistry: tempo por chamada e bytes por resultado."""
+import time
+import tracemalloc
+from datetime import datetime
+from src.energy.DeviceRegistry import DeviceRegistry
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+CALLS = 50_000
+RETAINED = 20_000
+
+
+def _priorities(count):
+    names = ["Security", "Refrigerator", "Heating"] + [f"Device{i}" for i in range(count - 3)]
+    return {name: 1 + index % 3 for index, name in enumerate(names)}
+
+
+def _call(system, priorities, index):
+    # Alterna preço, noite e consumo para passar por todos os passos
+    return system.manage_energy(
+        0.8 if index % 2 else 0.2, 0.5, priorities, datetime(2025, 1, 1, 23 if index % 3 == 0 else 12, 0),
+        17.0 if index % 5 == 0 else 21.0, (19.0, 23.0), 20.0, 25.0 if index % 4 == 0 else 0.0, [],
+    )
+
+
+def _time_per_call(system, priorities):
+    start = time.perf_counter()
+    for index in range(CALLS):
+        _call(system, priorities, index)
+    return (time.perf_counter() - start) / CALLS
+
+
+def _bytes_per_result(system, priorities):
+    tracemalloc.start()
+    results = [_call(system, priorities, index) for index in range(RETAINED)]
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return current / RETAINED
+
+
+def main():
+    system = SmartEnergyManagementSystem()
+    for count in (8, 32, 128):
+        priorities = _priorities(count)
+        registry = DeviceRegistry(priorities)
+        print(f"dispositivos={count:<4} "
+              f"dict {_time_per_call(system, priorities) * 1e6:6.2f} us  {_bytes_per_result(system, priorities):7.0f} B   "
+              f"DeviceRegistry {_time_per_call(system, registry) * 1e6:6.2f} us  {_bytes_per_result(system, registry):5.0f} B")
+
+
+if __name__ == "__main__":
+    main()
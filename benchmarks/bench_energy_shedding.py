@@ -0,0 +1,62 @@
+"""Corte por limite de consumo: laço anterior (relista os candidatos) versus a passada única atual."""
+import time
+from datetime import datetime
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+NOON = datetime(2025, 1, 1, 12, 0)
+
+
+def _previous_loop(device_status, device_priorities, total_energy_used_today, energy_usage_limit):
+    devices_were_on = True
+    while total_energy_used_today >= energy_usage_limit and devices_were_on:
+        devices_to_turn_off = [
+            device for device, priority in device_priorities.items()
+            if device_status.get(device, False) and priority > 1
+        ]
+        if not devices_to_turn_off:
+            devices_were_on = False
+            continue
+        for device in devices_to_turn_off:
+            if total_energy_used_today < energy_usage_limit:
+                break
+            device_status[device] = False
+            total_energy_used_today -= 1
+    return total_energy_used_today
+
+
+def _single_pass(device_status, device_priorities, total_energy_used_today, energy_usage_limit):
+    # Mesmo código do passo 4 de manage_energy
+    if total_energy_used_today >= energy_usage_limit:
+        for device, priority in device_priorities.items():
+            if total_energy_used_today < energy_usage_limit:
+                break
+            if priority > 1 and device_status[device]:
+                device_status[device] = False
+                total_energy_used_today -= 1
+    return total_energy_used_today
+
+
+def _timeit(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    system = SmartEnergyManagementSystem()
+    for count in (10, 100, 1_000, 10_000, 100_000):
+        priorities = {f"D{i}": 1 + i % 3 for i in range(count)}
+        repeat = max(3, 100_000 // count)
+        for label, total in (("excesso pequeno", 105.0), ("excesso total", 100.0 + count)):
+            # Só o passo de corte; a cópia do estado entra nas duas medidas
+            previous = _timeit(lambda: _previous_loop(dict.fromkeys(priorities, True), priorities, total, 100.0), repeat)
+            single = _timeit(lambda: _single_pass(dict.fromkeys(priorities, True), priorities, total, 100.0), repeat)
+            full = _timeit(lambda: system.manage_energy(
+                0.1, 0.5, priorities, NOON, 21.0, (19.0, 23.0), 100.0, total, []), repeat)
+            print(f"dispositivos={count:<7} {label:16s} laço anterior {previous * 1e6:10.1f} us  "
+                  f"passada única {single * 1e6:10.1f} us  manage_energy {full * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Um ano de dados por minuto de uma casa: manage_energy passo a passo versus EnergySimulator."""
+import os
+import tempfile
+import time
+import numpy as np
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.EnergySimulator import EnergySimulator
+
+STEPS = 365 * 24 * 60
+SAMPLE = 50_000
+START = datetime(2025, 1, 1)
+PRIORITIES = {"Security": 1, "Refrigerator": 1, "Heating": 2, "Lights": 2, "Oven": 3, "Washer": 3, "TV": 2}
+SCHEDULES = [DeviceSchedule("Washer", START + timedelta(days=day, hours=10)) for day in range(0, 365, 3)]
+
+
+def _series():
+    rng = np.random.default_rng(0)
+    minutes = np.arange(STEPS)
+    prices = 0.4 + 0.2 * np.sin(minutes / 1440 * 2 * np.pi) + rng.normal(0, 0.05, STEPS)
+    temperatures = 20 + 6 * np.sin(minutes / (1440 * 365) * 2 * np.pi) + rng.normal(0, 1.0, STEPS)
+    energy_used = (minutes % 1440) * 0.03
+    return prices, temperatures, energy_used
+
+
+def main():
+    prices, temperatures, energy_used = _series()
+    simulator = EnergySimulator(PRIORITIES, 0.5, (19.0, 23.0), 35.0, SCHEDULES)
+
+    system = SmartEnergyManagementSystem()
+    start = time.perf_counter()
+    for index in range(SAMPLE):
+        system.manage_energy(prices[index], 0.5, PRIORITIES, START + timedelta(minutes=index),
+                             temperatures[index], (19.0, 23.0), 35.0, energy_used[index], SCHEDULES)
+    scalar = (time.perf_counter() - start) / SAMPLE * STEPS
+    print(f"{STEPS:,} passos (um ano por minuto)")
+    print(f"manage_energy passo a passo  {scalar:7.2f}s (estimado a partir de {SAMPLE:,} passos)")
+
+    start = time.perf_counter()
+    result = simulator.run(START, prices, temperatures, energy_used)
+    print(f"EnergySimulator em memória   {time.perf_counter() - start:7.2f}s  "
+          f"{result.status_bits.nbytes + result.present_bits.nbytes:,} bytes de bitmaps")
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f"{name}.npy") for name in ("prices", "temperatures", "energy")]
+        for path, values in zip(paths, (prices, temperatures, energy_used)):
+            np.save(path, values)
+        start = time.perf_counter()
+        simulator.run_npy(START, *paths)
+        print(f"EnergySimulator .npy mmap    {time.perf_counter() - start:7.2f}s")
+
+        csv_path = os.path.join(directory, "series.csv")
+        np.savetxt(csv_path, np.column_stack([prices, temperatures, energy_used]), delimiter=",",
+                   header="price,temperature,energy_used", comments="", fmt="%.6f")
+        start = time.perf_counter()
+        simulator.run_csv(csv_path, START)
+        print(f"EnergySimulator CSV          {time.perf_counter() - start:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Escala do FleetEnergyDispatcher com o número de processos, contra a frota num único processo."""
+import os
+import time
+import numpy as np
+from datetime import datetime
+from src.energy.FleetEnergyDispatcher import FleetEnergyDispatcher
+from src.energy.FleetEnergyManagementSystem import FleetEnergyManagementSystem
+
+HOMES = 1_000_000
+CATALOG = ["Security", "Refrigerator", "Heating", "Lights", "Oven", "Washer", "TV", "Dryer"]
+DEADLINE = 1.0
+REPEAT = 3
+
+
+def _inputs(fleet):
+    rng = np.random.default_rng(0)
+    installed = rng.random((HOMES, len(fleet.device_names))) < 0.7
+    return (
+        0.3, 0.5, rng.integers(1, 4, installed.shape), installed, datetime(2025, 1, 1, 18, 0),
+        rng.choice([15.0, 21.0, 26.0], HOMES), (19.0, 23.0), 20.0, rng.choice([0.0, 20.0, 40.0], HOMES),
+    )
+
+
+def main():
+    fleet = FleetEnergyManagementSystem(CATALOG)
+    inputs = _inputs(fleet)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fleet.manage_fleet(*inputs)
+    single = (time.perf_counter() - start) / REPEAT
+    print(f"{HOMES:,} casas, {os.cpu_count()} CPU(s)")
+    print(f"um processo, sem dispatcher   {single:6.3f}s")
+
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for workers in counts:
+        with FleetEnergyDispatcher(CATALOG, workers) as dispatcher:
+            # Aquece o pool: o spawn dos processos não entra na medida
+            dispatcher.dispatch(*inputs)
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                result = dispatcher.dispatch(*inputs, deadline=DEADLINE)
+            elapsed = (time.perf_counter() - start) / REPEAT
+        print(f"workers={workers:<3}                   {elapsed:6.3f}s  ({single / elapsed:4.2f}x)  "
+              f"partições fora do prazo de {DEADLINE:.0f}s: {len(result.missed_partitions)}")
+
+
+if __name__ == "__main__":
+    main()
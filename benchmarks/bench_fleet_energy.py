@@ -0,0 +1,41 @@
+"""Um tick de preço para uma região inteira: manage_energy casa a casa versus FleetEnergyManagementSystem."""
+import time
+import numpy as np
+from datetime import datetime
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.FleetEnergyManagementSystem import FleetEnergyManagementSystem
+
+HOMES = 200_000
+CATALOG = ["Security", "Refrigerator", "Heating", "Lights", "Oven", "Washer", "TV", "Dryer"]
+
+
+def main():
+    rng = np.random.default_rng(0)
+    fleet = FleetEnergyManagementSystem(CATALOG)
+    installed = rng.random((HOMES, len(fleet.device_names))) < 0.7
+    installed[:, fleet.columns["Cooling"]] = False
+    priorities = rng.integers(1, 4, installed.shape)
+    temperatures = rng.choice([15.0, 21.0, 26.0], HOMES)
+    totals = rng.choice([0.0, 20.0, 40.0], HOMES)
+    now = datetime(2025, 1, 1, 18, 0)
+    homes = [{name: int(priorities[home, column]) for column, name in enumerate(fleet.device_names)
+              if installed[home, column]} for home in range(HOMES)]
+
+    system = SmartEnergyManagementSystem()
+    start = time.perf_counter()
+    for home, device_priorities in enumerate(homes):
+        system.manage_energy(0.8, 0.5, device_priorities, now, temperatures[home], (19.0, 23.0),
+                             30.0, totals[home], [])
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fleet.manage_fleet(0.8, 0.5, priorities, installed, now, temperatures, (19.0, 23.0), 30.0, totals)
+    vectorized = time.perf_counter() - start
+
+    print(f"{HOMES:,} casas, {len(fleet.device_names)} dispositivos no catálogo")
+    print(f"manage_energy por casa {scalar:6.2f}s")
+    print(f"manage_fleet           {vectorized:6.3f}s  ({scalar / vectorized:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Vazão das regras compiladas de FraudRules contra as regras fixas e uma versão interpretada."""
+import random
+import time
+from datetime import datetime, timedelta
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.FraudRules import FraudRules
+from src.fraud.Transaction import Transaction
+
+ITERATIONS = 500_000
+
+
+class InterpretedFraudDetectionSystem(FraudDetectionSystem):
+    """Versão ingênua configurável: consulta a definição em dicionários a cada chamada."""
+
+    def __init__(self, definition):
+        super().__init__()
+        self.definition = definition
+
+    def _evaluate(self, current_transaction, recent_transaction_count, last_transaction, blacklisted_locations):
+        rules = self.definition
+        is_fraudulent = is_blocked = verification_required = False
+        risk_score = 0
+        if current_transaction.amount > rules["amount"]["threshold"]:
+            is_fraudulent = verification_required = True
+            risk_score += rules["amount"]["points"]
+        if recent_transaction_count > rules["velocity"]["max_count"]:
+            is_blocked = True
+            risk_score += rules["velocity"]["points"]
+        if (last_transaction is not None
+                and current_transaction.timestamp - last_transaction.timestamp
+                < timedelta(minutes=rules["location"]["window_minutes"])
+                and last_transaction.location != current_transaction.location):
+            is_fraudulent = verification_required = True
+            risk_score += rules["location"]["points"]
+        if current_transaction.location in blacklisted_locations:
+            is_blocked = True
+            risk_score = rules["blacklist"]["score"]
+        return FraudCheckResult(is_fraudulent, is_blocked, verification_required, risk_score)
+
+
+def _inputs():
+    rng = random.Random(0)
+    now = datetime(2025, 1, 1)
+    return [
+        (Transaction(rng.choice([100, 20000]), now, rng.choice(["BR", "US"])),
+         rng.randint(0, 15),
+         Transaction(100, now - timedelta(minutes=rng.randint(0, 60)), rng.choice(["BR", "US"])))
+        for _ in range(1000)
+    ]
+
+
+def _throughput(system, inputs):
+    evaluate = system._evaluate
+    blacklist = frozenset(["AR"])
+    rounds = ITERATIONS // len(inputs)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for transaction, count, last in inputs:
+            evaluate(transaction, count, last, blacklist)
+    return rounds * len(inputs) / (time.perf_counter() - start)
+
+
+def main():
+    inputs = _inputs()
+    rules = FraudRules()
+    systems = {
+        "regras fixas": FraudDetectionSystem(),
+        "FraudRules compilado": FraudDetectionSystem(rules=rules),
+        "dicionários interpretados": InterpretedFraudDetectionSystem(rules.definition),
+    }
+    baseline = None
+    for name, system in systems.items():
+        rate = _throughput(system, inputs)
+        baseline = baseline or rate
+        print(f"{name:<27} {rate:10.0f} avaliações/s  ({rate / baseline:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
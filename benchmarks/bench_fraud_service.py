@@ -0,0 +1,42 @@
+"""Gerador de carga local para o FraudCheckService com diferentes tamanhos de lote."""
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from src.fraud.FraudCheckService import FraudCheckService
+from src.fraud.Transaction import Transaction
+
+CLIENTS = 500
+REQUESTS_PER_CLIENT = 100
+
+
+async def _client(service, client_id, rng):
+    account = f"acc{client_id}"
+    timestamp = datetime(2025, 1, 1)
+    for _ in range(REQUESTS_PER_CLIENT):
+        timestamp += timedelta(minutes=rng.randint(0, 10))
+        await service.check(account, Transaction(rng.choice([100, 20000]), timestamp, rng.choice(["BR", "US"])))
+
+
+async def _load(max_batch_size, max_wait_ms):
+    rng = random.Random(0)
+    async with FraudCheckService(blacklisted_locations=["Miami"],
+                                 max_batch_size=max_batch_size, max_wait_ms=max_wait_ms) as service:
+        start = time.perf_counter()
+        await asyncio.gather(*(_client(service, i, rng) for i in range(CLIENTS)))
+        elapsed = time.perf_counter() - start
+    return elapsed, service.metrics.snapshot()
+
+
+def main():
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    for max_batch_size, max_wait_ms in [(1, 0), (16, 1), (64, 2), (256, 5)]:
+        elapsed, metrics = asyncio.run(_load(max_batch_size, max_wait_ms))
+        print(f"batch<={max_batch_size:<4} wait={max_wait_ms}ms  "
+              f"{total / elapsed:9.0f} req/s  p50={metrics['p50_ms']:6.2f}ms  "
+              f"p99={metrics['p99_ms']:6.2f}ms  lote médio={metrics['mean_batch_size']:6.1f}  "
+              f"fila máx={metrics['max_queue_depth']}")
+
+
+if __name__ == "__main__":
+    main()
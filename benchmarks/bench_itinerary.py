@@ -0,0 +1,48 @@
+"""Latência de itinerários de 2 a 6 trechos com estoque remoto simulado: sequencial versus threads."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from src.flight.FlightLeg import FlightLeg
+from src.flight.ItineraryBookingSystem import ItineraryBookingSystem
+from src.flight.SeatInventory import SeatInventory
+
+ITINERARIES = 50
+INVENTORY_LATENCY = 0.002
+
+
+class RemoteSeatInventory(SeatInventory):
+    # Simula a ida e volta até um serviço de estoque antes de cada operação
+    @contextmanager
+    def locked(self, flight_id):
+        time.sleep(INVENTORY_LATENCY)
+        with super().locked(flight_id) as flight:
+            yield flight
+
+
+def _run(leg_count, executor):
+    inventory = RemoteSeatInventory()
+    for leg in range(leg_count):
+        inventory.add_flight(f"L{leg}", capacity=ITINERARIES)
+    system = ItineraryBookingSystem(inventory, executor)
+    now = datetime(2025, 1, 1, 8, 0)
+    legs = [FlightLeg(f"L{leg}", 400.0, 30, now + timedelta(hours=48 + 5 * leg)) for leg in range(leg_count)]
+
+    start = time.perf_counter()
+    for _ in range(ITINERARIES):
+        assert system.book_itinerary(legs, 1, now).confirmation
+    return (time.perf_counter() - start) / ITINERARIES
+
+
+def main():
+    print(f"latência simulada do estoque: {INVENTORY_LATENCY * 1000:.1f} ms por operação")
+    with ThreadPoolExecutor(6) as executor:
+        for leg_count in range(2, 7):
+            sequential = _run(leg_count, None)
+            parallel = _run(leg_count, executor)
+            print(f"trechos={leg_count}  sequencial {sequential * 1000:6.2f} ms  "
+                  f"threads {parallel * 1000:6.2f} ms  ({sequential / parallel:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
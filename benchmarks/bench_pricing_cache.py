@@ -0,0 +1,57 @@
+"""Replay sintético de tráfego de busca: avaliações de preço com e sem o PricingCache."""
+import random
+import time
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.PricingCache import PricingCache
+
+QUOTES = 300_000
+FLIGHTS = 200
+
+
+class CountingFlightBookingSystem(FlightBookingSystem):
+    def __init__(self):
+        super().__init__()
+        self.evaluations = 0
+
+    def book_flight(self, *args):
+        self.evaluations += 1
+        return super().book_flight(*args)
+
+
+def _traffic():
+    rng = random.Random(0)
+    start = datetime(2025, 1, 1, 8, 0)
+    flights = [(500.0 + 25 * (i % 20), rng.randint(0, 150), start + timedelta(hours=rng.randint(2, 240)))
+               for i in range(FLIGHTS)]
+    for i in range(QUOTES):
+        price, sales, departure = flights[rng.randrange(FLIGHTS)]
+        # Buscas da mesma página chegam com poucos segundos de diferença
+        booking_time = start + timedelta(seconds=i // 50)
+        yield (rng.choice([1, 1, 2, 2, 3, 4, 5]), booking_time, 9, price, sales, False, departure,
+               rng.choice([0, 0, 0, 1000]))
+
+
+def main():
+    traffic = list(_traffic())
+
+    direct = CountingFlightBookingSystem()
+    start = time.perf_counter()
+    for request in traffic:
+        direct.book_flight(*request)
+    direct_time = time.perf_counter() - start
+
+    counted = CountingFlightBookingSystem()
+    cache = PricingCache(counted, max_entries=20_000)
+    start = time.perf_counter()
+    for request in traffic:
+        cache.book_flight(*request)
+    cached_time = time.perf_counter() - start
+
+    print(f"sem cache: {direct.evaluations:8d} avaliações  {direct_time:6.2f}s")
+    print(f"com cache: {counted.evaluations:8d} avaliações  {cached_time:6.2f}s  "
+          f"({direct.evaluations / counted.evaluations:5.1f}x menos avaliações)  {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Passo de agendamentos de manage_energy: lista de DeviceSchedule versus ScheduleIndex."""
+import random
+import time
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.ScheduleIndex import ScheduleIndex
+
+START = datetime(2025, 1, 1, 0, 0)
+TICKS = 2_000
+PRIORITIES = {"Security": 1, "Refrigerator": 1, "Lights": 2, "Oven": 3}
+
+
+def _run(system, schedules):
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        now = START + timedelta(seconds=30 * tick)
+        system.manage_energy(0.2, 0.5, PRIORITIES, now, 21.0, (19.0, 23.0), 100.0, 0.0, schedules)
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    system = SmartEnergyManagementSystem()
+    for count in (10, 100, 1_000, 10_000):
+        rng = random.Random(count)
+        schedules = [DeviceSchedule(f"D{i}", START + timedelta(seconds=30 * rng.randrange(2 * TICKS)))
+                     for i in range(count)]
+        index = ScheduleIndex()
+        for schedule in schedules:
+            index.add(schedule)
+        scanned = _run(system, schedules)
+        indexed = _run(system, index)
+        print(f"agendamentos={count:<6} lista {scanned * 1e6:8.1f} us/chamada  "
+              f"ScheduleIndex {indexed * 1e6:6.1f} us/chamada  ({scanned / indexed:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Teste de estresse do SeatInventory: muitas threads disputando poucos voos."""
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.SeatInventory import SeatInventory
+
+FLIGHTS = 8
+CAPACITY = 20_000
+ATTEMPTS = 200_000
+
+
+def _run(threads):
+    inventory = SeatInventory()
+    for flight in range(FLIGHTS):
+        inventory.add_flight(f"F{flight}", CAPACITY)
+    system = FlightBookingSystem(inventory)
+    confirmed = [0] * threads
+    now = datetime(2025, 1, 1)
+    departure = now + timedelta(hours=72)
+
+    def worker(index):
+        rng = random.Random(index)
+        for _ in range(ATTEMPTS // threads):
+            passengers = rng.randint(1, 3)
+            # Metade das tentativas vai para o mesmo voo, para forçar disputa
+            flight = "F0" if rng.random() < 0.5 else f"F{rng.randrange(FLIGHTS)}"
+            if system.book(flight, passengers, now, 500.0, 10, departure, 0).confirmation:
+                confirmed[index] += passengers
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    sold = sum(CAPACITY - inventory.available(f"F{flight}") for flight in range(FLIGHTS))
+    assert sold == sum(confirmed), "assentos vendidos e reservas confirmadas divergem"
+    assert all(0 <= inventory.available(f"F{flight}") <= CAPACITY for flight in range(FLIGHTS))
+    return ATTEMPTS / elapsed, inventory.available("F0")
+
+
+def main():
+    for threads in (1, 2, 4, 8, 16, 32):
+        rate, left = _run(threads)
+        print(f"threads={threads:<3} {rate:10.0f} reservas/s  assentos restantes no voo disputado={left}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Vazão do ShardedFraudExecutor conforme o número de shards (processos)."""
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from src.fraud.ShardedFraudExecutor import ShardedFraudExecutor
+from src.fraud.Transaction import Transaction
+
+ACCOUNTS = 50_000
+BATCH_SIZE = 20_000
+BATCHES = 20
+
+
+def _batches():
+    rng = random.Random(0)
+    clock = datetime(2025, 1, 1)
+    for _ in range(BATCHES):
+        batch = []
+        for _ in range(BATCH_SIZE):
+            clock += timedelta(milliseconds=rng.randint(0, 50))
+            batch.append((f"acc{rng.randrange(ACCOUNTS)}",
+                          Transaction(rng.choice([100.0, 20000.0]), clock, rng.choice(["BR", "US", "AR"]))))
+        yield batch
+
+
+def main():
+    batches = list(_batches())
+    total = BATCH_SIZE * BATCHES
+    cores = os.cpu_count() or 1
+    shard_counts = sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)) | {1, 2})
+    baseline = None
+    for shards in shard_counts:
+        with ShardedFraudExecutor(shards, ["AR"]) as executor:
+            start = time.perf_counter()
+            for batch in batches:
+                executor.check_batch(batch)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"shards={shards:<3} {total / elapsed:10.0f} transações/s  speedup={baseline / elapsed:5.2f}x")
+    print(f"({cores} núcleos disponíveis)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compara a memória de um histórico de transações em três representações."""
+import tracemalloc
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.TransactionBatch import TransactionBatch
+
+SIZE = 200_000
+LOCATIONS = ["BR", "US", "AR", "CL", "MX"]
+
+
+class DictTransaction:
+    """Transaction como era antes de __slots__, com __dict__ por instância."""
+
+    def __init__(self, amount, timestamp, location):
+        self.amount = amount
+        self.timestamp = timestamp
+        self.location = location
+
+
+def _rows():
+    start = datetime(2025, 1, 1)
+    for i in range(SIZE):
+        yield float(i % 20000), start + timedelta(seconds=i), LOCATIONS[i % len(LOCATIONS)]
+
+
+def _measure(build):
+    tracemalloc.start()
+    history = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(history)
+
+
+def main():
+    results = {
+        "dict Transaction": _measure(lambda: [DictTransaction(*row) for row in _rows()]),
+        "slotted Transaction": _measure(lambda: [Transaction(*row) for row in _rows()]),
+        "TransactionBatch": _measure(lambda: TransactionBatch(Transaction(*row) for row in _rows())),
+    }
+    baseline = results["dict Transaction"]
+    for name, per_item in results.items():
+        print(f"{name:<22} {per_item:8.1f} bytes/transaction  ({baseline / per_item:4.1f}x menor)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import argparse
+import sys
+from src.fraud.FraudStreamPipeline import FraudStreamPipeline
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run fraud checks over a JSONL transaction feed.")
+    parser.add_argument("input", nargs="?", default="-", help="JSONL input file ('-' for stdin).")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file ('-' for stdout).")
+    parser.add_argument("-b", "--blacklist", default="", help="Comma-separated blacklisted locations.")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Records read and evaluated per chunk.")
+    parser.add_argument("--workers", type=int, default=1, help="Processes to shard accounts across.")
+    args = parser.parse_args()
+
+    blacklist = [location for location in args.blacklist.split(",") if location]
+    pipeline = FraudStreamPipeline(blacklist, chunk_size=args.chunk_size, workers=args.workers)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    with source, sink:
+        pipeline.run(source, sink)
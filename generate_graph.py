@@ -1,13 +1,273 @@
 from staticfg import CFGBuilder
+from concurrent.futures import ProcessPoolExecutor
+import graphviz
 import argparse
+import ast
+import hashlib
+import json
+import os
+import textwrap
+
+
+def build_file_cfg(script, name, output_dir, image_format):
+    """Builds and renders the CFG of one file; returns the image path."""
+    path = os.path.join(output_dir, name)
+    CFGBuilder().build_from_file(os.path.basename(name), script).build_visual(path, image_format, show=False)
+    return f"{path}.{image_format}"
+
+
+def _build_job(job):
+    # Runs in a pool worker: errors are returned so one bad file does not stop the others
+    script, name, output_dir, image_format = job
+    try:
+        return script, build_file_cfg(script, name, output_dir, image_format), None
+    except Exception as error:
+        return script, None, f"{type(error).__name__}: {error}"
+
+
+def source_files(directory):
+    """All .py files under `directory`, skipping hidden and __pycache__ directories, in a stable order."""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+        found.extend(os.path.join(root, file) for file in sorted(files) if file.endswith(".py"))
+    return found
+
+
+def image_name(directory, script):
+    """
+    Output path of `script` relative to the output directory: its relative path without the extension.
+
+    Keeping the directories (instead of joining them with "_") means two files can never
+    share an output, e.g. `a/b_c.py` and `a_b/c.py`.
+    """
+    return os.path.splitext(os.path.relpath(script, directory))[0]
+
+
+def file_hash(script, image_format):
+    digest = hashlib.sha256(image_format.encode())
+    with open(script, "rb") as file:
+        digest.update(file.read())
+    return digest.hexdigest()
+
+
+def load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_package(directory, output_dir, image_format="png", workers=None, cache_path=None):
+    """
+    Builds the CFG of every .py file under `directory`, rebuilding only files whose contents changed.
+
+    The cache maps each source file to the sha256 of its contents and the image built from it
+    (or the error staticfg/Graphviz raised for it); files whose hash matches, and whose image
+    still exists, are skipped, so a run over an unchanged tree starts no workers. Changed
+    files are built in a process pool. Returns the index written to `output_dir/index.json`.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = cache_path or os.path.join(output_dir, "cache.json")
+    cache = load_cache(cache_path)
+
+    index = {}
+    jobs = []
+    hashes = {}
+    for script in source_files(directory):
+        key = os.path.relpath(script, directory)
+        hashes[key] = file_hash(script, image_format)
+        name = image_name(directory, script)
+        image = f"{os.path.join(output_dir, name)}.{image_format}"
+        entry = cache.get(key)
+        if entry and entry["hash"] == hashes[key] and ("error" in entry or
+                                                       entry["image"] == image and os.path.exists(image)):
+            index[key] = entry
+        else:
+            jobs.append((script, name, output_dir, image_format))
+
+    built = []
+    if jobs:
+        with ProcessPoolExecutor(workers) as pool:
+            for script, image, error in pool.map(_build_job, jobs):
+                key = os.path.relpath(script, directory)
+                if error is None:
+                    index[key] = {"hash": hashes[key], "image": image}
+                    built.append(key)
+                else:
+                    index[key] = {"hash": hashes[key], "error": error}
+
+    with open(cache_path, "w", encoding="utf-8") as file:
+        json.dump(index, file, indent=2, sort_keys=True)
+    report = {
+        "directory": directory,
+        "built": built,
+        "images": {key: index[key]["image"] for key in sorted(index) if "image" in index[key]},
+        "errors": {key: index[key]["error"] for key in sorted(index) if "error" in index[key]},
+    }
+    with open(os.path.join(output_dir, "index.json"), "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    return report
+
+
+def function_sources(script):
+    """(qualname, line, source) of every function and method in `script`, nested classes included."""
+    with open(script, encoding="utf-8") as file:
+        text = file.read()
+    found = []
+
+    def visit(body, prefix):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                source = textwrap.dedent(ast.get_source_segment(text, node, padded=True))
+                found.append((prefix + node.name, node.lineno, source))
+            elif isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+
+    visit(ast.parse(text, script).body, "")
+    return found
+
+
+def function_metrics(cfg):
+    """
+    Structural metrics of a function CFG: blocks (nodes), links (edges), cyclomatic complexity and branches.
+
+    staticfg leaves each return/raise as its own block without exits; for the complexity these
+    terminal blocks are joined to one virtual exit, as E - N + 2 assumes a single exit.
+    """
+    blocks = []
+    seen = set()
+    pending = [cfg.entryblock]
+    while pending:
+        block = pending.pop()
+        if block.id in seen:
+            continue
+        seen.add(block.id)
+        blocks.append(block)
+        pending.extend(link.target for link in reversed(block.exits))
+    edges = sum(len(block.exits) for block in blocks)
+    terminals = sum(1 for block in blocks if not block.exits)
+    branches = [
+        {"source": block.id, "target": link.target.id, "line": block.statements[-1].lineno,
+         "condition": link.get_exitcase().strip()}
+        for block in blocks for link in block.exits if link.exitcase is not None
+    ]
+    return {
+        "nodes": len(blocks),
+        "edges": edges,
+        "cyclomatic_complexity": (edges + terminals) - (len(blocks) + 1) + 2,
+        "branches": branches,
+    }
+
+
+def build_function_cfg(name, source):
+    """CFG of one function's (dedented) source; returns its metrics and its DOT source."""
+    cfg = CFGBuilder().build_from_src(name, source).functioncfgs[name.rsplit(".", 1)[-1]]
+    # staticfg's only public export, build_visual, always runs Graphviz on the graph; the DOT
+    # text comes from its private _build_visual, so staticfg stays pinned to 0.9.5 in
+    # requirements.txt and pyproject.toml and this call must be checked when upgrading it
+    return function_metrics(cfg), cfg._build_visual("dot").source
+
+
+def build_functions(directory, output_dir, scripts=None, names=None, render=None, cache_path=None):
+    """
+    Builds one CFG per function under `directory` and exports its metrics (JSON) and graph (DOT).
+
+    The cache maps `<file>::<qualname>` to the sha256 of the function's source, so only functions
+    whose source changed are rebuilt. `names` limits the run to the given names or qualnames and
+    `scripts` to the given files; cached functions outside the run are kept.
+    With `render` (an image format), each DOT is rendered by Graphviz only when its image is
+    missing or older than the DOT. Returns the metrics written to `output_dir/functions.json`.
+    """
+    functions_dir = os.path.join(output_dir, "functions")
+    os.makedirs(functions_dir, exist_ok=True)
+    cache_path = cache_path or os.path.join(output_dir, "functions_cache.json")
+    cache = load_cache(cache_path)
+
+    # A run limited by `names` keeps the other cached functions and a run over some `scripts`
+    # keeps the other files' ones; otherwise functions (and files) that no longer exist are dropped
+    files = {os.path.relpath(script, directory) for script in scripts or ()}
+    cached = {key: entry for key, entry in cache.items()
+              if names or scripts and key.split("::", 1)[0] not in files}
+    index = {}
+    built = []
+    for script in scripts or source_files(directory):
+        prefix = image_name(directory, script)
+        for qualname, line, source in function_sources(script):
+            if names and qualname not in names and qualname.rsplit(".", 1)[-1] not in names:
+                continue
+            key = f"{os.path.relpath(script, directory)}::{qualname}"
+            digest = hashlib.sha256(source.encode()).hexdigest()
+            dot_path = os.path.join(functions_dir, prefix, f"{qualname}.dot")
+            entry = cache.get(key)
+            if not (entry and entry["hash"] == digest and ("error" in entry or os.path.exists(dot_path))):
+                try:
+                    metrics, dot = build_function_cfg(qualname, source)
+                except Exception as error:
+                    entry = {"hash": digest, "error": f"{type(error).__name__}: {error}"}
+                else:
+                    os.makedirs(os.path.dirname(dot_path), exist_ok=True)
+                    with open(dot_path, "w", encoding="utf-8") as file:
+                        file.write(dot)
+                    entry = {"hash": digest, "dot": dot_path, **metrics}
+                    built.append(key)
+            # Branch lines in the cache are relative to the function, so moving it keeps the entry valid
+            cache_entry = entry
+            entry = dict(entry, line=line)
+            if "branches" in entry:
+                entry["branches"] = [dict(branch, line=branch["line"] + line - 1) for branch in entry["branches"]]
+            if render and "dot" in entry:
+                image = f"{os.path.splitext(dot_path)[0]}.{render}"
+                if not os.path.exists(image) or os.path.getmtime(image) < os.path.getmtime(dot_path):
+                    graphviz.render("dot", render, dot_path, outfile=image)
+                entry["image"] = image
+            cached[key] = cache_entry
+            index[key] = entry
+
+    with open(cache_path, "w", encoding="utf-8") as file:
+        json.dump(cached, file, indent=2, sort_keys=True)
+    report = {"directory": directory, "built": built, "functions": index}
+    with open(os.path.join(output_dir, "functions.json"), "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    return report
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate a control flow graph (CFG) from a Python script.")
     parser.add_argument("-s", "--script", help="Path to the Python script file.")
     parser.add_argument("-n", "--name", help="Name for the output CFG image file.", default="cfg_output")
+    parser.add_argument("-d", "--directory", help="Build CFGs for every .py file under this directory.")
+    parser.add_argument("-o", "--output", help="Output directory for package mode.", default="cfg")
+    parser.add_argument("-f", "--format", help="Image format for package mode.", default="png")
+    parser.add_argument("-w", "--workers", type=int, help="Worker processes for package mode.")
+    parser.add_argument("--cache", help="Cache file for package mode (defaults to <output>/cache.json).")
+    parser.add_argument("--functions", action="store_true",
+                        help="Build one CFG per function, exporting metrics (JSON) and graphs (DOT).")
+    parser.add_argument("--function", action="append", dest="names",
+                        help="Only this function or method (name or Class.method); repeatable.")
+    parser.add_argument("--render", metavar="FORMAT", help="Also render each function DOT to this image format.")
     args = parser.parse_args()
 
-    cfg = CFGBuilder().build_from_file(args.name, args.script)
+    if args.functions:
+        directory = args.directory or os.path.dirname(args.script) or "."
+        scripts = None if args.directory else [args.script]
+        report = build_functions(directory, args.output, scripts, args.names, args.render, args.cache)
+        for key, entry in report["functions"].items():
+            if "error" in entry:
+                print(f"{key}: {entry['error']}")
+            else:
+                print(f"{key}: nodes={entry['nodes']} edges={entry['edges']} "
+                      f"complexity={entry['cyclomatic_complexity']} branches={len(entry['branches'])}")
+        print(f"{len(report['functions'])} functions, {len(report['built'])} rebuilt; "
+              f"metrics at {os.path.join(args.output, 'functions.json')}")
+    elif args.directory:
+        report = build_package(args.directory, args.output, args.format, args.workers, args.cache)
+        print(f"{len(report['images'])} images, {len(report['built'])} rebuilt, {len(report['errors'])} errors; "
+              f"index at {os.path.join(args.output, 'index.json')}")
+        for script, error in report["errors"].items():
+            print(f"  {script}: {error}")
+    else:
+        cfg = CFGBuilder().build_from_file(args.name, args.script)
 
-    cfg.build_visual(f"cfg/{args.name}", "png")
+        cfg.build_visual(f"cfg/{args.name}", "png")
@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta, timezone
+import numpy as np
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_microseconds(timestamp: datetime) -> int:
+    """Converte um datetime em microssegundos desde a época; horários com fuso são levados a UTC."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def from_epoch_microseconds(value: int) -> datetime:
+    """Inverso de to_epoch_microseconds; devolve um datetime ingênuo em UTC."""
+    return EPOCH + timedelta(microseconds=value)
+
+
+def as_epoch_microseconds(timestamps) -> np.ndarray:
+    """Array int64 de microssegundos desde a época a partir de inteiros, datetime64 ou datetimes (com ou sem fuso)."""
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        return timestamps.astype("datetime64[us]").astype(np.int64)
+    if timestamps.dtype == object and timestamps.size and isinstance(timestamps.flat[0], datetime):
+        return np.fromiter(map(to_epoch_microseconds, timestamps.ravel()), np.int64, timestamps.size).reshape(
+            timestamps.shape
+        )
+    return timestamps.astype(np.int64)
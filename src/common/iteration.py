@@ -0,0 +1,9 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Divide um iterável em listas de até `size` elementos, sem materializá-lo."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
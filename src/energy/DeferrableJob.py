@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+
+class DeferrableJob:
+    """
+    Uma carga adiável: roda `duration` seguidos, consome `energy` no total e termina até `deadline`.
+
+    `priority` segue a convenção das prioridades de dispositivos: 1 é essencial
+    e números maiores são menos importantes.
+    """
+
+    __slots__ = ("device_name", "duration", "energy", "deadline", "priority", "earliest_start")
+
+    def __init__(
+        self,
+        device_name: str,
+        duration: timedelta,
+        energy: float,
+        deadline: datetime,
+        priority: int = 1,
+        earliest_start: datetime | None = None,
+    ):
+        if duration <= timedelta(0):
+            raise ValueError("duration deve ser positiva")
+        if energy < 0:
+            raise ValueError("energy não pode ser negativa")
+        self.device_name = device_name
+        self.duration = duration
+        self.energy = energy
+        self.deadline = deadline
+        self.priority = priority
+        self.earliest_start = earliest_start
+
+    def __repr__(self) -> str:
+        return (f"DeferrableJob(device_name='{self.device_name}', duration={self.duration}, "
+                f"energy={self.energy}, deadline='{self.deadline}', priority={self.priority})")
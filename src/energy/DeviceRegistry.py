@@ -0,0 +1,63 @@
+from collections.abc import Iterable, Iterator, Mapping
+from src.energy.night import NIGHT_EXEMPT
+
+
+class DeviceRegistry(Mapping):
+    """
+    Catálogo de dispositivos de uma casa, com um bit por dispositivo.
+
+    Funciona como o dict de prioridades (nome -> prioridade, na ordem de
+    cadastro) e pré-calcula as máscaras usadas por manage_energy: instalados,
+    prioridade > 1 e isentos do modo noturno. Os bits seguem a ordem do
+    dict, então percorrer uma máscara do bit menos significativo para o mais
+    significativo é percorrer os dispositivos na ordem original. Heating,
+    Cooling e os dispositivos só agendados informados em `scheduled_devices`
+    recebem bits próprios sem contar como instalados.
+
+    O registro não muda depois de criado, então pode ser compartilhado entre
+    chamadas e threads; um agendamento de um nome desconhecido é resolvido
+    por manage_energy fora do registro.
+    """
+
+    def __init__(self, device_priorities: dict[str, int], scheduled_devices: Iterable[str] = ()):
+        self.names: list[str] = []
+        self.bits: dict[str, int] = {}
+        self._priorities = dict(device_priorities)
+        self.installed_mask = 0
+        self.high_priority_mask = 0
+        self.night_exempt_mask = 0
+        for device, priority in self._priorities.items():
+            bit = self._add(device)
+            self.installed_mask |= bit
+            if priority > 1:
+                self.high_priority_mask |= bit
+        self.heating_bit = self._add("Heating")
+        self.cooling_bit = self._add("Cooling")
+        for device in scheduled_devices:
+            self._add(device)
+
+    def bit_of(self, device: str) -> int:
+        """Máscara de um único bit do dispositivo, ou 0 se ele não está no registro."""
+        return self.bits.get(device, 0)
+
+    def _add(self, device: str) -> int:
+        bit = self.bits.get(device)
+        if bit is None:
+            bit = 1 << len(self.names)
+            self.names.append(device)
+            self.bits[device] = bit
+            if device in NIGHT_EXEMPT:
+                self.night_exempt_mask |= bit
+        return bit
+
+    def __getitem__(self, device: str) -> int:
+        return self._priorities[device]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._priorities)
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+    def __repr__(self) -> str:
+        return f"DeviceRegistry({self._priorities})"
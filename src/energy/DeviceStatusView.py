@@ -0,0 +1,48 @@
+from collections.abc import Iterator, Mapping
+from src.energy.DeviceRegistry import DeviceRegistry
+
+
+class DeviceStatusView(Mapping):
+    """
+    device_status somente leitura sobre duas máscaras de bits de um DeviceRegistry.
+
+    `present` marca as chaves que existem e `status` os dispositivos ligados;
+    dispositivos fora do registro (agendamentos de nomes desconhecidos) ficam
+    em `extra` e aparecem depois dos demais. Compara igual a um dict com o mesmo conteúdo, então quem lia o dict de
+    manage_energy continua funcionando; dict(view) dá uma cópia alterável.
+    """
+
+    __slots__ = ("registry", "status", "present", "extra")
+
+    def __init__(self, registry: DeviceRegistry, status: int, present: int, extra: dict[str, bool] | None = None):
+        self.registry = registry
+        self.status = status
+        self.present = present
+        self.extra = extra
+
+    def __getitem__(self, device: str) -> bool:
+        bit = self.registry.bits.get(device, 0)
+        if not self.present & bit:
+            if self.extra is not None and device in self.extra:
+                return self.extra[device]
+            raise KeyError(device)
+        return bool(self.status & bit)
+
+    def __contains__(self, device: object) -> bool:
+        return bool(self.present & self.registry.bits.get(device, 0)) or bool(self.extra and device in self.extra)
+
+    def __iter__(self) -> Iterator[str]:
+        names = self.registry.names
+        present = self.present
+        while present:
+            low = present & -present
+            yield names[low.bit_length() - 1]
+            present ^= low
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return self.present.bit_count() + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -1,21 +1,31 @@
 from datetime import datetime
+from src.energy.DeviceRegistry import DeviceRegistry
 from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.DeviceStatusView import DeviceStatusView
 from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.energy.ScheduleIndex import ScheduleIndex
+from src.energy.night import NIGHT_EXEMPT, is_night_hour
 
 class SmartEnergyManagementSystem:
     def manage_energy(
         self,
         current_price: float,
         price_threshold: float,
-        device_priorities: dict[str, int],
+        device_priorities: dict[str, int] | DeviceRegistry,
         current_time: datetime,
         current_temperature: float,
         desired_temperature_range: tuple[float, float],
         energy_usage_limit: float,
         total_energy_used_today: float,
-        scheduled_devices: list[DeviceSchedule],
+        scheduled_devices: list[DeviceSchedule] | ScheduleIndex,
     ) -> EnergyManagementResult:
 
+        if isinstance(device_priorities, DeviceRegistry):
+            return self._manage_with_registry(
+                current_price, price_threshold, device_priorities, current_time, current_temperature,
+                desired_temperature_range, energy_usage_limit, total_energy_used_today, scheduled_devices,
+            )
+
         device_status: dict[str, bool] = {}
         energy_saving_mode = False
         temperature_regulation_active = False
@@ -34,9 +44,9 @@ class SmartEnergyManagementSystem:
                 device_status[device] = True
 
         # 2. Modo noturno entre 23h e 6h
-        if current_time.hour >= 23 or current_time.hour < 6:
+        if is_night_hour(current_time.hour):
             for device in device_priorities:
-                if device not in ("Security", "Refrigerator"):
+                if device not in NIGHT_EXEMPT:
                     device_status[device] = False
 
         # 3. Regulação de temperatura
@@ -51,26 +61,91 @@ class SmartEnergyManagementSystem:
             device_status["Cooling"] = False
 
 
-        devices_were_on = True
-        while total_energy_used_today >= energy_usage_limit and devices_were_on:
-            devices_to_turn_off = [
-                device for device, priority in device_priorities.items()
-                if device_status.get(device, False) and priority > 1
-            ]
-            
-            if not devices_to_turn_off:
-                devices_were_on = False
-                continue
-
-            for device in devices_to_turn_off:
-                 if total_energy_used_today < energy_usage_limit:
-                     break
-                 device_status[device] = False
-                 total_energy_used_today -= 1
+        # 4. Desliga dispositivos de prioridade > 1, na ordem do dicionário, até o consumo ficar abaixo do limite
+        if total_energy_used_today >= energy_usage_limit:
+            for device, priority in device_priorities.items():
+                if total_energy_used_today < energy_usage_limit:
+                    break
+                if priority > 1 and device_status[device]:
+                    device_status[device] = False
+                    total_energy_used_today -= 1
 
         # 5. Lida com dispositivos agendados
-        for schedule in scheduled_devices:
-            if schedule.scheduled_time == current_time:
-                device_status[schedule.device_name] = True
+        if isinstance(scheduled_devices, ScheduleIndex):
+            for device in scheduled_devices.due(current_time):
+                device_status[device] = True
+        else:
+            for schedule in scheduled_devices:
+                if schedule.scheduled_time == current_time:
+                    device_status[schedule.device_name] = True
+
+        return EnergyManagementResult(device_status, energy_saving_mode, temperature_regulation_active, total_energy_used_today)
+
+    def _manage_with_registry(
+        self,
+        current_price: float,
+        price_threshold: float,
+        registry: DeviceRegistry,
+        current_time: datetime,
+        current_temperature: float,
+        desired_temperature_range: tuple[float, float],
+        energy_usage_limit: float,
+        total_energy_used_today: float,
+        scheduled_devices: list[DeviceSchedule] | ScheduleIndex,
+    ) -> EnergyManagementResult:
+        """Mesmas regras de manage_energy, com device_status em máscaras de bits do registro."""
+        status = registry.installed_mask
+        present = registry.installed_mask
+
+        # 1 e 2. Modo de economia e modo noturno
+        energy_saving_mode = current_price > price_threshold
+        if energy_saving_mode:
+            status &= ~registry.high_priority_mask
+        if is_night_hour(current_time.hour):
+            status &= registry.night_exempt_mask
+
+        # 3. Regulação de temperatura
+        temperature_regulation_active = True
+        if current_temperature < desired_temperature_range[0]:
+            status |= registry.heating_bit
+            present |= registry.heating_bit
+        elif current_temperature > desired_temperature_range[1]:
+            status |= registry.cooling_bit
+            present |= registry.cooling_bit
+        else:
+            temperature_regulation_active = False
+            status &= ~(registry.heating_bit | registry.cooling_bit)
+            present |= registry.heating_bit | registry.cooling_bit
+
+        # 4. Corte por consumo: o bit menos significativo é o primeiro dispositivo do dict
+        if total_energy_used_today >= energy_usage_limit:
+            candidates = status & registry.high_priority_mask
+            while candidates and total_energy_used_today >= energy_usage_limit:
+                lowest = candidates & -candidates
+                status ^= lowest
+                candidates ^= lowest
+                total_energy_used_today -= 1
+
+        # 5. Dispositivos agendados
+        if isinstance(scheduled_devices, ScheduleIndex):
+            due_devices = scheduled_devices.due(current_time)
+        else:
+            due_devices = [schedule.device_name for schedule in scheduled_devices
+                           if schedule.scheduled_time == current_time]
+        # Nomes fora do registro vão para um dict local: o registro é compartilhado e não muda
+        extra = None
+        for device in due_devices:
+            bit = registry.bit_of(device)
+            if bit:
+                status |= bit
+                present |= bit
+            else:
+                extra = extra or {}
+                extra[device] = True
 
-        return EnergyManagementResult(device_status, energy_saving_mode, temperature_regulation_active, total_energy_used_today)
\ No newline at end of file
+        return EnergyManagementResult(
+            DeviceStatusView(registry, status, present, extra),
+            energy_saving_mode,
+            temperature_regulation_active,
+            total_energy_used_today,
+        )
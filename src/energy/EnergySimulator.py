@@ -0,0 +1,227 @@
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+import numpy as np
+from src.common.epoch import MICROSECOND, to_epoch_microseconds
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.FleetEnergyManagementSystem import FleetEnergyManagementSystem
+from src.energy.SimulationResult import SimulationResult
+from src.energy.night import is_night_hour
+
+# Bits do regime de um passo: tudo o que manage_energy decide antes do corte por consumo
+_SAVING = 1
+_NIGHT = 2
+_COLD = 4
+_HOT = 8
+_REGIMES = 16
+
+_DAY_US = 24 * 3600 * 10**6
+_HOUR_US = 3600 * 10**6
+
+Series = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class EnergySimulator:
+    """
+    Reproduz séries temporais de preço, temperatura e consumo por manage_energy, para uma casa.
+
+    O passo `i` usa o horário `start_time + i * step` e as posições `i` das
+    séries. Fora do corte por consumo e dos agendamentos, o resultado de
+    um passo só depende do regime (economia, noite, frio, calor), então os
+    16 regimes possíveis são avaliados uma vez e os passos comuns viram uma
+    consulta de tabela; só os passos acima do limite de consumo ou com
+    agendamento passam por FleetEnergyManagementSystem.evaluate, todos de
+    uma vez. As séries são lidas em blocos de `chunk_size` passos e a saída
+    é um SimulationResult com uma linha de bits por passo.
+
+    Os agendamentos disparam quando o horário do passo é exatamente o
+    `scheduled_time`, como em manage_energy. Com um `start_time` com fuso,
+    a hora do modo noturno é a do relógio local desse fuso (como
+    `current_time.hour` em manage_energy) e os agendamentos são comparados
+    pelo instante; horários sem fuso são tratados como UTC.
+    """
+
+    def __init__(
+        self,
+        device_priorities: dict[str, int],
+        price_threshold: float,
+        desired_temperature_range: tuple[float, float],
+        energy_usage_limit: float,
+        scheduled_devices: list[DeviceSchedule] = (),
+        chunk_size: int = 65536,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size deve ser pelo menos 1")
+        self.price_threshold = price_threshold
+        self.desired_temperature_range = desired_temperature_range
+        self.energy_usage_limit = energy_usage_limit
+        self.scheduled_devices = list(scheduled_devices)
+        self.chunk_size = chunk_size
+
+        names = list(device_priorities)
+        names += [name for name in dict.fromkeys(s.device_name for s in self.scheduled_devices) if name not in names]
+        self.fleet = FleetEnergyManagementSystem(names)
+        self.device_names = self.fleet.device_names
+        priorities, installed = self.fleet.priority_matrix([device_priorities])
+        self._high_priority = priorities[0] > 1
+        self._installed = installed[0]
+        self._regime_status, self._regime_present = self._regime_table()
+
+    def run(
+        self,
+        start_time: datetime,
+        prices: Iterable[float] | np.ndarray,
+        temperatures: Iterable[float] | np.ndarray,
+        energy_used: Iterable[float] | np.ndarray,
+        step: timedelta = timedelta(minutes=1),
+    ) -> SimulationResult:
+        """Simula séries em memória (arrays, inclusive memory-mapped)."""
+        return self.run_chunks(start_time, _slices(self.chunk_size, prices, temperatures, energy_used), step)
+
+    def run_csv(self, path: str, start_time: datetime, step: timedelta = timedelta(minutes=1)) -> SimulationResult:
+        """Simula um CSV com cabeçalho e colunas `price`, `temperature` e `energy_used`, lido em blocos."""
+        return self.run_chunks(start_time, _csv_chunks(path, self.chunk_size), step)
+
+    def run_npy(
+        self,
+        start_time: datetime,
+        prices_path: str,
+        temperatures_path: str,
+        energy_used_path: str,
+        step: timedelta = timedelta(minutes=1),
+    ) -> SimulationResult:
+        """Simula arquivos .npy abertos com memory map, sem carregar as séries inteiras."""
+        series = [np.load(path, mmap_mode="r") for path in (prices_path, temperatures_path, energy_used_path)]
+        return self.run(start_time, *series, step=step)
+
+    def run_chunks(self, start_time: datetime, chunks: Iterable[Series], step: timedelta) -> SimulationResult:
+        if step <= timedelta(0):
+            raise ValueError("step deve ser positivo")
+        start_us = to_epoch_microseconds(start_time)
+        step_us = step // MICROSECOND
+        due_steps = self._due_steps(start_us, step_us)
+        # As horas do modo noturno seguem o relógio local de start_time
+        clock_us = start_us + (start_time.utcoffset() or timedelta(0)) // MICROSECOND
+
+        outputs = []
+        offset = 0
+        for prices, temperatures, energy_used in chunks:
+            outputs.append(self._simulate_chunk(
+                offset, clock_us, step_us, due_steps,
+                np.asarray(prices, dtype=np.float64),
+                np.asarray(temperatures, dtype=np.float64),
+                np.asarray(energy_used, dtype=np.float64),
+            ))
+            offset += len(outputs[-1][0])
+
+        width = (len(self.device_names) + 7) // 8
+        if outputs:
+            status, present, saving, regulating, totals = (np.concatenate(column) for column in zip(*outputs))
+        else:
+            status = present = np.zeros((0, width), dtype=np.uint8)
+            saving = regulating = np.zeros(0, dtype=bool)
+            totals = np.zeros(0)
+        return SimulationResult(self.device_names, start_time, step, status, present, saving, regulating, totals)
+
+    def _regime_table(self) -> tuple[np.ndarray, np.ndarray]:
+        """Status e presença compactados para cada um dos 16 regimes, sem corte por consumo."""
+        regimes = np.arange(_REGIMES)
+        devices = len(self.device_names)
+        status, present, _ = self.fleet.evaluate(
+            np.broadcast_to(self._high_priority, (_REGIMES, devices)),
+            np.broadcast_to(self._installed, (_REGIMES, devices)),
+            (regimes & _SAVING).astype(bool),
+            (regimes & _NIGHT).astype(bool),
+            (regimes & _COLD).astype(bool),
+            (regimes & _HOT).astype(bool),
+            np.inf,
+            np.full(_REGIMES, -np.inf),
+        )
+        return np.packbits(status, axis=1), np.packbits(present, axis=1)
+
+    def _due_steps(self, start_us: int, step_us: int) -> dict[int, list[int]]:
+        """Passo -> colunas agendadas, só para horários que caem exatamente num passo."""
+        due: dict[int, list[int]] = {}
+        for schedule in self.scheduled_devices:
+            offset = to_epoch_microseconds(schedule.scheduled_time) - start_us
+            if offset >= 0 and offset % step_us == 0:
+                due.setdefault(offset // step_us, []).append(self.fleet.columns[schedule.device_name])
+        return due
+
+    def _simulate_chunk(
+        self,
+        offset: int,
+        clock_us: int,
+        step_us: int,
+        due_steps: dict[int, list[int]],
+        prices: np.ndarray,
+        temperatures: np.ndarray,
+        energy_used: np.ndarray,
+    ) -> tuple[np.ndarray, ...]:
+        steps = len(prices)
+        if not len(temperatures) == len(energy_used) == steps:
+            raise ValueError("As séries de preço, temperatura e consumo têm tamanhos diferentes")
+
+        times = clock_us + (offset + np.arange(steps, dtype=np.int64)) * step_us
+        hours = times % _DAY_US // _HOUR_US
+        low, high = self.desired_temperature_range
+        saving = prices > self.price_threshold
+        cold = temperatures < low
+        hot = ~cold & (temperatures > high)
+        regimes = (np.where(saving, _SAVING, 0) | np.where(is_night_hour(hours), _NIGHT, 0)
+                   | np.where(cold, _COLD, 0) | np.where(hot, _HOT, 0))
+
+        status = self._regime_status[regimes]
+        present = self._regime_present[regimes]
+        totals = energy_used.copy()
+
+        # Passos fora do caminho rápido: acima do limite ou com agendamento
+        due = np.zeros((steps, len(self.device_names)), dtype=bool) if due_steps else None
+        if due is not None:
+            for index, columns in due_steps.items():
+                if offset <= index < offset + steps:
+                    due[index - offset, columns] = True
+            slow = (energy_used >= self.energy_usage_limit) | due.any(axis=1)
+        else:
+            slow = energy_used >= self.energy_usage_limit
+        rows = np.flatnonzero(slow)
+        if rows.size:
+            devices = len(self.device_names)
+            slow_status, slow_present, slow_totals = self.fleet.evaluate(
+                np.broadcast_to(self._high_priority, (rows.size, devices)),
+                np.broadcast_to(self._installed, (rows.size, devices)),
+                saving[rows],
+                (regimes[rows] & _NIGHT).astype(bool),
+                cold[rows],
+                hot[rows],
+                self.energy_usage_limit,
+                totals[rows],
+                None if due is None else due[rows],
+            )
+            status[rows] = np.packbits(slow_status, axis=1)
+            present[rows] = np.packbits(slow_present, axis=1)
+            totals[rows] = slow_totals
+        return status, present, saving, cold | hot, totals
+
+
+def _slices(size: int, *series) -> Iterator[Series]:
+    arrays = [np.asarray(values) if not isinstance(values, np.ndarray) else values for values in series]
+    length = len(arrays[0])
+    if any(len(array) != length for array in arrays):
+        raise ValueError("As séries de preço, temperatura e consumo têm tamanhos diferentes")
+    for start in range(0, length, size):
+        yield tuple(array[start:start + size] for array in arrays)
+
+
+def _csv_chunks(path: str, size: int) -> Iterator[Series]:
+    with open(path, encoding="utf-8") as file:
+        header = [name.strip() for name in file.readline().split(",")]
+        try:
+            columns = [header.index(name) for name in ("price", "temperature", "energy_used")]
+        except ValueError:
+            raise ValueError(f"O CSV precisa das colunas price, temperature e energy_used; tem {header}") from None
+        while True:
+            lines = [line for _, line in zip(range(size), file)]
+            if not lines:
+                return
+            table = np.loadtxt(lines, delimiter=",", dtype=np.float64, ndmin=2, usecols=columns)
+            yield table[:, 0], table[:, 1], table[:, 2]
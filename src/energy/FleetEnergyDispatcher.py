@@ -0,0 +1,251 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, Executor, ProcessPoolExecutor, wait
+from datetime import datetime
+from multiprocessing import shared_memory
+import numpy as np
+from src.energy.FleetEnergyManagementSystem import FleetEnergyManagementSystem
+from src.energy.FleetEnergyResult import FleetEnergyResult
+from src.energy.night import is_night_hour
+
+# Bits das decisões por casa, calculadas no processo principal
+_SAVING = 1
+_COLD = 2
+_HOT = 4
+
+
+class FleetEnergyDispatcher:
+    """
+    Divide uma frota de casas entre processos, com entradas e saídas em memória compartilhada.
+
+    As casas são cortadas em `workers * partitions_per_worker` partições
+    contíguas; partições menores deixam o pool redistribuir a carga e
+    limitam o que se perde quando o prazo estoura. As decisões por casa
+    (economia, frio, calor) são tomadas no processo principal e as matrizes
+    vão para um bloco de shared_memory; cada worker roda
+    FleetEnergyManagementSystem.evaluate sobre sua faixa e escreve no mesmo
+    bloco o status e a presença como bitmaps compactados (np.packbits) e os
+    totais, então nada passa serializado pelo pool além dos índices.
+
+    Com `deadline` (segundos), dispatch() espera no máximo esse tempo e
+    informa em `missed_partitions` as partições que não terminaram a tempo.
+    As que ainda estão na fila do pool são canceladas ou, se já foram
+    entregues a um worker, encontram a marca de cancelamento no bloco e
+    retornam sem avaliar nada; cada chamada tem o próprio bloco, liberado só
+    quando todas as suas partições terminaram, então nenhuma partição
+    atrasada lê memória de outra chamada.
+
+    Um `executor` de processos pode ser injetado (e continua sendo de quem o
+    criou); sem ele, o dispatcher cria um pool com `workers` processos.
+    """
+
+    def __init__(
+        self,
+        device_names: list[str],
+        workers: int | None = None,
+        partitions_per_worker: int = 4,
+        executor: Executor | None = None,
+    ):
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers deve ser pelo menos 1")
+        if partitions_per_worker < 1:
+            raise ValueError("partitions_per_worker deve ser pelo menos 1")
+        self.fleet = FleetEnergyManagementSystem(device_names)
+        self.workers = workers
+        self.partitions_per_worker = partitions_per_worker
+        self._owns_pool = executor is None
+        self._pool = executor or ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def dispatch(
+        self,
+        current_price: float | np.ndarray,
+        price_threshold: float | np.ndarray,
+        device_priorities: np.ndarray,
+        installed: np.ndarray | None,
+        current_time: datetime,
+        current_temperature: np.ndarray,
+        desired_temperature_range: tuple[np.ndarray, np.ndarray],
+        energy_usage_limit: float | np.ndarray,
+        total_energy_used_today: np.ndarray,
+        due_devices: np.ndarray | None = None,
+        deadline: float | None = None,
+    ) -> FleetEnergyResult:
+        """Mesmos argumentos de FleetEnergyManagementSystem.manage_fleet, mais o prazo opcional."""
+        started = time.perf_counter()
+        priorities = np.asarray(device_priorities)
+        homes, devices = priorities.shape
+        width = (devices + 7) // 8
+        temperature = np.broadcast_to(np.asarray(current_temperature, dtype=np.float64), (homes,))
+        saving = np.broadcast_to(np.asarray(current_price) > np.asarray(price_threshold), (homes,))
+        cold = temperature < np.asarray(desired_temperature_range[0])
+        hot = ~cold & (temperature > np.asarray(desired_temperature_range[1]))
+
+        fields = {
+            "limits": (np.float64, (homes,)),
+            "totals": (np.float64, (homes,)),
+            "decisions": (np.uint8, (homes,)),
+            "done": (np.uint8, (homes,)),
+            "cancelled": (np.uint8, (1,)),
+            "high_priority": (np.bool_, (homes, devices)),
+            "installed": (np.bool_, (homes, devices)),
+            "status": (np.uint8, (homes, width)),
+            "present": (np.uint8, (homes, width)),
+        }
+        if due_devices is not None:
+            fields["due_devices"] = (np.bool_, (homes, devices))
+        layout, size = _layout(fields)
+        memory = shared_memory.SharedMemory(create=True, size=max(1, size))
+        views = _views(memory.buf, layout)
+        futures = []
+        try:
+            views["limits"][:] = energy_usage_limit
+            views["totals"][:] = total_energy_used_today
+            views["decisions"][:] = np.where(saving, _SAVING, 0) | np.where(cold, _COLD, 0) | np.where(hot, _HOT, 0)
+            views["done"][:] = 0
+            views["cancelled"][:] = 0
+            np.greater(priorities, 1, out=views["high_priority"])
+            views["installed"][:] = True if installed is None else installed
+            if due_devices is not None:
+                views["due_devices"][:] = due_devices
+
+            night = is_night_hour(current_time.hour)
+            partitions = _partitions(homes, self.workers * self.partitions_per_worker)
+            futures = [
+                self._pool.submit(_evaluate_partition, memory.name, layout, self.fleet.device_names, start, stop, night)
+                for start, stop in partitions
+            ]
+            timeout = None if deadline is None else max(0.0, deadline - (time.perf_counter() - started))
+            done, not_done = wait(futures, timeout, return_when=FIRST_EXCEPTION)
+            if not_done:
+                # Partições já entregues a um worker não podem ser canceladas: a marca as faz retornar logo
+                views["cancelled"][0] = 1
+                for future in not_done:
+                    future.cancel()
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+
+            # Uma partição pode terminar entre o fim da espera e a leitura; vale o que está no bloco
+            finished = views["done"].astype(bool)
+            missed = [(start, stop) for start, stop in partitions if not finished[start:stop].all()]
+            for start, stop in missed:
+                finished[start:stop] = False
+            result = FleetEnergyResult(
+                self.fleet.device_names,
+                np.unpackbits(views["status"], axis=1, count=devices).astype(bool) & finished[:, None],
+                np.unpackbits(views["present"], axis=1, count=devices).astype(bool) & finished[:, None],
+                saving & finished,
+                (cold | hot) & finished,
+                np.where(finished, views["totals"], np.nan),
+                missed,
+            )
+        except BaseException:
+            views["cancelled"][0] = 1
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            # As views precisam sumir antes do close(), senão o buffer continua exportado
+            views.clear()
+            _release_when_done(memory, futures)
+        return result
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self._pool.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "FleetEnergyDispatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _partitions(homes: int, count: int) -> list[tuple[int, int]]:
+    bounds = np.linspace(0, homes, min(count, homes) + 1, dtype=np.int64)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _release_when_done(memory: shared_memory.SharedMemory, futures: list) -> None:
+    """Fecha e remove o bloco quando a última partição da chamada terminar (ou for cancelada)."""
+    pending = len(futures)
+    lock = threading.Lock()
+
+    def release(_=None) -> None:
+        nonlocal pending
+        with lock:
+            pending -= 1
+            if pending > 0:
+                return
+        memory.close()
+        memory.unlink()
+
+    if not futures:
+        pending = 1
+        release()
+        return
+    for future in futures:
+        future.add_done_callback(release)
+
+
+def _layout(fields: dict) -> tuple[dict, int]:
+    """Posição de cada array no bloco compartilhado, alinhada em 8 bytes."""
+    layout = {}
+    offset = 0
+    for name, (dtype, shape) in fields.items():
+        layout[name] = (np.dtype(dtype).str, shape, offset)
+        offset += -(-int(np.prod(shape)) * np.dtype(dtype).itemsize // 8) * 8
+    return layout, offset
+
+
+def _views(buffer, layout: dict) -> dict[str, np.ndarray]:
+    return {name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+            for name, (dtype, shape, offset) in layout.items()}
+
+
+def _evaluate_partition(
+    memory_name: str,
+    layout: dict,
+    device_names: list[str],
+    start: int,
+    stop: int,
+    night: bool,
+) -> None:
+    # Os workers compartilham o resource_tracker do processo principal, que remove o bloco com unlink()
+    memory = shared_memory.SharedMemory(name=memory_name)
+    views = _views(memory.buf, layout)
+    try:
+        # A chamada já estourou o prazo: a partição atrasada não faz nada
+        if not views["cancelled"][0]:
+            _evaluate_rows(views, device_names, start, stop, night)
+    finally:
+        views.clear()
+        try:
+            memory.close()
+        except BufferError:
+            # Depois de um erro o traceback ainda segura views; o mapeamento é liberado com ele
+            pass
+
+
+def _evaluate_rows(views: dict[str, np.ndarray], device_names: list[str], start: int, stop: int, night: bool) -> None:
+    decisions = views["decisions"][start:stop]
+    due_devices = views.get("due_devices")
+    # evaluate() atualiza os totais no lugar, direto no bloco compartilhado
+    status, present, _ = FleetEnergyManagementSystem(device_names).evaluate(
+        views["high_priority"][start:stop],
+        views["installed"][start:stop],
+        (decisions & _SAVING).astype(bool),
+        np.full(stop - start, night),
+        (decisions & _COLD).astype(bool),
+        (decisions & _HOT).astype(bool),
+        views["limits"][start:stop],
+        views["totals"][start:stop],
+        None if due_devices is None else due_devices[start:stop],
+    )
+    views["status"][start:stop] = np.packbits(status, axis=1)
+    views["present"][start:stop] = np.packbits(present, axis=1)
+    # Por último: marca a partição como completa
+    views["done"][start:stop] = 1
@@ -0,0 +1,140 @@
+from datetime import datetime
+import numpy as np
+from src.energy.FleetEnergyResult import FleetEnergyResult
+from src.energy.night import NIGHT_EXEMPT, is_night_hour
+
+
+class FleetEnergyManagementSystem:
+    """
+    manage_energy vetorizado para uma frota de casas com o mesmo catálogo de dispositivos.
+
+    As colunas seguem `device_names` (Heating e Cooling são acrescentados ao
+    final se faltarem). O dict de prioridades de cada casa deve listar seus
+    dispositivos na ordem das colunas, porque o corte por limite de consumo
+    desliga dispositivos nessa ordem; priority_matrix() verifica isso ao
+    montar as matrizes. O resultado de cada casa é idêntico ao de uma
+    chamada de manage_energy, inclusive o total ajustado em ponto flutuante.
+    """
+
+    def __init__(self, device_names: list[str]):
+        names = list(device_names)
+        if len(set(names)) != len(names):
+            raise ValueError("device_names tem nomes repetidos")
+        for name in ("Heating", "Cooling"):
+            if name not in names:
+                names.append(name)
+        self.device_names = names
+        self.columns = {name: column for column, name in enumerate(names)}
+        self.night_exempt = np.array([name in NIGHT_EXEMPT for name in names])
+
+    def priority_matrix(self, homes: list[dict[str, int]]) -> tuple[np.ndarray, np.ndarray]:
+        """Converte os dicts de prioridade das casas em (prioridades, instalados), casas × dispositivos."""
+        priorities = np.zeros((len(homes), len(self.device_names)), dtype=np.int64)
+        installed = np.zeros(priorities.shape, dtype=bool)
+        for home, device_priorities in enumerate(homes):
+            previous = -1
+            for device, priority in device_priorities.items():
+                column = self.columns.get(device)
+                if column is None:
+                    raise ValueError(f"Dispositivo fora do catálogo: '{device}'")
+                if column < previous:
+                    raise ValueError(f"A casa {home} lista '{device}' fora da ordem das colunas")
+                previous = column
+                priorities[home, column] = priority
+                installed[home, column] = True
+        return priorities, installed
+
+    def manage_fleet(
+        self,
+        current_price: float | np.ndarray,
+        price_threshold: float | np.ndarray,
+        device_priorities: np.ndarray,
+        installed: np.ndarray | None,
+        current_time: datetime,
+        current_temperature: np.ndarray,
+        desired_temperature_range: tuple[np.ndarray, np.ndarray],
+        energy_usage_limit: float | np.ndarray,
+        total_energy_used_today: np.ndarray,
+        due_devices: np.ndarray | None = None,
+    ) -> FleetEnergyResult:
+        """
+        Avalia todas as casas de uma vez.
+
+        Os argumentos seguem manage_energy: escalares valem para todas as
+        casas e arrays têm uma posição por casa. `installed` marca os
+        dispositivos de cada casa (None: todos) e `due_devices` é uma matriz
+        booleana opcional com os dispositivos agendados para `current_time`.
+        """
+        priorities = np.asarray(device_priorities)
+        homes = priorities.shape[0]
+        installed = np.ones(priorities.shape, dtype=bool) if installed is None else np.asarray(installed, dtype=bool)
+        low, high = desired_temperature_range
+        temperature = np.broadcast_to(np.asarray(current_temperature, dtype=np.float64), (homes,))
+        saving = np.broadcast_to(np.asarray(current_price) > np.asarray(price_threshold), (homes,)).copy()
+        cold = temperature < np.asarray(low)
+        hot = ~cold & (temperature > np.asarray(high))
+
+        status, present, totals = self.evaluate(
+            priorities > 1,
+            installed,
+            saving,
+            np.full(homes, is_night_hour(current_time.hour)),
+            cold,
+            hot,
+            np.asarray(energy_usage_limit, dtype=np.float64),
+            np.array(np.broadcast_to(total_energy_used_today, (homes,)), dtype=np.float64),
+            due_devices,
+        )
+        return FleetEnergyResult(self.device_names, status, present, saving, cold | hot, totals)
+
+    def evaluate(
+        self,
+        high_priority: np.ndarray,
+        installed: np.ndarray,
+        saving: np.ndarray,
+        night: np.ndarray,
+        cold: np.ndarray,
+        hot: np.ndarray,
+        energy_usage_limit: np.ndarray,
+        totals: np.ndarray,
+        due_devices: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Passos 1 a 5 de manage_energy sobre matrizes booleanas casas × dispositivos.
+
+        Recebe as decisões já tomadas por casa (modo de economia, noite, frio,
+        calor), para poder ser reaproveitado por quem as calcula de outro
+        jeito. `totals` é alterado no lugar. Devolve (status, present, totals).
+        """
+        heating = self.columns["Heating"]
+        cooling = self.columns["Cooling"]
+
+        # 1 e 2. Modo de economia e modo noturno
+        status = installed & ~(saving[:, None] & high_priority)
+        status &= ~(night[:, None] & ~self.night_exempt)
+        present = installed.copy()
+
+        # 3. Regulação de temperatura: em conforto os dois ficam desligados, mas presentes
+        status[:, heating] = np.where(hot, status[:, heating], cold)
+        status[:, cooling] = np.where(cold, status[:, cooling], hot)
+        present[:, heating] |= ~hot
+        present[:, cooling] |= ~cold
+
+        # 4. Corte por limite de consumo, coluna a coluna na ordem do dict, como no laço escalar
+        over = np.flatnonzero(totals >= energy_usage_limit)
+        if over.size:
+            limits = np.broadcast_to(energy_usage_limit, totals.shape)[over]
+            remaining = totals[over]
+            candidates = status[over] & installed[over] & high_priority[over]
+            for column in range(candidates.shape[1]):
+                shed = candidates[:, column] & (remaining >= limits)
+                if shed.any():
+                    status[over[shed], column] = False
+                    remaining[shed] -= 1
+            totals[over] = remaining
+
+        # 5. Dispositivos agendados
+        if due_devices is not None:
+            status |= due_devices
+            present |= due_devices
+        return status, present, totals
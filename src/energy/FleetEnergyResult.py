@@ -0,0 +1,54 @@
+import numpy as np
+from src.energy.EnergyManagementResult import EnergyManagementResult
+
+
+class FleetEnergyResult:
+    """
+    Resultados de manage_energy para muitas casas, armazenados por colunas.
+
+    `device_status` e `present` são matrizes casas × dispositivos: `present`
+    indica se o dispositivo aparece no device_status da casa (o dict de
+    manage_energy só tem os dispositivos da casa, Heating/Cooling e os
+    agendados). `missed_partitions` lista os intervalos [início, fim) de
+    casas que não foram avaliados dentro do prazo de um FleetEnergyDispatcher;
+    nelas as matrizes ficam falsas e o total é NaN.
+    """
+
+    def __init__(
+        self,
+        device_names: list[str],
+        device_status: np.ndarray,
+        present: np.ndarray,
+        energy_saving_mode: np.ndarray,
+        temperature_regulation_active: np.ndarray,
+        total_energy_used: np.ndarray,
+        missed_partitions: list[tuple[int, int]] = (),
+    ):
+        self.device_names = device_names
+        self.device_status = device_status
+        self.present = present
+        self.energy_saving_mode = energy_saving_mode
+        self.temperature_regulation_active = temperature_regulation_active
+        self.total_energy_used = total_energy_used
+        self.missed_partitions = list(missed_partitions)
+
+    def __len__(self) -> int:
+        return len(self.total_energy_used)
+
+    def __getitem__(self, home: int) -> EnergyManagementResult:
+        status = self.device_status[home]
+        device_status = {name: bool(status[column])
+                         for column, name in enumerate(self.device_names) if self.present[home, column]}
+        return EnergyManagementResult(
+            device_status,
+            bool(self.energy_saving_mode[home]),
+            bool(self.temperature_regulation_active[home]),
+            float(self.total_energy_used[home]),
+        )
+
+    def __repr__(self) -> str:
+        return (f"FleetEnergyResult(homes={len(self)}, devices={len(self.device_names)}, "
+                f"devices_on={int((self.device_status & self.present).sum())}, "
+                f"energy_saving_mode={int(self.energy_saving_mode.sum())}, "
+                f"temperature_regulation_active={int(self.temperature_regulation_active.sum())}, "
+                f"missed_partitions={len(self.missed_partitions)})")
@@ -0,0 +1,191 @@
+from datetime import datetime
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.energy.night import NIGHT_EXEMPT, is_night_hour
+
+# Faixas de temperatura em relação ao intervalo desejado
+_COLD = -1
+_COMFORT = 0
+_HOT = 1
+
+
+class IncrementalEnergyManager:
+    """
+    Versão com estado de manage_energy, atualizada por eventos.
+
+    Guarda as entradas da última avaliação e, a cada evento (preço, relógio,
+    temperatura, medidor ou agenda), recalcula apenas os dispositivos cuja
+    regra pode ter mudado: a virada do modo de economia afeta só os de
+    prioridade > 1, a do modo noturno os não isentos, a faixa de temperatura
+    só Heating e Cooling e a agenda só os dispositivos agendados para o
+    horário antigo ou novo. O corte por limite de consumo percorre apenas os
+    candidatos até o total ficar abaixo do limite.
+
+    Cada evento devolve a diferença de device_status: dispositivo -> novo
+    estado, ou None quando a chave deixou de existir. O estado após qualquer
+    sequência de eventos é igual ao de uma chamada completa de manage_energy
+    com as mesmas entradas.
+    """
+
+    def __init__(
+        self,
+        device_priorities: dict[str, int],
+        price_threshold: float,
+        desired_temperature_range: tuple[float, float],
+        energy_usage_limit: float,
+        current_price: float,
+        current_time: datetime,
+        current_temperature: float,
+        total_energy_used_today: float,
+        scheduled_devices: list[DeviceSchedule] = (),
+    ):
+        self.device_priorities = dict(device_priorities)
+        self.price_threshold = price_threshold
+        self.desired_temperature_range = desired_temperature_range
+        self.energy_usage_limit = energy_usage_limit
+        self.current_price = current_price
+        self.current_time = current_time
+        self.current_temperature = current_temperature
+        self.total_energy_used_today = total_energy_used_today
+
+        self._high_priority = [device for device, priority in self.device_priorities.items() if priority > 1]
+        self._saving = current_price > price_threshold
+        self._night = is_night_hour(current_time.hour)
+        self._band = self._band_of(current_temperature)
+        self._schedules: dict[datetime, list[DeviceSchedule]] = {}
+        for schedule in scheduled_devices:
+            self._schedules.setdefault(schedule.scheduled_time, []).append(schedule)
+        self._due = self._due_at(current_time)
+        self._shed: set[str] = set()
+        self._adjusted_total = total_energy_used_today
+        self._update_shedding()
+
+        self._status: dict[str, bool] = {}
+        self._apply(set(self.device_priorities) | {"Heating", "Cooling"} | self._due)
+
+    def on_price(self, current_price: float) -> dict[str, bool | None]:
+        self.current_price = current_price
+        saving = current_price > self.price_threshold
+        if saving == self._saving:
+            return {}
+        self._saving = saving
+        return self._apply(set(self._high_priority) | self._update_shedding())
+
+    def on_clock(self, current_time: datetime) -> dict[str, bool | None]:
+        dirty = set()
+        night = is_night_hour(current_time.hour)
+        if night != self._night:
+            self._night = night
+            dirty.update(device for device in self.device_priorities if device not in NIGHT_EXEMPT)
+        if current_time != self.current_time:
+            due = self._due_at(current_time)
+            dirty |= self._due | due
+            self._due = due
+        self.current_time = current_time
+        if not dirty:
+            return {}
+        return self._apply(dirty | self._update_shedding())
+
+    def on_temperature(self, current_temperature: float) -> dict[str, bool | None]:
+        self.current_temperature = current_temperature
+        band = self._band_of(current_temperature)
+        if band == self._band:
+            return {}
+        self._band = band
+        return self._apply({"Heating", "Cooling"} | self._update_shedding())
+
+    def on_meter(self, total_energy_used_today: float) -> dict[str, bool | None]:
+        self.total_energy_used_today = total_energy_used_today
+        return self._apply(self._update_shedding())
+
+    def add_schedule(self, schedule: DeviceSchedule) -> dict[str, bool | None]:
+        self._schedules.setdefault(schedule.scheduled_time, []).append(schedule)
+        if schedule.scheduled_time != self.current_time:
+            return {}
+        self._due = self._due_at(self.current_time)
+        return self._apply({schedule.device_name})
+
+    def remove_schedule(self, schedule: DeviceSchedule) -> dict[str, bool | None]:
+        """Remove um agendamento adicionado antes (comparado por identidade)."""
+        entries = self._schedules.get(schedule.scheduled_time, [])
+        for index, entry in enumerate(entries):
+            if entry is schedule:
+                del entries[index]
+                break
+        else:
+            raise ValueError(f"Agendamento desconhecido: {schedule!r}")
+        if not entries:
+            del self._schedules[schedule.scheduled_time]
+        if schedule.scheduled_time != self.current_time:
+            return {}
+        self._due = self._due_at(self.current_time)
+        return self._apply({schedule.device_name})
+
+    @property
+    def device_status(self) -> dict[str, bool]:
+        return dict(self._status)
+
+    def result(self) -> EnergyManagementResult:
+        return EnergyManagementResult(
+            dict(self._status), self._saving, self._band != _COMFORT, self._adjusted_total
+        )
+
+    def _band_of(self, temperature: float) -> int:
+        low, high = self.desired_temperature_range
+        if temperature < low:
+            return _COLD
+        if temperature > high:
+            return _HOT
+        return _COMFORT
+
+    def _due_at(self, current_time: datetime) -> set[str]:
+        return {schedule.device_name for schedule in self._schedules.get(current_time, ())}
+
+    def _base(self, device: str) -> bool | None:
+        """Estado após os passos 1 a 3 de manage_energy; None se a chave não existir."""
+        if device == "Heating" and self._band != _HOT:
+            return self._band == _COLD
+        if device == "Cooling" and self._band != _COLD:
+            return self._band == _HOT
+        priority = self.device_priorities.get(device)
+        if priority is None:
+            return None
+        if self._night and device not in NIGHT_EXEMPT:
+            return False
+        return not (self._saving and priority > 1)
+
+    def _update_shedding(self) -> set[str]:
+        """Refaz o corte por limite de consumo e devolve os dispositivos que entraram ou saíram dele."""
+        total = self.total_energy_used_today
+        limit = self.energy_usage_limit
+        shed = set()
+        if total >= limit:
+            for device in self._high_priority:
+                if total < limit:
+                    break
+                if self._base(device):
+                    shed.add(device)
+                    total -= 1
+        changed = shed ^ self._shed
+        self._shed = shed
+        self._adjusted_total = total
+        return changed
+
+    def _apply(self, dirty: set[str]) -> dict[str, bool | None]:
+        diff = {}
+        status = self._status
+        for device in dirty:
+            if device in self._due:
+                value = True
+            elif device in self._shed:
+                value = False
+            else:
+                value = self._base(device)
+            if status.get(device) == value:
+                continue
+            if value is None:
+                del status[device]
+            else:
+                status[device] = value
+            diff[device] = value
+        return diff
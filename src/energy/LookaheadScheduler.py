@@ -0,0 +1,97 @@
+import math
+from datetime import datetime, timedelta
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from src.energy.DeferrableJob import DeferrableJob
+from src.energy.DeviceSchedule import DeviceSchedule
+
+
+class LookaheadScheduler:
+    """
+    Escolhe o horário de início de cargas adiáveis a partir de uma previsão de preços.
+
+    A previsão tem um preço por intervalo de `slot` a partir de
+    `forecast_start` (tipicamente 24 a 48 h). O custo de começar uma carga
+    num intervalo é o preço médio da janela vezes a energia, e todas as
+    janelas de uma duração saem de uma soma acumulada dos preços, em O(T).
+    Sem `capacity` cada carga fica na janela mais barata entre o início
+    permitido e o prazo, o que é ótimo. Com `capacity` (energia máxima por
+    intervalo) as cargas são alocadas de forma gulosa, da prioridade mais
+    essencial (1) para a menos essencial e, no empate, do prazo mais cedo,
+    só em janelas que ainda cabem; é uma heurística e uma carga sem janela
+    viável fica sem horário.
+
+    O resultado vira DeviceSchedule com o início de cada carga, para
+    alimentar SmartEnergyManagementSystem ou um ScheduleIndex.
+    """
+
+    def __init__(
+        self,
+        forecast_start: datetime,
+        prices: list[float] | np.ndarray,
+        slot: timedelta = timedelta(minutes=15),
+        capacity: float | None = None,
+    ):
+        if slot <= timedelta(0):
+            raise ValueError("slot deve ser positivo")
+        self.forecast_start = forecast_start
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.slot = slot
+        self.capacity = capacity
+        self._prefix = np.concatenate(([0.0], np.cumsum(self.prices)))
+
+    def plan(self, jobs: list[DeferrableJob]) -> list[int | None]:
+        """Intervalo de início de cada carga, na ordem recebida; None se não couber."""
+        starts: list[int | None] = [None] * len(jobs)
+        if self.capacity is None:
+            for index, job in enumerate(jobs):
+                costs = self._window_costs(job)
+                if costs is not None:
+                    first, window = costs
+                    starts[index] = first + int(np.argmin(window))
+            return starts
+
+        load = np.zeros(len(self.prices))
+        order = sorted(range(len(jobs)), key=lambda index: (jobs[index].priority, jobs[index].deadline, index))
+        for index in order:
+            job = jobs[index]
+            costs = self._window_costs(job)
+            if costs is None:
+                continue
+            first, window = costs
+            length = self._slots(job)
+            rate = job.energy / length
+            peaks = sliding_window_view(load, length).max(axis=1)[first:first + len(window)]
+            window = np.where(peaks + rate <= self.capacity, window, np.inf)
+            best = int(np.argmin(window))
+            if window[best] == np.inf:
+                continue
+            start = first + best
+            load[start:start + length] += rate
+            starts[index] = start
+        return starts
+
+    def schedule(self, jobs: list[DeferrableJob]) -> list[DeviceSchedule]:
+        """DeviceSchedule com o início de cada carga que coube, na ordem recebida."""
+        return [DeviceSchedule(job.device_name, self.forecast_start + start * self.slot)
+                for job, start in zip(jobs, self.plan(jobs)) if start is not None]
+
+    def cost(self, job: DeferrableJob, start: int) -> float:
+        """Custo previsto de rodar a carga a partir do intervalo `start`."""
+        length = self._slots(job)
+        return job.energy / length * float(self._prefix[start + length] - self._prefix[start])
+
+    def _slots(self, job: DeferrableJob) -> int:
+        return math.ceil(job.duration / self.slot)
+
+    def _window_costs(self, job: DeferrableJob) -> tuple[int, np.ndarray] | None:
+        """(primeiro início permitido, custo de cada início permitido) ou None se não houver janela."""
+        length = self._slots(job)
+        earliest = 0
+        if job.earliest_start is not None:
+            earliest = max(0, math.ceil((job.earliest_start - self.forecast_start) / self.slot))
+        last = min((job.deadline - self.forecast_start) // self.slot, len(self.prices)) - length
+        if last < earliest:
+            return None
+        sums = self._prefix[earliest + length:last + length + 1] - self._prefix[earliest:last + 1]
+        return earliest, sums * (job.energy / length)
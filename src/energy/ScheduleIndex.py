@@ -0,0 +1,85 @@
+import bisect
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+
+
+class ScheduleIndex:
+    """
+    Agendamentos de dispositivos indexados por horário.
+
+    Agendamentos únicos ficam numa lista ordenada e a consulta usa bisect,
+    em O(log n + k). Agendamentos recorrentes (`every`) ficam num heap pela
+    próxima ocorrência e são avançados conforme o relógio passa; por isso as
+    consultas a due() devem vir com horários não decrescentes.
+
+    Um agendamento está pendente em `current_time` se cair em
+    [current_time - tolerance, current_time]. Com a tolerância padrão de
+    zero o comportamento é o da comparação exata de manage_energy; com uma
+    tolerância do tamanho do intervalo entre avaliações, um horário que cai
+    entre duas avaliações não é perdido.
+    """
+
+    def __init__(self, tolerance: timedelta = timedelta(0)):
+        if tolerance < timedelta(0):
+            raise ValueError("tolerance não pode ser negativa")
+        self.tolerance = tolerance
+        self._schedules: dict[int, tuple[DeviceSchedule, timedelta | None]] = {}
+        self._once: list[tuple[datetime, int]] = []
+        self._recurring: list[tuple[datetime, int]] = []
+        self._handles = itertools.count()
+
+    def add(self, schedule: DeviceSchedule, every: timedelta | None = None) -> int:
+        """Adiciona um agendamento, recorrente a cada `every` se informado; devolve um identificador."""
+        if every is not None and every <= timedelta(0):
+            raise ValueError("every deve ser positivo")
+        handle = next(self._handles)
+        self._schedules[handle] = (schedule, every)
+        if every is None:
+            bisect.insort(self._once, (schedule.scheduled_time, handle))
+        else:
+            heapq.heappush(self._recurring, (schedule.scheduled_time, handle))
+        return handle
+
+    def remove(self, handle: int) -> DeviceSchedule:
+        try:
+            schedule, every = self._schedules.pop(handle)
+        except KeyError:
+            raise KeyError(f"Agendamento desconhecido: {handle}") from None
+        if every is None:
+            del self._once[bisect.bisect_left(self._once, (schedule.scheduled_time, handle))]
+        else:
+            # O horário no heap pode já ter avançado; a remoção é linear, como a de um heap comum
+            self._recurring = [entry for entry in self._recurring if entry[1] != handle]
+            heapq.heapify(self._recurring)
+        return schedule
+
+    def due(self, current_time: datetime) -> list[str]:
+        """Dispositivos com agendamento pendente em `current_time`."""
+        earliest = current_time - self.tolerance
+        once = self._once
+        start = bisect.bisect_left(once, (earliest, -1))
+        end = bisect.bisect_right(once, (current_time, float("inf")))
+        devices = [self._schedules[handle][0].device_name for _, handle in once[start:end]]
+
+        recurring = self._recurring
+        popped = []
+        while recurring and recurring[0][0] <= current_time:
+            scheduled_time, handle = heapq.heappop(recurring)
+            if scheduled_time < earliest:
+                # Avança para a primeira ocorrência que ainda pode ficar pendente
+                every = self._schedules[handle][1]
+                scheduled_time += -((scheduled_time - earliest) // every) * every
+            if scheduled_time <= current_time:
+                devices.append(self._schedules[handle][0].device_name)
+            popped.append((scheduled_time, handle))
+        for entry in popped:
+            heapq.heappush(recurring, entry)
+        return devices
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    def __repr__(self) -> str:
+        return f"ScheduleIndex(schedules={len(self)}, tolerance={self.tolerance})"
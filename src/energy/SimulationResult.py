@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+import numpy as np
+from src.energy.EnergyManagementResult import EnergyManagementResult
+
+
+class SimulationResult:
+    """
+    Saída compacta de uma simulação: uma linha de bits por passo.
+
+    `status_bits` e `present_bits` guardam, com np.packbits, o estado e a
+    presença de cada dispositivo de `device_names` no passo; os demais
+    campos têm um valor por passo. O passo `i` corresponde ao horário
+    `start_time + i * step`.
+    """
+
+    def __init__(
+        self,
+        device_names: list[str],
+        start_time: datetime,
+        step: timedelta,
+        status_bits: np.ndarray,
+        present_bits: np.ndarray,
+        energy_saving_mode: np.ndarray,
+        temperature_regulation_active: np.ndarray,
+        total_energy_used: np.ndarray,
+    ):
+        self.device_names = device_names
+        self.start_time = start_time
+        self.step = step
+        self.status_bits = status_bits
+        self.present_bits = present_bits
+        self.energy_saving_mode = energy_saving_mode
+        self.temperature_regulation_active = temperature_regulation_active
+        self.total_energy_used = total_energy_used
+
+    def __len__(self) -> int:
+        return len(self.total_energy_used)
+
+    def device_status(self, device: str) -> np.ndarray:
+        """Série booleana do estado de um dispositivo (False onde ele não aparece)."""
+        column = self.device_names.index(device)
+        return (self.status_bits[:, column // 8] & (0x80 >> column % 8)).astype(bool)
+
+    def __getitem__(self, index: int) -> EnergyManagementResult:
+        count = len(self.device_names)
+        status = np.unpackbits(self.status_bits[index], count=count)
+        present = np.unpackbits(self.present_bits[index], count=count)
+        return EnergyManagementResult(
+            {name: bool(status[column]) for column, name in enumerate(self.device_names) if present[column]},
+            bool(self.energy_saving_mode[index]),
+            bool(self.temperature_regulation_active[index]),
+            float(self.total_energy_used[index]),
+        )
+
+    def __repr__(self) -> str:
+        return (f"SimulationResult(steps={len(self)}, devices={len(self.device_names)}, "
+                f"start_time={self.start_time.isoformat()}, step={self.step}, "
+                f"energy_saving_mode={int(self.energy_saving_mode.sum())}, "
+                f"temperature_regulation_active={int(self.temperature_regulation_active.sum())})")
@@ -0,0 +1,10 @@
+# Política do modo noturno, compartilhada por todos os motores de manage_energy
+NIGHT_START = 23
+NIGHT_END = 6
+# Dispositivos que continuam ligados no modo noturno
+NIGHT_EXEMPT = frozenset(("Security", "Refrigerator"))
+
+
+def is_night_hour(hour):
+    """Se a hora (int ou array de horas) cai no modo noturno, entre 23h e 6h."""
+    return (hour >= NIGHT_START) | (hour < NIGHT_END)
@@ -0,0 +1,64 @@
+import numpy as np
+from src.flight.BookingResultBatch import BookingResultBatch
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+
+class BatchFlightBookingSystem(FlightBookingSystem):
+    """Cotação vetorizada de muitas combinações de parâmetros de book_flight de uma vez."""
+
+    def quote_many(
+        self,
+        passengers,
+        booking_times,
+        available_seats,
+        current_prices,
+        previous_sales,
+        is_cancellation,
+        departure_times,
+        reward_points_available,
+    ) -> BookingResultBatch:
+        """
+        Aplica as regras de book_flight elemento a elemento, com máscaras NumPy.
+
+        Os argumentos seguem a ordem de book_flight e são arrays (ou escalares,
+        que são replicados). Horários podem ser arrays datetime64, listas de
+        datetime ou inteiros em microssegundos desde a época. O resultado de
+        cada posição é idêntico ao da chamada escalar correspondente.
+        """
+        (passengers, booking_times, available_seats, current_prices, previous_sales,
+         is_cancellation, departure_times, reward_points_available) = np.broadcast_arrays(
+            np.asarray(passengers),
+            np.asarray(booking_times).astype("datetime64[us]"),
+            np.asarray(available_seats),
+            np.asarray(current_prices, dtype=np.float64),
+            np.asarray(previous_sales),
+            np.asarray(is_cancellation, dtype=bool),
+            np.asarray(departure_times).astype("datetime64[us]"),
+            np.asarray(reward_points_available),
+        )
+
+        seats_ok = ~(passengers > available_seats)
+
+        price_factor = (previous_sales / 100.0) * 0.8
+        final_price = current_prices * price_factor * passengers
+
+        # Mesmo cálculo de timedelta.total_seconds(): microssegundos inteiros / 10**6
+        microseconds = (departure_times - booking_times).astype(np.int64)
+        hours_to_departure = microseconds / 1e6 / 3600
+
+        final_price = np.where(hours_to_departure < 24, final_price + 100, final_price)
+        final_price = np.where(passengers > 4, final_price * 0.95, final_price)
+        points_used = reward_points_available > 0
+        final_price = np.where(points_used, final_price - reward_points_available * 0.01, final_price)
+        final_price = np.where(final_price < 0, 0.0, final_price)
+
+        refund_amount = np.where(hours_to_departure >= 48, final_price, final_price * 0.5)
+
+        booked = seats_ok & ~is_cancellation
+        cancelled = seats_ok & is_cancellation
+        return BookingResultBatch(
+            booked,
+            np.where(booked, final_price, 0.0),
+            np.where(cancelled, refund_amount, 0.0),
+            booked & points_used,
+        )
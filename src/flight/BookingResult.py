@@ -1,12 +1,46 @@
 class BookingResult:
+    """
+    Resultado imutável de uma reserva.
+
+    Como nenhuma instância muda depois de criada, resultados constantes podem
+    ser compartilhados: REJECTED (definido abaixo da classe) é devolvido por
+    book_flight sempre que não há assentos suficientes.
+    """
+
+    __slots__ = ("confirmation", "total_price", "refund_amount", "points_used")
+
     def __init__(self, confirmation, total_price, refund_amount, points_used):
-        self.confirmation = confirmation
-        self.total_price = total_price
-        self.refund_amount = refund_amount
-        self.points_used = points_used
+        object.__setattr__(self, "confirmation", confirmation)
+        object.__setattr__(self, "total_price", total_price)
+        object.__setattr__(self, "refund_amount", refund_amount)
+        object.__setattr__(self, "points_used", points_used)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BookingResult é imutável")
+
+    def __delattr__(self, name):
+        raise AttributeError("BookingResult é imutável")
+
+    def __reduce__(self):
+        return BookingResult, (self.confirmation, self.total_price, self.refund_amount, self.points_used)
+
+    def __eq__(self, other):
+        if not isinstance(other, BookingResult):
+            return NotImplemented
+        return (self.confirmation == other.confirmation
+                and self.total_price == other.total_price
+                and self.refund_amount == other.refund_amount
+                and self.points_used == other.points_used)
+
+    def __hash__(self):
+        return hash((self.confirmation, self.total_price, self.refund_amount, self.points_used))
 
     def __repr__(self):
         return (f"BookingResult(confirmation={self.confirmation}, "
                 f"total_price={self.total_price:.2f}, "
                 f"refund_amount={self.refund_amount:.2f}, "
-                f"points_used={self.points_used})")
\ No newline at end of file
+                f"points_used={self.points_used})")
+
+
+# Rejeição por falta de assentos: o mesmo objeto em todas as chamadas
+BookingResult.REJECTED = BookingResult(False, 0.0, 0.0, False)
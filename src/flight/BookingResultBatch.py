@@ -0,0 +1,40 @@
+from collections.abc import Iterator
+import numpy as np
+from src.flight.BookingResult import BookingResult
+
+
+class BookingResultBatch:
+    """Resultados de um lote de reservas, armazenados por colunas."""
+
+    def __init__(
+        self,
+        confirmation: np.ndarray,
+        total_price: np.ndarray,
+        refund_amount: np.ndarray,
+        points_used: np.ndarray,
+    ):
+        self.confirmation = confirmation
+        self.total_price = total_price
+        self.refund_amount = refund_amount
+        self.points_used = points_used
+
+    def __len__(self) -> int:
+        return len(self.total_price)
+
+    def __getitem__(self, index: int) -> BookingResult:
+        return BookingResult(
+            bool(self.confirmation[index]),
+            float(self.total_price[index]),
+            float(self.refund_amount[index]),
+            bool(self.points_used[index]),
+        )
+
+    def __iter__(self) -> Iterator[BookingResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return (f"BookingResultBatch(size={len(self)}, "
+                f"confirmed={int(self.confirmation.sum())}, "
+                f"total_price={float(self.total_price.sum()):.2f}, "
+                f"refund_amount={float(self.refund_amount.sum()):.2f})")
@@ -0,0 +1,86 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+import numpy as np
+from src.common.iteration import chunked
+from src.flight.BookingResult import BookingResult
+from src.flight.BookingResultBatch import BookingResultBatch
+
+# (passengers, cancellation_time, current_price, previous_sales, reward_points_available)
+Booking = tuple[int, datetime, float, int, int]
+
+
+class BulkRefundProcessor:
+    """
+    Processa em massa os cancelamentos de um voo, com a regra de reembolso de book_flight.
+
+    As reservas chegam como um iterável consumido em blocos de `chunk_size`,
+    então a memória fica limitada ao bloco. Cada bloco é reembolsado de uma
+    vez: só as duas janelas que importam no cancelamento (menos de 24 h e
+    pelo menos 48 h antes da partida) são calculadas por reserva, comparando
+    horários, e o restante é aritmética vetorizada sobre as colunas; nada do
+    lado da compra (lotação, confirmação, preço cobrado) é avaliado. Com
+    `workers > 1` os blocos crus são distribuídos por um pool de processos,
+    com no máximo dois blocos por worker em andamento, e os resultados saem
+    na ordem de entrada.
+    """
+
+    def __init__(self, chunk_size: int = 10000, workers: int = 1):
+        if chunk_size < 1:
+            raise ValueError("chunk_size deve ser pelo menos 1")
+        if workers < 1:
+            raise ValueError("workers deve ser pelo menos 1")
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def process(self, bookings: Iterable[Booking], departure_time: datetime) -> Iterator[BookingResult]:
+        """Gera um BookingResult de cancelamento para cada reserva, na ordem recebida."""
+        for batch in self.refund_batches(bookings, departure_time):
+            yield from batch
+
+    def refund_batches(self, bookings: Iterable[Booking], departure_time: datetime) -> Iterator[BookingResultBatch]:
+        """Gera um BookingResultBatch por bloco, sem materializar objetos por reserva."""
+        chunks = chunked(bookings, self.chunk_size)
+        if self.workers == 1:
+            for chunk in chunks:
+                yield refund_chunk(chunk, departure_time)
+            return
+
+        # Os blocos vão crus: a conversão para colunas é a parte cara e roda nos workers
+        with ProcessPoolExecutor(self.workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(refund_chunk, chunk, departure_time))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def refund_chunk(chunk: list[Booking], departure_time: datetime) -> BookingResultBatch:
+    """Reembolsos de um bloco de reservas, idênticos aos de book_flight com is_cancellation=True."""
+    passengers, cancellation_times, prices, sales, points = zip(*chunk)
+    count = len(passengers)
+    passengers = np.fromiter(passengers, np.int64, count)
+    prices = np.fromiter(prices, np.float64, count)
+    sales = np.fromiter(sales, np.int64, count)
+    points = np.fromiter(points, np.int64, count)
+    # Menos de 24 h antes da partida: taxa de 100; pelo menos 48 h: reembolso integral
+    late_after = departure_time - timedelta(hours=24)
+    full_until = departure_time - timedelta(hours=48)
+    late = np.fromiter(map(late_after.__lt__, cancellation_times), bool, count)
+    full = np.fromiter(map(full_until.__ge__, cancellation_times), bool, count)
+
+    # Mesma ordem de operações de book_flight, para resultados idênticos
+    price = prices * ((sales / 100.0) * 0.8) * passengers
+    price[late] += 100
+    large = passengers > 4
+    price[large] *= 0.95
+    with_points = points > 0
+    price[with_points] -= points[with_points] * 0.01
+    np.maximum(price, 0.0, out=price)
+    refund = np.where(full, price, price * 0.5)
+
+    no = np.zeros(count, dtype=bool)
+    return BookingResultBatch(no, np.zeros(count), refund, no)
@@ -1,7 +1,11 @@
 from datetime import datetime
 from src.flight.BookingResult import BookingResult
+from src.flight.SeatInventory import SeatInventory
 
 class FlightBookingSystem:
+    def __init__(self, inventory: SeatInventory | None = None):
+        self.inventory = inventory if inventory is not None else SeatInventory()
+
     def book_flight(
                     self, 
                     passengers: int, 
@@ -20,7 +24,7 @@ class FlightBookingSystem:
         points_used = False
 
         if passengers > available_seats:
-            return BookingResult(confirmation, final_price, refund_amount, points_used)
+            return BookingResult.REJECTED
 
         price_factor = (previous_sales / 100.0) * 0.8
         final_price = current_price * price_factor * passengers
@@ -51,4 +55,56 @@ class FlightBookingSystem:
             
         confirmation = True
 
-        return BookingResult(confirmation, final_price, refund_amount, points_used)
\ No newline at end of file
+        return BookingResult(confirmation, final_price, refund_amount, points_used)
+
+    def book(
+            self,
+            flight_id: str,
+            passengers: int,
+            booking_time: datetime,
+            current_price: float,
+            previous_sales: int,
+            departure_time: datetime,
+            reward_points_available: int
+        ) -> BookingResult:
+        """Reserva no estoque do voo: o preço e a baixa dos assentos acontecem sob o lock do voo."""
+        if passengers <= 0:
+            raise ValueError(f"O número de passageiros deve ser positivo, recebido {passengers}")
+        with self.inventory.locked(flight_id) as seats:
+            result = self.book_flight(
+                passengers, booking_time, seats.available, current_price,
+                previous_sales, False, departure_time, reward_points_available
+            )
+            if result.confirmation:
+                seats.available -= passengers
+        return result
+
+    def cancel(
+            self,
+            flight_id: str,
+            passengers: int,
+            cancellation_time: datetime,
+            current_price: float,
+            previous_sales: int,
+            departure_time: datetime,
+            reward_points_available: int = 0
+        ) -> BookingResult:
+        """
+        Cancela uma reserva confirmada: calcula o reembolso e devolve os assentos ao estoque.
+
+        O estoque só conta assentos, não reservas: o cancelamento é limitado
+        aos assentos ocupados no voo, e cabe a quem chama garantir que a
+        reserva cancelada existe.
+        """
+        if passengers <= 0:
+            raise ValueError(f"O número de passageiros deve ser positivo, recebido {passengers}")
+        with self.inventory.locked(flight_id) as seats:
+            reserved = seats.capacity - seats.available
+            if passengers > reserved:
+                raise ValueError(f"O voo '{flight_id}' não tem {passengers} assentos reservados")
+            result = self.book_flight(
+                passengers, cancellation_time, reserved, current_price,
+                previous_sales, True, departure_time, reward_points_available
+            )
+            seats.available += passengers
+        return result
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+
+class FlightLeg:
+    """
+    Um trecho de um itinerário: o voo no estoque e os parâmetros de preço de book_flight.
+
+    Os pontos de fidelidade não ficam no trecho: o saldo é do passageiro e é
+    repartido entre os trechos por ItineraryBookingSystem.book_itinerary.
+    """
+
+    __slots__ = ("flight_id", "current_price", "previous_sales", "departure_time")
+
+    def __init__(
+        self,
+        flight_id: str,
+        current_price: float,
+        previous_sales: int,
+        departure_time: datetime,
+    ):
+        self.flight_id = flight_id
+        self.current_price = current_price
+        self.previous_sales = previous_sales
+        self.departure_time = departure_time
+
+    def __repr__(self) -> str:
+        return (f"FlightLeg(flight_id={self.flight_id!r}, "
+                f"current_price={self.current_price:.2f}, "
+                f"previous_sales={self.previous_sales}, "
+                f"departure_time={self.departure_time.isoformat()})")
@@ -0,0 +1,122 @@
+import math
+from concurrent.futures import Executor
+from datetime import datetime
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.FlightLeg import FlightLeg
+from src.flight.ItineraryResult import ItineraryResult
+from src.flight.SeatInventory import SeatInventory
+
+
+class ItineraryBookingSystem(FlightBookingSystem):
+    """
+    Reserva itinerários com conexões, no modelo tudo-ou-nada.
+
+    Cada trecho é reservado com book() sob o lock do seu voo. Com um
+    `executor` (de threads, para estoques com latência de E/S) os trechos são
+    avaliados em paralelo e a latência fica limitada pelo trecho mais lento;
+    sem executor eles rodam em sequência, que é mais barato quando o estoque
+    está em memória. Se algum trecho for recusado ou falhar, os assentos dos
+    outros são devolvidos antes de retornar; se a devolução também falhar, o
+    erro é levantado como RuntimeError.
+
+    O saldo de pontos de fidelidade é um só para o itinerário: ele é
+    repartido entre os trechos em ordem, e cada trecho consome só os pontos
+    necessários para zerar o seu preço.
+    """
+
+    def __init__(self, inventory: SeatInventory | None = None, executor: Executor | None = None):
+        super().__init__(inventory)
+        self.executor = executor
+
+    def book_itinerary(
+            self,
+            legs: list[FlightLeg],
+            passengers: int,
+            booking_time: datetime,
+            reward_points_available: int = 0
+        ) -> ItineraryResult:
+        if not legs:
+            raise ValueError("O itinerário precisa de pelo menos um trecho")
+
+        points = self._allocate_points(legs, passengers, booking_time, reward_points_available)
+        outcomes = self._run_legs(
+            self._book_leg, [(leg, passengers, booking_time, leg_points) for leg, leg_points in zip(legs, points)]
+        )
+        results = tuple(result for result, _ in outcomes if result is not None)
+        error = next((error for _, error in outcomes if error is not None), None)
+        failed_legs = tuple(index for index, (result, _) in enumerate(outcomes)
+                            if result is None or not result.confirmation)
+
+        if error is not None or failed_legs:
+            confirmed = [(leg.flight_id, passengers) for leg, (result, _) in zip(legs, outcomes)
+                         if result is not None and result.confirmation]
+            rollback = self._run_legs(self.inventory.release, confirmed)
+            not_released = [(flight_id, release_error)
+                            for (flight_id, _), (_, release_error) in zip(confirmed, rollback)
+                            if release_error is not None]
+            if not_released:
+                flights = ", ".join(flight_id for flight_id, _ in not_released)
+                cause = f"; o itinerário falhou com {error!r}" if error is not None else ""
+                raise RuntimeError(
+                    f"Não foi possível devolver os assentos dos voos {flights}{cause}"
+                ) from not_released[0][1]
+            if error is not None:
+                raise error
+            return ItineraryResult(False, 0.0, False, results, failed_legs)
+
+        return ItineraryResult(
+            True,
+            sum(result.total_price for result in results),
+            any(result.points_used for result in results),
+            results,
+            points_spent=sum(points),
+        )
+
+    def _allocate_points(
+            self,
+            legs: list[FlightLeg],
+            passengers: int,
+            booking_time: datetime,
+            balance: int
+        ) -> list[int]:
+        """Pontos de cada trecho: em ordem, só o necessário para zerar o preço dele, até acabar o saldo."""
+        allocation = []
+        for leg in legs:
+            if balance <= 0:
+                allocation.append(0)
+                continue
+            # Preço sem pontos; a lotação não entra na conta, então o assento informado é o próprio pedido
+            price = self.book_flight(
+                passengers, booking_time, passengers, leg.current_price,
+                leg.previous_sales, False, leg.departure_time, 0
+            ).total_price
+            # Menor quantidade que zera o preço com a mesma conta de book_flight (price - pontos * 0.01)
+            needed = math.ceil(price * 100)
+            if needed > 0 and price - (needed - 1) * 0.01 <= 0:
+                needed -= 1
+            used = min(balance, needed)
+            allocation.append(used)
+            balance -= used
+        return allocation
+
+    def _book_leg(self, leg: FlightLeg, passengers: int, booking_time: datetime, points: int) -> BookingResult:
+        return self.book(
+            leg.flight_id, passengers, booking_time, leg.current_price,
+            leg.previous_sales, leg.departure_time, points
+        )
+
+    def _run_legs(self, function, calls: list[tuple]) -> list[tuple]:
+        """Executa `function` para cada chamada e devolve pares (resultado, exceção), na ordem."""
+        if self.executor is None or len(calls) < 2:
+            outcomes = []
+            for args in calls:
+                try:
+                    outcomes.append((function(*args), None))
+                except Exception as error:
+                    outcomes.append((None, error))
+            return outcomes
+
+        futures = [self.executor.submit(function, *args) for args in calls]
+        return [(None, future.exception()) if future.exception() is not None else (future.result(), None)
+                for future in futures]
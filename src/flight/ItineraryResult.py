@@ -0,0 +1,40 @@
+from src.flight.BookingResult import BookingResult
+
+
+class ItineraryResult:
+    """
+    Resultado de um itinerário com vários trechos.
+
+    `legs` traz o BookingResult de cada trecho, na ordem do itinerário. Se
+    algum trecho foi recusado, `confirmation` é False, `failed_legs` lista os
+    índices recusados e nenhum assento ficou reservado; os preços dos trechos
+    aceitos continuam em `legs` como referência, mas `total_price` é 0.
+    `points_spent` é quanto do saldo de pontos o itinerário consumiu (0 se
+    não foi confirmado).
+    """
+
+    __slots__ = ("confirmation", "total_price", "points_used", "legs", "failed_legs", "points_spent")
+
+    def __init__(
+        self,
+        confirmation: bool,
+        total_price: float,
+        points_used: bool,
+        legs: tuple[BookingResult, ...],
+        failed_legs: tuple[int, ...] = (),
+        points_spent: int = 0,
+    ):
+        self.confirmation = confirmation
+        self.total_price = total_price
+        self.points_used = points_used
+        self.legs = legs
+        self.failed_legs = failed_legs
+        self.points_spent = points_spent
+
+    def __repr__(self) -> str:
+        return (f"ItineraryResult(confirmation={self.confirmation}, "
+                f"total_price={self.total_price:.2f}, "
+                f"points_used={self.points_used}, "
+                f"points_spent={self.points_spent}, "
+                f"legs={len(self.legs)}, "
+                f"failed_legs={list(self.failed_legs)})")
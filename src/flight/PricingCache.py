@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+
+class PricingCache:
+    """
+    Cache LRU/TTL de cotações na frente de FlightBookingSystem.book_flight.
+
+    A chave usa apenas o que muda o resultado: passageiros, preço, vendas,
+    pontos, cancelamento, se há assentos suficientes e a faixa de horas até a
+    partida (abaixo de 24h, entre 24h e 48h, 48h ou mais; sem cancelamento as
+    duas últimas são a mesma faixa). Cotações que diferem só por segundos no
+    horário da reserva caem na mesma entrada. Os resultados devolvidos são
+    compartilhados entre chamadas e não devem ser alterados.
+    """
+
+    def __init__(
+        self,
+        system: FlightBookingSystem | None = None,
+        max_entries: int = 10000,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries deve ser pelo menos 1")
+        self.system = system if system is not None else FlightBookingSystem()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[BookingResult, float]] = OrderedDict()
+
+    def book_flight(
+            self,
+            passengers: int,
+            booking_time: datetime,
+            available_seats: int,
+            current_price: float,
+            previous_sales: int,
+            is_cancellation: bool,
+            departure_time: datetime,
+            reward_points_available: int
+        ) -> BookingResult:
+        if passengers > available_seats:
+            key = (passengers, False)
+        else:
+            hours_to_departure = (departure_time - booking_time).total_seconds() / 3600
+            if hours_to_departure < 24:
+                band = 0
+            elif hours_to_departure < 48 and is_cancellation:
+                band = 1
+            else:
+                band = 2
+            key = (passengers, True, current_price, previous_sales, is_cancellation, band, reward_points_available)
+
+        now = self.clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            result, expires_at = entry
+            if expires_at >= now:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return result
+            del self._entries[key]
+
+        self.misses += 1
+        result = self.system.book_flight(
+            passengers, booking_time, available_seats, current_price,
+            previous_sales, is_cancellation, departure_time, reward_points_available
+        )
+        self._entries[key] = (result, now + self.ttl if self.ttl is not None else float("inf"))
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def invalidate(self, current_price: float | None = None, previous_sales: int | None = None) -> int:
+        """
+        Remove as entradas com o preço e/ou as vendas informados (todas, se
+        nenhum for informado); retorna quantas foram removidas.
+        """
+        if current_price is None and previous_sales is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        stale = [
+            key for key in self._entries
+            if len(key) > 2
+            and (current_price is None or key[2] == current_price)
+            and (previous_sales is None or key[3] == previous_sales)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"PricingCache({self.stats()})"
@@ -0,0 +1,84 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class FlightSeats:
+    """Contadores de assentos de um voo, protegidos pelo próprio lock."""
+
+    __slots__ = ("capacity", "available", "lock")
+
+    def __init__(self, capacity: int, available: int):
+        self.capacity = capacity
+        self.available = available
+        self.lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"FlightSeats(capacity={self.capacity}, available={self.available})"
+
+
+class SeatInventory:
+    """
+    Estoque de assentos por voo, com um lock por voo.
+
+    Reservas em voos diferentes não disputam o mesmo lock; o lock global só
+    é usado para cadastrar voos.
+    """
+
+    def __init__(self):
+        self._flights: dict[str, FlightSeats] = {}
+        self._registry_lock = threading.Lock()
+
+    def add_flight(self, flight_id: str, capacity: int, available: int | None = None) -> None:
+        if available is None:
+            available = capacity
+        if capacity < 0 or not 0 <= available <= capacity:
+            raise ValueError(f"Assentos inválidos para o voo '{flight_id}': {available}/{capacity}")
+        with self._registry_lock:
+            if flight_id in self._flights:
+                raise ValueError(f"O voo '{flight_id}' já está cadastrado")
+            self._flights[flight_id] = FlightSeats(capacity, available)
+
+    def available(self, flight_id: str) -> int:
+        return self._seats(flight_id).available
+
+    def reserve(self, flight_id: str, seats: int) -> bool:
+        """Retira `seats` assentos se houver disponibilidade; retorna se conseguiu."""
+        _check_seats(seats)
+        with self.locked(flight_id) as flight:
+            if seats > flight.available:
+                return False
+            flight.available -= seats
+            return True
+
+    def release(self, flight_id: str, seats: int) -> None:
+        """Devolve `seats` assentos reservados ao estoque, sem nunca passar da capacidade do voo."""
+        _check_seats(seats)
+        with self.locked(flight_id) as flight:
+            if flight.available + seats > flight.capacity:
+                raise ValueError(f"O voo '{flight_id}' não tem {seats} assentos reservados")
+            flight.available += seats
+
+    @contextmanager
+    def locked(self, flight_id: str) -> Iterator[FlightSeats]:
+        """Mantém o lock do voo durante o bloco, para ler e alterar os contadores atomicamente."""
+        flight = self._seats(flight_id)
+        with flight.lock:
+            yield flight
+
+    def __contains__(self, flight_id: str) -> bool:
+        return flight_id in self._flights
+
+    def __repr__(self) -> str:
+        return f"SeatInventory(flights={len(self._flights)})"
+
+    def _seats(self, flight_id: str) -> FlightSeats:
+        try:
+            return self._flights[flight_id]
+        except KeyError:
+            raise KeyError(f"Voo desconhecido: '{flight_id}'") from None
+
+
+def _check_seats(seats: int) -> None:
+    if seats <= 0:
+        raise ValueError(f"A quantidade de assentos deve ser positiva, recebido {seats}")
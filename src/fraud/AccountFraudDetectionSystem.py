@@ -0,0 +1,109 @@
+from collections import deque
+from datetime import datetime
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.FraudRules import FraudRules
+from src.fraud.LocationBlacklist import LocationBlacklist
+
+
+class AccountHistory:
+    """Janela deslizante dos horários recentes de uma conta e sua última transação."""
+
+    __slots__ = ("timestamps", "last_transaction")
+
+    def __init__(self):
+        self.timestamps: deque[datetime] = deque()
+        self.last_transaction: Transaction | None = None
+
+
+class AccountFraudDetectionSystem(FraudDetectionSystem):
+    """
+    Versão com estado do FraudDetectionSystem, indexada por conta.
+
+    Cada transação é ingerida uma única vez; a contagem da regra de frequência
+    vem de uma janela deslizante por conta, sem reprocessar o histórico inteiro.
+    As transações de uma mesma conta devem chegar em ordem cronológica.
+    """
+
+    def __init__(self, explain: bool = False, rules: FraudRules | None = None):
+        super().__init__(explain, rules)
+        self._accounts: dict[str, AccountHistory] = {}
+
+    def ingest(self, account_id: str, transaction: Transaction) -> None:
+        """Adiciona uma transação ao histórico da conta sem avaliá-la."""
+        history = self._advance(account_id, transaction.timestamp)
+        history.timestamps.append(transaction.timestamp)
+        history.last_transaction = transaction
+
+    def check(
+        self,
+        account_id: str,
+        current_transaction: Transaction,
+        blacklisted_locations: list[str] | LocationBlacklist,
+    ) -> FraudCheckResult:
+        """
+        Avalia a transação contra o histórico da conta e depois a ingere.
+
+        O resultado é o mesmo de check_for_fraud chamado com todas as transações
+        anteriores da conta em ordem.
+        """
+        history = self._advance(account_id, current_transaction.timestamp)
+        result = self._evaluate(
+            current_transaction,
+            len(history.timestamps),
+            history.last_transaction,
+            blacklisted_locations,
+        )
+        history.timestamps.append(current_transaction.timestamp)
+        history.last_transaction = current_transaction
+        return result
+
+    def check_batch(
+        self,
+        items: list[tuple[str, Transaction]],
+        blacklisted_locations: list[str] | LocationBlacklist,
+        return_exceptions: bool = False,
+    ) -> list[FraudCheckResult | Exception]:
+        """
+        Avalia uma sequência de pares (conta, transação) em ordem, numa única chamada.
+
+        Com `return_exceptions`, um item inválido não interrompe o lote: o seu
+        erro ocupa a posição dele na lista e os demais itens são avaliados.
+        """
+        check = self.check
+        if not return_exceptions:
+            return [check(account_id, transaction, blacklisted_locations) for account_id, transaction in items]
+        results = []
+        for account_id, transaction in items:
+            try:
+                results.append(check(account_id, transaction, blacklisted_locations))
+            except Exception as error:
+                results.append(error)
+        return results
+
+    def forget(self, account_id: str) -> None:
+        """Descarta todo o estado guardado para a conta."""
+        self._accounts.pop(account_id, None)
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def _advance(self, account_id: str, now: datetime) -> AccountHistory:
+        history = self._accounts.get(account_id)
+        if history is None:
+            history = self._accounts[account_id] = AccountHistory()
+            return history
+
+        last = history.last_transaction
+        if now < last.timestamp:
+            raise ValueError(
+                f"Transação fora de ordem para a conta '{account_id}': {now} < {last.timestamp}"
+            )
+
+        # Remove da janela tudo que ficou mais antigo que VELOCITY_WINDOW
+        timestamps = history.timestamps
+        window = self.VELOCITY_WINDOW
+        while timestamps and now - timestamps[0] > window:
+            timestamps.popleft()
+        return history
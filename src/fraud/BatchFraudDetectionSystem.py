@@ -0,0 +1,135 @@
+import numpy as np
+from src.common.epoch import MICROSECOND, as_epoch_microseconds
+from src.fraud.FraudCheckBatchResult import FraudCheckBatchResult
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.FraudRules import FraudRules
+from src.fraud.LocationBlacklist import LocationBlacklist
+
+class BatchFraudDetectionSystem(FraudDetectionSystem):
+    """
+    Avaliação vetorizada de lotes de transações em formato colunar.
+
+    Cada linha é avaliada contra as linhas anteriores da mesma conta, na ordem
+    do lote, exatamente como check_for_fraud com esse histórico.
+    """
+
+    def check_for_fraud_batch(
+        self,
+        amounts,
+        timestamps,
+        locations,
+        account_ids,
+        blacklisted_locations,
+    ) -> FraudCheckBatchResult:
+        """
+        `timestamps` são inteiros em microssegundos desde a época, um array
+        datetime64 ou datetimes (os com fuso são levados a UTC); `locations` e `blacklisted_locations` podem ser códigos
+        inteiros ou strings. Uma LocationBlacklist é consultada por nome ou id,
+        conforme o lote; numa lista comum, lote e lista negra precisam usar a
+        mesma representação. Dentro de cada conta os horários não podem diminuir.
+        """
+        amounts = np.asarray(amounts)
+        times = as_epoch_microseconds(timestamps)
+        locations = np.asarray(locations)
+        _, account_codes = np.unique(np.asarray(account_ids), return_inverse=True)
+        n = len(amounts)
+        if not (len(times) == len(locations) == len(account_codes) == n):
+            raise ValueError("As colunas do lote devem ter o mesmo tamanho")
+
+        # Ordena por conta mantendo a ordem de chegada dentro de cada conta
+        order = np.argsort(account_codes, kind="stable")
+        sorted_accounts = account_codes[order]
+        sorted_times = times[order]
+        sorted_locations = locations[order]
+
+        same_account = np.zeros(n, dtype=bool)
+        same_account[1:] = sorted_accounts[1:] == sorted_accounts[:-1]
+        elapsed = np.zeros(n, dtype=np.int64)
+        elapsed[1:] = sorted_times[1:] - sorted_times[:-1]
+        if np.any(same_account & (elapsed < 0)):
+            raise ValueError("Os horários de cada conta devem estar em ordem cronológica")
+
+        # Regra 2: transações anteriores da conta dentro da janela de frequência
+        velocity_window = self.VELOCITY_WINDOW // MICROSECOND
+        first_in_window = _first_position_at_or_after(
+            sorted_accounts, sorted_times, sorted_times - velocity_window
+        )
+        recent_count = np.arange(n) - first_in_window
+
+        # Regra 3: mudança de localização em relação à transação anterior da conta
+        location_window = self.LOCATION_WINDOW // MICROSECOND
+        location_changed = np.zeros(n, dtype=bool)
+        location_changed[1:] = sorted_locations[1:] != sorted_locations[:-1]
+        location_hop = same_account & (elapsed < location_window) & location_changed
+
+        fraud_rules = self.rules if self.rules is not None else FraudRules()
+        rules = fraud_rules.definition
+        no_rule = np.zeros(n, dtype=bool)
+        amount_rule, velocity_rule = rules["amount"], rules["velocity"]
+        location_rule, blacklist_rule = rules["location"], rules["blacklist"]
+
+        high_amount = amounts > amount_rule["threshold"] if amount_rule else no_rule
+        frequent = np.empty(n, dtype=bool)
+        frequent[order] = recent_count > velocity_rule["max_count"] if velocity_rule else no_rule
+        hop = np.empty(n, dtype=bool)
+        hop[order] = location_hop if location_rule else no_rule
+        blacklisted = _blacklisted(locations, blacklisted_locations) if blacklist_rule else no_rule
+
+        is_fraudulent = high_amount | hop
+        is_blocked = frequent | blacklisted
+        # Soma na mesma ordem do caminho escalar para manter resultados idênticos
+        risk_score = np.zeros(n, dtype=np.int64 if fraud_rules.integral_scores else np.float64)
+        for rule, fired in ((amount_rule, high_amount), (velocity_rule, frequent), (location_rule, hop)):
+            if rule:
+                risk_score[fired] += rule["points"]
+        if blacklist_rule:
+            risk_score[blacklisted] = blacklist_rule["score"]
+
+        rules_fired = None
+        if self.explain:
+            rules_fired = (
+                high_amount * np.uint8(FraudCheckResult.RULE_AMOUNT)
+                | frequent * np.uint8(FraudCheckResult.RULE_VELOCITY)
+                | hop * np.uint8(FraudCheckResult.RULE_LOCATION)
+                | blacklisted * np.uint8(FraudCheckResult.RULE_BLACKLIST)
+            )
+
+        return FraudCheckBatchResult(is_fraudulent, is_blocked, is_fraudulent.copy(), risk_score, rules_fired)
+
+
+def _blacklisted(locations: np.ndarray, blacklisted_locations) -> np.ndarray:
+    if isinstance(blacklisted_locations, LocationBlacklist):
+        # A lista negra aceita nomes e ids: consulta uma vez cada localização distinta do lote
+        values, inverse = np.unique(locations, return_inverse=True)
+        return np.array([value.item() in blacklisted_locations for value in values], dtype=bool)[inverse]
+    blacklist = np.asarray(list(blacklisted_locations))
+    if blacklist.size and locations.size and (
+        np.issubdtype(blacklist.dtype, np.number) != np.issubdtype(locations.dtype, np.number)
+    ):
+        raise ValueError("Localizações do lote e da lista negra devem ser ambas ids ou ambas nomes")
+    return np.isin(locations, blacklist)
+
+
+def _first_position_at_or_after(groups: np.ndarray, values: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """
+    Para cada i, menor posição j do mesmo grupo com values[j] >= bounds[i].
+
+    `groups` vem ordenado e `values` é crescente dentro de cada grupo. Valores e
+    limites são intercalados numa única ordenação lexicográfica; os limites vêm
+    antes dos valores iguais, então a quantidade de valores antes de cada
+    limite é exatamente a posição procurada.
+    """
+    n = len(values)
+    is_value = np.concatenate((np.ones(n, dtype=np.int8), np.zeros(n, dtype=np.int8)))
+    merged = np.lexsort((
+        is_value,
+        np.concatenate((values, bounds)),
+        np.concatenate((groups, groups)),
+    ))
+    merged_is_value = is_value[merged]
+    values_before = np.cumsum(merged_is_value) - merged_is_value
+    is_bound = merged_is_value == 0
+    positions = np.empty(n, dtype=np.int64)
+    positions[merged[is_bound] - n] = values_before[is_bound]
+    return positions
@@ -0,0 +1,37 @@
+import numpy as np
+from src.fraud.FraudCheckResult import FraudCheckResult
+
+
+class FraudCheckBatchResult:
+    """Resultados de um lote de verificações, armazenados por colunas."""
+
+    def __init__(
+        self,
+        is_fraudulent: np.ndarray,
+        is_blocked: np.ndarray,
+        verification_required: np.ndarray,
+        risk_score: np.ndarray,
+        rules_fired: np.ndarray | None = None,
+    ):
+        self.is_fraudulent = is_fraudulent
+        self.is_blocked = is_blocked
+        self.verification_required = verification_required
+        self.risk_score = risk_score
+        self.rules_fired = rules_fired
+
+    def __len__(self) -> int:
+        return len(self.risk_score)
+
+    def __getitem__(self, index: int) -> FraudCheckResult:
+        return FraudCheckResult(
+            bool(self.is_fraudulent[index]),
+            bool(self.is_blocked[index]),
+            bool(self.verification_required[index]),
+            self.risk_score[index].item(),
+            None if self.rules_fired is None else int(self.rules_fired[index]),
+        )
+
+    def __repr__(self) -> str:
+        return (f"FraudCheckBatchResult(size={len(self)}, "
+                f"fraudulent={int(self.is_fraudulent.sum())}, "
+                f"blocked={int(self.is_blocked.sum())})")
@@ -1,12 +1,41 @@
 class FraudCheckResult:
-    def __init__(self, is_fraudulent: bool, is_blocked: bool, verification_required: bool, risk_score: int):
+    __slots__ = ("is_fraudulent", "is_blocked", "verification_required", "risk_score", "rules_fired")
+
+    # Bits de rules_fired: quais regras contribuíram para o risk_score
+    RULE_AMOUNT = 1
+    RULE_VELOCITY = 2
+    RULE_LOCATION = 4
+    RULE_BLACKLIST = 8
+    RULE_NAMES = {
+        RULE_AMOUNT: "amount",
+        RULE_VELOCITY: "velocity",
+        RULE_LOCATION: "location",
+        RULE_BLACKLIST: "blacklist",
+    }
+
+    def __init__(
+        self,
+        is_fraudulent: bool,
+        is_blocked: bool,
+        verification_required: bool,
+        risk_score: int,
+        rules_fired: int | None = None,
+    ):
         self.is_fraudulent = is_fraudulent
         self.is_blocked = is_blocked
         self.verification_required = verification_required
         self.risk_score = risk_score
+        self.rules_fired = rules_fired
+
+    def explain(self) -> list[str] | None:
+        """Nomes das regras que dispararam, ou None se o detalhamento estava desligado."""
+        if self.rules_fired is None:
+            return None
+        return [name for bit, name in self.RULE_NAMES.items() if self.rules_fired & bit]
 
     def __repr__(self) -> str:
+        rules = "" if self.rules_fired is None else f", rules_fired={self.explain()}"
         return (f"FraudCheckResult(is_fraudulent={self.is_fraudulent}, "
                 f"is_blocked={self.is_blocked}, "
                 f"verification_required={self.verification_required}, "
-                f"risk_score={self.risk_score})")
\ No newline at end of file
+                f"risk_score={self.risk_score}{rules})")
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from functools import partial
+from src.fraud.AccountFraudDetectionSystem import AccountFraudDetectionSystem
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.LocationBlacklist import LocationBlacklist
+from src.fraud.ServiceMetrics import ServiceMetrics
+from src.fraud.ShardedFraudExecutor import ShardedFraudExecutor
+from src.fraud.Transaction import Transaction
+
+
+class FraudCheckService:
+    """
+    Camada asyncio na frente de um sistema de detecção com estado.
+
+    Requisições concorrentes de check() são agrupadas em micro-lotes de até
+    `max_batch_size` itens, esperando no máximo `max_wait_ms` pelo lote
+    encher. Cada lote é avaliado numa única chamada a `system.check_batch`,
+    em ordem de chegada, então a ordem dentro de cada conta é preservada; um
+    item inválido só falha a própria requisição.
+    A avaliação sempre sai do event loop, no `executor` informado ou no
+    executor padrão do loop; os lotes são avaliados um de cada vez. Como o
+    estado das contas fica em `system`, o executor deve ser de threads; para
+    paralelismo entre processos use um ShardedFraudExecutor como `system`.
+    Se o serviço for cancelado, as requisições ainda sem resposta são
+    canceladas em vez de ficarem esperando para sempre.
+    """
+
+    def __init__(
+        self,
+        system: AccountFraudDetectionSystem | ShardedFraudExecutor | None = None,
+        blacklisted_locations: list[str] | LocationBlacklist = (),
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        executor: Executor | None = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size deve ser pelo menos 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms não pode ser negativo")
+        self.system = system if system is not None else AccountFraudDetectionSystem()
+        self.blacklist = blacklisted_locations
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self.metrics = ServiceMetrics()
+        self._pending: list[tuple[str, Transaction, asyncio.Future, float]] = []
+        self._has_items: asyncio.Event | None = None
+        self._batch_full: asyncio.Event | None = None
+        self._closing = False
+        self._worker: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._has_items = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._closing = False
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Avalia o que ainda está na fila e encerra o serviço."""
+        if self._worker is None:
+            return
+        self._closing = True
+        self._has_items.set()
+        await self._worker
+        self._worker = None
+
+    async def __aenter__(self) -> "FraudCheckService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def check(self, account_id: str, transaction: Transaction) -> FraudCheckResult:
+        if self._worker is None or self._closing:
+            raise RuntimeError("O serviço não está em execução")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((account_id, transaction, future, time.perf_counter()))
+        self.metrics.enqueued()
+        self._has_items.set()
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_full.set()
+        return await future
+
+    async def _run(self) -> None:
+        try:
+            await self._serve()
+        finally:
+            for _, _, future, _ in self._pending:
+                future.cancel()
+
+    async def _serve(self) -> None:
+        while True:
+            await self._has_items.wait()
+            if not self._pending:
+                if self._closing:
+                    return
+                self._has_items.clear()
+                continue
+
+            if len(self._pending) < self.max_batch_size and not self._closing:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.max_wait)
+                except TimeoutError:
+                    pass
+
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            if len(self._pending) < self.max_batch_size:
+                self._batch_full.clear()
+            await self._evaluate(batch)
+
+    async def _evaluate(self, batch: list[tuple[str, Transaction, asyncio.Future, float]]) -> None:
+        items = [(account_id, transaction) for account_id, transaction, _, _ in batch]
+        # Cada item recebe o próprio resultado ou erro: um item inválido não derruba o lote
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, partial(self.system.check_batch, items, self.blacklist, return_exceptions=True)
+            )
+        except Exception as error:
+            results = [error] * len(batch)
+        except BaseException:
+            # Cancelamento ou saída do loop: nenhuma requisição do lote fica pendente
+            for _, _, future, _ in batch:
+                future.cancel()
+            raise
+        for (_, _, future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        finished = time.perf_counter()
+        self.metrics.batch_done([finished - started for _, _, _, started in batch])
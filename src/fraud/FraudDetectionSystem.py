@@ -1,47 +1,87 @@
+from datetime import timedelta
 from src.fraud.Transaction import Transaction
 from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudRules import FraudRules
+from src.fraud.LocationBlacklist import LocationBlacklist
+
+_RULE_AMOUNT = FraudCheckResult.RULE_AMOUNT
+_RULE_VELOCITY = FraudCheckResult.RULE_VELOCITY
+_RULE_LOCATION = FraudCheckResult.RULE_LOCATION
+_RULE_BLACKLIST = FraudCheckResult.RULE_BLACKLIST
 
 
 class FraudDetectionSystem:
+    # Janelas de tempo das regras de frequência e de mudança de localização
+    VELOCITY_WINDOW = timedelta(minutes=60)
+    LOCATION_WINDOW = timedelta(minutes=30)
+
+    def __init__(self, explain: bool = False, rules: FraudRules | None = None):
+        # Com explain=True cada resultado carrega em rules_fired as regras que dispararam
+        self.explain = explain
+        self.rules = rules
+        if rules is not None:
+            # Limites configuráveis: troca as regras fixas pela função compilada
+            self.VELOCITY_WINDOW = rules.velocity_window
+            self.LOCATION_WINDOW = rules.location_window
+            self._evaluate = rules.compile(explain)
+
     def check_for_fraud(
         self,
         current_transaction: Transaction,
         previous_transactions: list[Transaction],
-        blacklisted_locations: list[str],
+        blacklisted_locations: list[str] | LocationBlacklist,
+    ) -> FraudCheckResult:
+        recent_transaction_count = 0
+        for transaction in previous_transactions:
+            if current_transaction.timestamp - transaction.timestamp <= self.VELOCITY_WINDOW:
+                recent_transaction_count += 1
+
+        last_transaction = previous_transactions[-1] if previous_transactions else None
+
+        return self._evaluate(
+            current_transaction, recent_transaction_count, last_transaction, blacklisted_locations
+        )
+
+    def _evaluate(
+        self,
+        current_transaction: Transaction,
+        recent_transaction_count: int,
+        last_transaction: Transaction | None,
+        blacklisted_locations: list[str] | LocationBlacklist,
     ) -> FraudCheckResult:
+        """Aplica as regras a partir da contagem recente e da última transação já conhecidas."""
         is_fraudulent = False
         is_blocked = False
         verification_required = False
         risk_score = 0
+        rules_fired = 0
 
         if current_transaction.amount > 10000:
             is_fraudulent = True
             verification_required = True
             risk_score += 50
+            rules_fired |= _RULE_AMOUNT
 
-        recent_transaction_count = 0
-        for transaction in previous_transactions:
-            time_difference = current_transaction.timestamp - transaction.timestamp
-            time_diff_minutes = time_difference.total_seconds() / 60
-            if time_diff_minutes <= 60:
-                recent_transaction_count += 1
-        
         if recent_transaction_count > 10:
             is_blocked = True
             risk_score += 30
+            rules_fired |= _RULE_VELOCITY
 
-        if previous_transactions:
-            last_transaction = previous_transactions[-1]
+        if last_transaction is not None:
             time_since_last = current_transaction.timestamp - last_transaction.timestamp
-            minutes_since_last = time_since_last.total_seconds() / 60
-            
-            if minutes_since_last < 30 and last_transaction.location != current_transaction.location:
+
+            if time_since_last < self.LOCATION_WINDOW and last_transaction.location != current_transaction.location:
                 is_fraudulent = True
                 verification_required = True
                 risk_score += 20
+                rules_fired |= _RULE_LOCATION
 
         if current_transaction.location in blacklisted_locations:
             is_blocked = True
             risk_score = 100
+            rules_fired |= _RULE_BLACKLIST
 
-        return FraudCheckResult(is_fraudulent, is_blocked, verification_required, risk_score)
+        return FraudCheckResult(
+            is_fraudulent, is_blocked, verification_required, risk_score,
+            rules_fired if self.explain else None,
+        )
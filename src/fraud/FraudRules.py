@@ -0,0 +1,152 @@
+import copy
+import json
+import math
+from collections.abc import Callable
+from datetime import timedelta
+from src.fraud.FraudCheckResult import FraudCheckResult
+
+Evaluator = Callable[..., FraudCheckResult]
+
+# Definição equivalente às regras fixas de FraudDetectionSystem
+DEFAULT_DEFINITION = {
+    "amount": {"threshold": 10000, "points": 50},
+    "velocity": {"window_minutes": 60, "max_count": 10, "points": 30},
+    "location": {"window_minutes": 30, "points": 20},
+    "blacklist": {"score": 100},
+}
+
+_FIELDS = {
+    "amount": ("threshold", "points"),
+    "velocity": ("window_minutes", "max_count", "points"),
+    "location": ("window_minutes", "points"),
+    "blacklist": ("score",),
+}
+# Janelas precisam ser positivas; limites e pontuações não podem ser negativos
+_POSITIVE = ("window_minutes",)
+
+
+class FraudRules:
+    """
+    Limites das regras de fraude carregados de uma definição JSON.
+
+    Cada seção pode ser omitida (usa o padrão) ou ser `null` (desliga a
+    regra). compile() gera uma única vez uma função Python com os limites
+    embutidos como constantes, então a regra configurável roda com o mesmo
+    custo da versão fixa, sem consultas a dicionários no caminho quente.
+    """
+
+    def __init__(self, definition: dict | None = None):
+        if definition is not None and not isinstance(definition, dict):
+            raise ValueError(f"A definição das regras deve ser um objeto, recebido {definition!r}")
+        merged = copy.deepcopy(DEFAULT_DEFINITION)
+        for section, values in (definition or {}).items():
+            if section not in _FIELDS:
+                raise ValueError(f"Regra desconhecida: '{section}'")
+            if values is None:
+                merged[section] = None
+                continue
+            if not isinstance(values, dict):
+                raise ValueError(f"'{section}' deve ser um objeto ou null, recebido {values!r}")
+            unknown = set(values) - set(_FIELDS[section])
+            if unknown:
+                raise ValueError(f"Campos desconhecidos em '{section}': {sorted(unknown)}")
+            merged[section] = {**(merged[section] or DEFAULT_DEFINITION[section]), **values}
+
+        for section, values in merged.items():
+            for field, value in (values or {}).items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                    raise ValueError(f"'{section}.{field}' deve ser um número finito, recebido {value!r}")
+                if field in _POSITIVE and value <= 0:
+                    raise ValueError(f"'{section}.{field}' deve ser positivo, recebido {value!r}")
+                if value < 0:
+                    raise ValueError(f"'{section}.{field}' não pode ser negativo, recebido {value!r}")
+        self.definition = merged
+
+    @classmethod
+    def from_json(cls, text: str) -> "FraudRules":
+        return cls(json.loads(text))
+
+    @classmethod
+    def load(cls, path: str) -> "FraudRules":
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+    @property
+    def velocity_window(self) -> timedelta:
+        velocity = self.definition["velocity"]
+        return timedelta(minutes=velocity["window_minutes"] if velocity else 0)
+
+    @property
+    def location_window(self) -> timedelta:
+        location = self.definition["location"]
+        return timedelta(minutes=location["window_minutes"] if location else 0)
+
+    @property
+    def integral_scores(self) -> bool:
+        """Indica se todas as pontuações são inteiras (e o risk_score também será)."""
+        points = [values[field] for values in self.definition.values() if values
+                  for field in ("points", "score") if field in values]
+        return all(isinstance(value, int) for value in points)
+
+    def compile(self, explain: bool = False) -> Evaluator:
+        """
+        Gera a função evaluate(current_transaction, recent_transaction_count,
+        last_transaction, blacklisted_locations), com a mesma assinatura de
+        FraudDetectionSystem._evaluate.
+        """
+        amount = self.definition["amount"]
+        velocity = self.definition["velocity"]
+        location = self.definition["location"]
+        blacklist = self.definition["blacklist"]
+
+        lines = [
+            "def evaluate(current_transaction, recent_transaction_count, last_transaction, blacklisted_locations):",
+            "    is_fraudulent = False",
+            "    is_blocked = False",
+            "    verification_required = False",
+            "    risk_score = 0",
+            "    rules_fired = 0",
+        ]
+        if amount:
+            lines += [
+                f"    if current_transaction.amount > {amount['threshold']!r}:",
+                "        is_fraudulent = True",
+                "        verification_required = True",
+                f"        risk_score += {amount['points']!r}",
+                f"        rules_fired |= {FraudCheckResult.RULE_AMOUNT}",
+            ]
+        if velocity:
+            lines += [
+                f"    if recent_transaction_count > {velocity['max_count']!r}:",
+                "        is_blocked = True",
+                f"        risk_score += {velocity['points']!r}",
+                f"        rules_fired |= {FraudCheckResult.RULE_VELOCITY}",
+            ]
+        if location:
+            lines += [
+                "    if (last_transaction is not None",
+                "            and current_transaction.timestamp - last_transaction.timestamp < LOCATION_WINDOW",
+                "            and last_transaction.location != current_transaction.location):",
+                "        is_fraudulent = True",
+                "        verification_required = True",
+                f"        risk_score += {location['points']!r}",
+                f"        rules_fired |= {FraudCheckResult.RULE_LOCATION}",
+            ]
+        if blacklist:
+            lines += [
+                "    if current_transaction.location in blacklisted_locations:",
+                "        is_blocked = True",
+                f"        risk_score = {blacklist['score']!r}",
+                f"        rules_fired |= {FraudCheckResult.RULE_BLACKLIST}",
+            ]
+        lines.append(
+            "    return FraudCheckResult(is_fraudulent, is_blocked, verification_required, risk_score, "
+            + ("rules_fired)" if explain else "None)")
+        )
+
+        namespace = {"FraudCheckResult": FraudCheckResult, "LOCATION_WINDOW": self.location_window}
+        exec(compile("\n".join(lines), "<fraud-rules>", "exec"), namespace)
+        return namespace["evaluate"]
+
+    def __repr__(self) -> str:
+        return f"FraudRules({self.definition})"
@@ -0,0 +1,140 @@
+import json
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from json.encoder import encode_basestring_ascii
+from typing import TextIO
+from src.common.iteration import chunked
+from src.fraud.AccountFraudDetectionSystem import AccountFraudDetectionSystem
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.LocationBlacklist import LocationBlacklist
+from src.fraud.ShardedFraudExecutor import ShardedFraudExecutor
+from src.fraud.Transaction import Transaction
+
+_JSON_BOOL = ("false", "true")
+# Valor de account_id: string sem escapes (grupo 1) ou string com escapes/inteiro (grupo 2)
+_ACCOUNT_ID = re.compile(r'"account_id"\s*:\s*(?:"([^"\\]*)"|("(?:[^"\\]|\\.)*"|-?\d+(?=\s*[,}])))')
+
+
+class FraudStreamPipeline:
+    """
+    Pipeline de streaming: lê transações em JSONL, avalia e escreve resultados em JSONL.
+
+    Cada linha de entrada é um objeto com `account_id`, `amount`, `timestamp`
+    (ISO 8601) e `location`; um campo `id` opcional é repassado para a saída.
+    A leitura é preguiçosa e feita em blocos de `chunk_size` linhas, então a
+    memória fica limitada pelo tamanho do bloco. Com `workers > 1` as contas
+    são divididas entre processos, cada um com seu próprio estado, e a saída
+    mantém a ordem da entrada.
+
+    Um registro inválido (JSON malformado, campo faltando, horário fora de
+    ordem na conta) não interrompe o stream: a sua linha de saída traz
+    `error` no lugar do resultado, como em check_batch com
+    return_exceptions. Horários com fuso são convertidos para UTC e os sem
+    fuso são tratados como UTC, então as duas formas podem se misturar.
+    """
+
+    def __init__(
+        self,
+        blacklisted_locations: Iterable[str] = (),
+        chunk_size: int = 1000,
+        workers: int = 1,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size deve ser pelo menos 1")
+        if workers < 1:
+            raise ValueError("workers deve ser pelo menos 1")
+        self.blacklisted_locations = list(blacklisted_locations)
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def run(self, source: TextIO, sink: TextIO) -> int:
+        """Processa todo o `source` e escreve em `sink`; retorna o número de registros."""
+        count = 0
+        for output_lines in self.process(source):
+            sink.write("".join(output_lines))
+            count += len(output_lines)
+        return count
+
+    def process(self, lines: Iterable[str]) -> Iterator[list[str]]:
+        """Gera, bloco a bloco, as linhas JSONL de saída para as linhas de entrada."""
+        chunks = chunked((line for line in lines if not line.isspace()), self.chunk_size)
+        with ShardedFraudExecutor(self.workers, self.blacklisted_locations, line_handler=check_lines) as executor:
+            for chunk in chunks:
+                yield executor.check_lines(chunk, _routing_key)
+
+
+def check_lines(
+    system: AccountFraudDetectionSystem,
+    blacklist: Iterable[str] | LocationBlacklist,
+    lines: list[str],
+) -> list[str]:
+    """Avalia um bloco de linhas JSONL e devolve as linhas de saída na mesma ordem; erros viram linhas de erro."""
+    loads = json.loads
+    output = []
+    for line in lines:
+        record = None
+        try:
+            record = loads(line)
+            account_id, transaction = parse_transaction(record)
+            output.append(format_result(record, system.check(account_id, transaction, blacklist)))
+        except Exception as error:
+            output.append(format_error(record, error))
+    return output
+
+
+def parse_transaction(record: dict) -> tuple[str, Transaction]:
+    """Conta e transação de um registro, com o horário normalizado para UTC sem fuso."""
+    timestamp = datetime.fromisoformat(record["timestamp"])
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return record["account_id"], Transaction(record["amount"], timestamp, record["location"])
+
+
+def format_result(record: dict, result: FraudCheckResult) -> str:
+    """Serializa o resultado como uma linha JSON, sem passar pelo encoder genérico."""
+    head = f'{{"account_id": {_json_value(record["account_id"])}, '
+    if "id" in record:
+        head += f'"id": {_json_value(record["id"])}, '
+    return (f'{head}"is_fraudulent": {_JSON_BOOL[result.is_fraudulent]}, '
+            f'"is_blocked": {_JSON_BOOL[result.is_blocked]}, '
+            f'"verification_required": {_JSON_BOOL[result.verification_required]}, '
+            f'"risk_score": {result.risk_score}}}\n')
+
+
+def format_error(record: dict | None, error: Exception) -> str:
+    """Linha de saída de um registro que não pôde ser avaliado, com a conta e o id quando legíveis."""
+    head = "{"
+    if isinstance(record, dict):
+        if "account_id" in record:
+            head += f'"account_id": {_json_value(record["account_id"])}, '
+        if "id" in record:
+            head += f'"id": {_json_value(record["id"])}, '
+    return f'{head}"error": {_json_value(f"{type(error).__name__}: {error}")}}}\n'
+
+
+def account_of(line: str) -> str:
+    """Conta de uma linha JSONL, lendo só o campo account_id quando possível."""
+    # O processo principal só precisa da conta para escolher o shard; a linha inteira é lida no worker.
+    # Dentro de strings JSON as aspas vêm escapadas, então '"account_id"' só aparece como chave.
+    match = _ACCOUNT_ID.search(line) if line.count('"account_id"') == 1 else None
+    if match is None:
+        return json.loads(line)["account_id"]
+    plain = match.group(1)
+    return plain if plain is not None else json.loads(match.group(2))
+
+
+def _routing_key(line: str) -> str:
+    # Uma linha sem conta legível vai para qualquer shard, que escreve a linha de erro dela
+    try:
+        return account_of(line)
+    except (ValueError, KeyError, TypeError):
+        return ""
+
+
+def _json_value(value) -> str:
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if type(value) is int:
+        return str(value)
+    return json.dumps(value)
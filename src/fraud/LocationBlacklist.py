@@ -0,0 +1,59 @@
+from collections.abc import Iterable, Iterator
+from numbers import Integral
+from src.fraud.LocationInterner import LocationInterner
+
+
+class LocationBlacklist:
+    """
+    Lista negra de localizações com consulta por conjunto de ids internados.
+
+    Aceita tanto nomes quanto ids (qualquer inteiro, inclusive np.int64) em
+    `in`. O conteúdo pode ser trocado com replace() sem recriar o detector
+    que usa o objeto: o novo conjunto é montado à parte e publicado numa
+    única atribuição.
+    """
+
+    def __init__(self, locations: Iterable[str | int] = (), interner: LocationInterner | None = None):
+        self.interner = interner if interner is not None else LocationInterner()
+        self._ids: frozenset[int] = frozenset()
+        self.replace(locations)
+
+    def replace(self, locations: Iterable[str | int]) -> None:
+        """Substitui todo o conteúdo da lista negra."""
+        self._ids = frozenset(self._to_id(location) for location in locations)
+
+    @property
+    def ids(self) -> frozenset[int]:
+        """Conjunto atual de ids; um novo objeto é publicado a cada alteração."""
+        return self._ids
+
+    def names(self) -> list[str]:
+        """Nomes das localizações bloqueadas que passaram pelo internador."""
+        known = len(self.interner)
+        return [self.interner.name(location_id) for location_id in self._ids if location_id < known]
+
+    def add(self, location: str | int) -> None:
+        self._ids = self._ids | {self._to_id(location)}
+
+    def discard(self, location: str | int) -> None:
+        location_id = int(location) if isinstance(location, Integral) else self.interner.lookup(location)
+        if location_id is not None:
+            self._ids = self._ids - {location_id}
+
+    def __contains__(self, location: str | int) -> bool:
+        if isinstance(location, Integral):
+            return int(location) in self._ids
+        location_id = self.interner.lookup(location)
+        return location_id is not None and location_id in self._ids
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"LocationBlacklist(size={len(self)})"
+
+    def _to_id(self, location: str | int) -> int:
+        return int(location) if isinstance(location, Integral) else self.interner.intern(location)
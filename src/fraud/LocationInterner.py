@@ -0,0 +1,37 @@
+from src.fraud.Transaction import Transaction
+
+
+class LocationInterner:
+    """Associa cada nome de localização a um identificador inteiro estável."""
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def intern(self, location: str) -> int:
+        """Retorna o id da localização, criando um novo se ela ainda não existir."""
+        location_id = self._ids.get(location)
+        if location_id is None:
+            location_id = self._ids[location] = len(self._names)
+            self._names.append(location)
+        return location_id
+
+    def lookup(self, location: str) -> int | None:
+        """Retorna o id da localização sem registrá-la, ou None se for desconhecida."""
+        return self._ids.get(location)
+
+    def name(self, location_id: int) -> str:
+        return self._names[location_id]
+
+    def intern_transaction(self, transaction: Transaction) -> Transaction:
+        """Cria uma cópia da transação cuja localização é o id internado."""
+        location = transaction.location
+        if isinstance(location, str):
+            location = self.intern(location)
+        return Transaction(transaction.amount, transaction.timestamp, location)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"LocationInterner(size={len(self)})"
@@ -0,0 +1,45 @@
+from collections import deque
+
+
+class ServiceMetrics:
+    """Latência por requisição, tamanho dos lotes e profundidade da fila de um serviço."""
+
+    def __init__(self, window: int = 10000):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.batches = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+
+    def enqueued(self) -> None:
+        self.queue_depth += 1
+        if self.queue_depth > self.max_queue_depth:
+            self.max_queue_depth = self.queue_depth
+
+    def batch_done(self, latencies: list[float]) -> None:
+        self.batches += 1
+        self.requests += len(latencies)
+        self.queue_depth -= len(latencies)
+        self.latencies.extend(latencies)
+
+    def percentile(self, p: float) -> float:
+        """Percentil `p` (0-100) das latências recentes, em segundos."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * p / 100))
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+    def __repr__(self) -> str:
+        return f"ServiceMetrics({self.snapshot()})"
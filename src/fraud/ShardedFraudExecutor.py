@@ -0,0 +1,318 @@
+import multiprocessing
+import zlib
+from array import array
+from collections.abc import Callable, Iterable
+from src.common.epoch import from_epoch_microseconds, to_epoch_microseconds
+from src.fraud.AccountFraudDetectionSystem import AccountFraudDetectionSystem
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudRules import FraudRules
+from src.fraud.LocationBlacklist import LocationBlacklist
+from src.fraud.Transaction import Transaction
+
+LineHandler = Callable[[AccountFraudDetectionSystem, Iterable, list[str]], list[str]]
+
+_FRAUDULENT = 1
+_BLOCKED = 2
+_VERIFICATION = 4
+# rules_fired vai nos bits acima das flags; o bit mais alto indica que ele está presente
+_RULES_SHIFT = 3
+_HAS_RULES = 128
+
+
+class ShardedFraudExecutor:
+    """
+    Distribui contas entre processos, cada um dono da janela deslizante das suas contas.
+
+    As contas são particionadas por um hash estável (crc32) em `shards`
+    processos. Cada lote é dividido por shard, enviado pelos pipes em colunas
+    (arrays tipados em vez de objetos) e os resultados voltam como flags e
+    pontuações compactadas; a ordem dentro de cada conta é a ordem do lote.
+    Com `shards == 1` tudo roda no próprio processo, sem pipes, mas cada
+    transação passa pela mesma conversão das colunas (valor em float,
+    horário em UTC sem fuso; horários sem fuso são tratados como UTC), então
+    os dois caminhos dão o mesmo resultado para a mesma entrada.
+
+    Expõe o mesmo check_batch de AccountFraudDetectionSystem, então pode ser
+    usado como `system` do FraudCheckService. Um `line_handler` opcional
+    permite que os workers também processem linhas cruas (ver
+    FraudStreamPipeline).
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        blacklisted_locations: Iterable[str] | LocationBlacklist = (),
+        line_handler: LineHandler | None = None,
+        explain: bool = False,
+        rules: FraudRules | None = None,
+    ):
+        if shards < 1:
+            raise ValueError("shards deve ser pelo menos 1")
+        self.shards = shards
+        self.line_handler = line_handler
+        self._blacklist_source = None
+        self._blacklist_snapshot = None
+        self._connections = []
+        self._processes = []
+
+        entries = _blacklist_entries(blacklisted_locations)
+        if shards == 1:
+            self._system = AccountFraudDetectionSystem(explain, rules)
+            self._blacklist = entries
+            return
+
+        context = multiprocessing.get_context("spawn")
+        for _ in range(shards):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_shard_worker, args=(child, entries, line_handler, explain, rules), daemon=True
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def check_batch(
+        self,
+        items: list[tuple[str, Transaction]],
+        blacklisted_locations: Iterable[str] | LocationBlacklist | None = None,
+        return_exceptions: bool = False,
+    ) -> list[FraudCheckResult | Exception]:
+        """
+        Avalia pares (conta, transação) e devolve os resultados na ordem recebida.
+
+        Cada item é avaliado por conta própria: um item inválido (por exemplo
+        fora de ordem) não impede os demais, que atualizam o estado das suas
+        contas. Com `return_exceptions`, o erro de cada item ocupa a sua
+        posição na lista, como em asyncio.gather; sem ele, o primeiro erro é
+        levantado depois que o lote inteiro foi avaliado.
+
+        Se `blacklisted_locations` for informado e tiver mudado desde o último
+        lote, o novo conteúdo é enviado aos workers antes da avaliação.
+        """
+        if blacklisted_locations is not None:
+            self._sync_blacklist(blacklisted_locations)
+
+        if self.shards == 1:
+            results = _check_each(self._system, self._blacklist, items)
+        else:
+            results = self._check_sharded(items)
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def check_lines(self, lines: list[str], account_of: Callable[[str], str]) -> list[str]:
+        """
+        Repassa linhas cruas ao `line_handler` do shard de cada conta, preservando a ordem.
+
+        `account_of` extrai a conta de uma linha; só é chamado quando há mais de um shard.
+        """
+        if self.line_handler is None:
+            raise RuntimeError("Nenhum line_handler foi configurado")
+        if self.shards == 1:
+            return self.line_handler(self._system, self._blacklist, lines)
+
+        positions = self._partition(map(account_of, lines))
+        for connection, indexes in zip(self._connections, positions):
+            _send(connection, ("lines", [lines[index] for index in indexes]))
+
+        output: list[str] = [""] * len(lines)
+        for indexes, output_lines in zip(positions, self._gather()):
+            for index, output_line in zip(indexes, output_lines):
+                output[index] = output_line
+        return output
+
+    def close(self) -> None:
+        """Encerra os workers; levanta RuntimeError se algum deles terminou inesperadamente."""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except OSError:
+                # Pipe quebrado: o worker já morreu, o que é relatado abaixo
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        failed = [shard for shard, process in enumerate(self._processes) if process.exitcode != 0]
+        self._connections = []
+        self._processes = []
+        if failed:
+            raise RuntimeError(f"Shards terminaram inesperadamente: {failed}")
+
+    def __enter__(self) -> "ShardedFraudExecutor":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        try:
+            self.close()
+        except RuntimeError:
+            # Se o bloco já falhou (em geral pelo mesmo worker morto), o erro original prevalece
+            if exc_type is None:
+                raise
+
+    def _check_sharded(self, items: list[tuple[str, Transaction]]) -> list[FraudCheckResult | Exception]:
+        results: list[FraudCheckResult | Exception | None] = [None] * len(items)
+        # Monta as colunas de todos os shards antes de enviar: um item que não converte fica de fora
+        positions = self._partition(account_id for account_id, _ in items)
+        payloads = []
+        for indexes in positions:
+            sent, accounts, amounts, timestamps, locations = [], [], array("d"), array("q"), []
+            for index in indexes:
+                account_id, transaction = items[index]
+                try:
+                    amount, timestamp = _encode(transaction)
+                except Exception as error:
+                    results[index] = error
+                    continue
+                amounts.append(amount)
+                timestamps.append(timestamp)
+                sent.append(index)
+                accounts.append(account_id)
+                locations.append(transaction.location)
+            payloads.append((sent, ("batch", accounts, amounts, timestamps, locations)))
+        for connection, (_, message) in zip(self._connections, payloads):
+            _send(connection, message)
+
+        for (sent, _), (flags, scores, errors) in zip(payloads, self._gather()):
+            for position, (index, flag, score) in enumerate(zip(sent, flags, scores)):
+                if position in errors:
+                    results[index] = errors[position]
+                    continue
+                results[index] = FraudCheckResult(
+                    bool(flag & _FRAUDULENT), bool(flag & _BLOCKED), bool(flag & _VERIFICATION), score,
+                    (flag & ~_HAS_RULES) >> _RULES_SHIFT if flag & _HAS_RULES else None,
+                )
+        return results
+
+    def _gather(self) -> list:
+        # Lê a resposta de todos os shards antes de propagar um erro, mantendo os pipes em sincronia
+        replies = [_receive(shard, connection) for shard, connection in enumerate(self._connections)]
+        for status, payload in replies:
+            if status == "error":
+                raise payload
+        return [payload for _, payload in replies]
+
+    def _partition(self, account_ids: Iterable[str]) -> list[list[int]]:
+        shards = self.shards
+        positions: list[list[int]] = [[] for _ in range(shards)]
+        for index, account_id in enumerate(account_ids):
+            positions[shard_of(account_id, shards)].append(index)
+        return positions
+
+    def _sync_blacklist(self, blacklisted_locations) -> None:
+        # Uma LocationBlacklist publica um novo frozenset a cada alteração, então basta comparar identidade
+        if isinstance(blacklisted_locations, LocationBlacklist):
+            snapshot = blacklisted_locations.ids
+            unchanged = snapshot is self._blacklist_snapshot
+        else:
+            snapshot = frozenset(blacklisted_locations)
+            unchanged = snapshot == self._blacklist_snapshot
+        if unchanged and blacklisted_locations is self._blacklist_source:
+            return
+        self._blacklist_source = blacklisted_locations
+        self._blacklist_snapshot = snapshot
+
+        entries = _blacklist_entries(blacklisted_locations)
+        if self.shards == 1:
+            self._blacklist = entries
+        for connection in self._connections:
+            _send(connection, ("blacklist", entries))
+
+
+def shard_of(account_id: str, shards: int) -> int:
+    """Shard estável de uma conta (o hash() de str muda entre processos)."""
+    return zlib.crc32(str(account_id).encode()) % shards
+
+
+def _encode(transaction: Transaction) -> tuple[float, int]:
+    """Valor e horário como vão nas colunas: float e microssegundos em UTC."""
+    amount = transaction.amount
+    if isinstance(amount, (str, bytes)):
+        raise TypeError(f"O valor da transação deve ser numérico, não {type(amount).__name__}")
+    return float(amount), to_epoch_microseconds(transaction.timestamp)
+
+
+def _check_each(system: AccountFraudDetectionSystem, blacklist, items) -> list[FraudCheckResult | Exception]:
+    # Mesma conversão do caminho com shards, para que os dois aceitem e rejeitem as mesmas entradas
+    results = []
+    for account_id, transaction in items:
+        try:
+            amount, timestamp = _encode(transaction)
+            transaction = Transaction(amount, from_epoch_microseconds(timestamp), transaction.location)
+            results.append(system.check(account_id, transaction, blacklist))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
+def _send(connection, message) -> None:
+    try:
+        connection.send(message)
+    except OSError as error:
+        raise RuntimeError("Um shard terminou inesperadamente; o executor precisa ser recriado") from error
+
+
+def _receive(shard: int, connection):
+    try:
+        return connection.recv()
+    except (EOFError, OSError) as error:
+        raise RuntimeError(f"O shard {shard} terminou inesperadamente; o executor precisa ser recriado") from error
+
+
+def _blacklist_entries(blacklisted_locations) -> frozenset:
+    # Ids e nomes juntos: o worker não compartilha o internador do processo principal
+    if isinstance(blacklisted_locations, LocationBlacklist):
+        return blacklisted_locations.ids | frozenset(blacklisted_locations.names())
+    return frozenset(blacklisted_locations)
+
+
+def _shard_worker(
+    connection,
+    blacklist: frozenset,
+    line_handler: LineHandler | None,
+    explain: bool,
+    rules: FraudRules | None,
+) -> None:
+    system = AccountFraudDetectionSystem(explain, rules)
+    score_typecode = "q" if rules is None or rules.integral_scores else "d"
+    check = system.check
+
+    while (message := connection.recv()) is not None:
+        kind = message[0]
+        if kind == "blacklist":
+            blacklist = message[1]
+            continue
+
+        try:
+            if kind == "lines":
+                reply = line_handler(system, blacklist, message[1])
+            else:
+                _, accounts, amounts, timestamps, locations = message
+                flags = array("B")
+                scores = array(score_typecode)
+                # Erros por posição no lote do shard; os itens seguintes continuam sendo avaliados
+                errors = {}
+                for account_id, amount, timestamp, location in zip(accounts, amounts, timestamps, locations):
+                    transaction = Transaction(amount, from_epoch_microseconds(timestamp), location)
+                    try:
+                        result = check(account_id, transaction, blacklist)
+                    except Exception as error:
+                        errors[len(flags)] = error
+                        flags.append(0)
+                        scores.append(0)
+                        continue
+                    flags.append(
+                        (_FRAUDULENT if result.is_fraudulent else 0)
+                        | (_BLOCKED if result.is_blocked else 0)
+                        | (_VERIFICATION if result.verification_required else 0)
+                        | (0 if result.rules_fired is None else _HAS_RULES | result.rules_fired << _RULES_SHIFT)
+                    )
+                    scores.append(result.risk_score)
+                reply = (flags, scores, errors)
+        except Exception as error:
+            connection.send(("error", error))
+        else:
+            connection.send(("ok", reply))
+    connection.close()
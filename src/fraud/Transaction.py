@@ -1,7 +1,9 @@
 from datetime import datetime
 
 class Transaction:
-    def __init__(self, amount: float, timestamp: datetime, location: str):
+    __slots__ = ("amount", "timestamp", "location")
+
+    def __init__(self, amount: float, timestamp: datetime, location: str | int):
         self.amount = amount
         self.timestamp = timestamp
         self.location = location
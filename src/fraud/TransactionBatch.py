@@ -0,0 +1,67 @@
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import timezone
+from src.common.epoch import from_epoch_microseconds, to_epoch_microseconds
+from src.fraud.LocationInterner import LocationInterner
+from src.fraud.Transaction import Transaction
+
+class TransactionBatch:
+    """
+    Histórico de transações guardado em arrays tipados contíguos.
+
+    Valor, horário (microssegundos desde a época) e id de localização ficam em
+    três colunas `array`, em vez de um objeto por transação. O acesso por
+    índice devolve uma Transaction montada a partir das colunas, com a
+    localização já como id internado, e uma fatia devolve um sub-lote que
+    compartilha o interner.
+
+    Os horários são guardados em UTC. Um lote é todo de horários ingênuos ou
+    todo de horários com fuso; neste caso eles voltam com fuso UTC, o mesmo
+    instante do original (iguais pelo ==), mas não necessariamente o mesmo
+    tzinfo. Misturar os dois tipos levanta ValueError.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = (), interner: LocationInterner | None = None):
+        self.interner = interner if interner is not None else LocationInterner()
+        self.amounts = array("d")
+        self.timestamps = array("q")
+        self.location_ids = array("q")
+        self.aware: bool | None = None
+        for transaction in transactions:
+            self.append(transaction)
+
+    def append(self, transaction: Transaction) -> None:
+        location = transaction.location
+        if isinstance(location, str):
+            location = self.interner.intern(location)
+        aware = transaction.timestamp.tzinfo is not None
+        if self.aware is None:
+            self.aware = aware
+        elif aware != self.aware:
+            raise ValueError("O lote não aceita horários com e sem fuso misturados")
+        self.amounts.append(transaction.amount)
+        self.timestamps.append(to_epoch_microseconds(transaction.timestamp))
+        self.location_ids.append(location)
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __getitem__(self, index: int | slice) -> "Transaction | TransactionBatch":
+        if isinstance(index, slice):
+            batch = TransactionBatch(interner=self.interner)
+            batch.amounts = self.amounts[index]
+            batch.timestamps = self.timestamps[index]
+            batch.location_ids = self.location_ids[index]
+            batch.aware = self.aware
+            return batch
+        timestamp = from_epoch_microseconds(self.timestamps[index])
+        if self.aware:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return Transaction(self.amounts[index], timestamp, self.location_ids[index])
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"TransactionBatch(size={len(self)})"
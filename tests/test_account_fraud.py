@@ -0,0 +1,71 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.AccountFraudDetectionSystem import AccountFraudDetectionSystem
+
+
+@pytest.fixture
+def system():
+    """Cria uma instância do sistema com estado por conta antes de cada teste"""
+    return AccountFraudDetectionSystem()
+
+
+def _as_tuple(result):
+    return (result.is_fraudulent, result.is_blocked, result.verification_required, result.risk_score)
+
+
+def test_matches_stateless_check_for_random_streams(system):
+    """Verifica se o sistema com estado produz os mesmos resultados que check_for_fraud com o histórico completo."""
+    rng = random.Random(42)
+    stateless = FraudDetectionSystem()
+    blacklist = ["XX"]
+    histories = {"a": [], "b": [], "c": []}
+    clock = {account: datetime(2025, 1, 1) for account in histories}
+
+    for _ in range(600):
+        account = rng.choice(list(histories))
+        clock[account] += timedelta(minutes=rng.choice([0, 1, 3, 5, 29, 30, 31, 59, 60, 61, 120]))
+        tx = Transaction(rng.choice([100, 10000, 10001]), clock[account], rng.choice(["BR", "US", "XX"]))
+
+        expected = stateless.check_for_fraud(tx, histories[account], blacklist)
+        assert _as_tuple(system.check(account, tx, blacklist)) == _as_tuple(expected)
+        histories[account].append(tx)
+
+
+def test_frequent_transactions_are_blocked(system):
+    """Verifica se 11 transações ingeridas dentro de 60 minutos ativam o bloqueio."""
+    now = datetime(2025, 1, 1, 12, 0)
+    for i in range(11):
+        system.ingest("acc", Transaction(100, now - timedelta(minutes=50 - i), "BR"))
+    result = system.check("acc", Transaction(100, now, "BR"), [])
+    assert result.is_blocked is True
+    assert result.risk_score == 30
+
+
+def test_old_transactions_are_evicted(system):
+    """Verifica se transações a mais de 60 minutos saem da janela e não contam para a frequência."""
+    start = datetime(2025, 1, 1, 12, 0)
+    for i in range(11):
+        system.ingest("acc", Transaction(100, start + timedelta(seconds=i), "BR"))
+    result = system.check("acc", Transaction(100, start + timedelta(minutes=61), "BR"), [])
+    assert result.is_blocked is False
+    assert result.risk_score == 0
+
+
+def test_accounts_are_independent(system):
+    """Verifica se a mudança de localização só considera transações da mesma conta."""
+    now = datetime(2025, 1, 1, 12, 0)
+    system.ingest("a", Transaction(100, now - timedelta(minutes=5), "US"))
+    result = system.check("b", Transaction(100, now, "BR"), [])
+    assert result.is_fraudulent is False
+    assert len(system) == 2
+
+
+def test_out_of_order_transaction_raises(system):
+    """Verifica se uma transação mais antiga que a última da conta é rejeitada."""
+    now = datetime(2025, 1, 1, 12, 0)
+    system.ingest("acc", Transaction(100, now, "BR"))
+    with pytest.raises(ValueError):
+        system.check("acc", Transaction(100, now - timedelta(seconds=1), "BR"), [])
@@ -0,0 +1,52 @@
+import random
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.BatchFlightBookingSystem import BatchFlightBookingSystem
+
+
+@pytest.fixture
+def system():
+    return BatchFlightBookingSystem()
+
+
+def _random_requests(size=2000):
+    rng = random.Random(9)
+    now = datetime(2025, 1, 1, 8, 0)
+    requests = []
+    for _ in range(size):
+        requests.append((
+            rng.randint(1, 8),
+            now,
+            rng.randint(0, 8),
+            rng.choice([0.0, 99.99, 500.0, 1234.56]),
+            rng.randint(0, 150),
+            rng.random() < 0.3,
+            now + timedelta(hours=rng.choice([1, 23.99, 24, 47.5, 48, 72]), microseconds=rng.randint(0, 3)),
+            rng.choice([0, 1, 500, 100000]),
+        ))
+    return requests
+
+
+def test_quote_many_matches_book_flight_exactly(system):
+    requests = _random_requests()
+    columns = [list(column) for column in zip(*requests)]
+    batch = system.quote_many(*columns)
+
+    scalar = FlightBookingSystem()
+    for i, request in enumerate(requests):
+        expected = scalar.book_flight(*request)
+        assert batch.confirmation[i] == expected.confirmation
+        assert batch.total_price[i] == expected.total_price
+        assert batch.refund_amount[i] == expected.refund_amount
+        assert batch.points_used[i] == expected.points_used
+
+
+def test_quote_many_broadcasts_scalars(system):
+    departure = np.datetime64("2025-01-04T08:00")
+    batch = system.quote_many([1, 2, 5], np.datetime64("2025-01-01T08:00"), 4, 500.0, 10, False, departure, 0)
+    assert len(batch) == 3
+    assert list(batch.confirmation) == [True, True, False]
+    assert batch[1].total_price == pytest.approx(80.0)
+    assert batch[2].total_price == 0.0
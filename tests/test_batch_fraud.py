@@ -0,0 +1,118 @@
+import random
+import numpy as np
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.BatchFraudDetectionSystem import BatchFraudDetectionSystem
+from src.fraud.LocationBlacklist import LocationBlacklist
+
+EPOCH = datetime(1970, 1, 1)
+
+
+@pytest.fixture
+def system():
+    """Cria uma instância do sistema de avaliação em lote antes de cada teste"""
+    return BatchFraudDetectionSystem()
+
+
+def _random_columns(seed, size=800):
+    rng = random.Random(seed)
+    accounts, amounts, times, locations = [], [], [], []
+    clock = {account: datetime(2025, 1, 1) for account in range(5)}
+    for _ in range(size):
+        account = rng.randrange(5)
+        clock[account] += timedelta(minutes=rng.choice([0, 1, 2, 29, 30, 31, 59, 60, 61]),
+                                    microseconds=rng.choice([0, 0, 1]))
+        accounts.append(account)
+        amounts.append(rng.choice([100.0, 10000.0, 10000.5, 20000.0]))
+        times.append(clock[account])
+        locations.append(rng.randrange(4))
+    return accounts, amounts, times, locations
+
+
+def test_batch_matches_scalar_path(system):
+    """Verifica se o lote produz exatamente os mesmos resultados que check_for_fraud linha a linha."""
+    accounts, amounts, times, locations = _random_columns(7)
+    epoch_us = np.array([(t - EPOCH) // timedelta(microseconds=1) for t in times], dtype=np.int64)
+
+    batch = system.check_for_fraud_batch(amounts, epoch_us, locations, accounts, [3])
+
+    scalar = FraudDetectionSystem()
+    histories = {}
+    for i, account in enumerate(accounts):
+        tx = Transaction(amounts[i], times[i], locations[i])
+        history = histories.setdefault(account, [])
+        expected = scalar.check_for_fraud(tx, history, [3])
+        history.append(tx)
+        assert batch.is_fraudulent[i] == expected.is_fraudulent
+        assert batch.is_blocked[i] == expected.is_blocked
+        assert batch.verification_required[i] == expected.verification_required
+        assert batch.risk_score[i] == expected.risk_score
+
+
+def test_accepts_datetime64_and_string_locations(system):
+    """Verifica se horários datetime64 e localizações em texto são aceitos."""
+    now = np.datetime64("2025-01-01T12:00")
+    times = np.array([now - np.timedelta64(10, "m"), now], dtype="datetime64[us]")
+    result = system.check_for_fraud_batch([100, 20000], times, ["US", "BR"], ["a", "a"], [])
+    assert result[1].risk_score == 70
+    assert result[1].is_fraudulent is True
+    assert len(result) == 2
+
+
+def test_out_of_order_account_raises(system):
+    """Verifica se horários decrescentes dentro de uma conta são rejeitados."""
+    with pytest.raises(ValueError):
+        system.check_for_fraud_batch([1, 1], [10, 5], [0, 0], [1, 1], [])
+
+
+def test_batch_rules_fired_matches_scalar_path():
+    """Verifica se o detalhamento das regras no lote é igual ao do caminho escalar."""
+    accounts, amounts, times, locations = _random_columns(11, size=300)
+    batch = BatchFraudDetectionSystem(explain=True).check_for_fraud_batch(
+        amounts, np.array(times, dtype="datetime64[us]"), locations, accounts, [3]
+    )
+    scalar = FraudDetectionSystem(explain=True)
+    histories = {}
+    for i, account in enumerate(accounts):
+        tx = Transaction(amounts[i], times[i], locations[i])
+        history = histories.setdefault(account, [])
+        assert batch[i].rules_fired == scalar.check_for_fraud(tx, history, [3]).rules_fired
+        history.append(tx)
+
+
+def test_location_blacklist_matches_string_locations(system):
+    """Verifica se uma LocationBlacklist (ids internados) bloqueia localizações em texto e em ids."""
+    blacklist = LocationBlacklist(["Miami"])
+    now = np.array([0, 3_600_000_000], dtype=np.int64)
+
+    by_name = system.check_for_fraud_batch([100, 100], now, ["Miami", "Boston"], ["a", "b"], blacklist)
+    miami = blacklist.interner.lookup("Miami")
+    by_id = system.check_for_fraud_batch([100, 100], now, np.array([miami, miami + 1]), ["a", "b"], blacklist)
+
+    assert list(by_name.is_blocked) == [True, False]
+    assert list(by_id.is_blocked) == [True, False]
+
+
+def test_mixed_location_representations_are_rejected(system):
+    """Verifica se ids na lista negra e nomes no lote (ou o contrário) geram erro em vez de não casar."""
+    now = np.array([0], dtype=np.int64)
+    with pytest.raises(ValueError):
+        system.check_for_fraud_batch([100], now, ["Miami"], ["a"], [0])
+    with pytest.raises(ValueError):
+        system.check_for_fraud_batch([100], now, [0], ["a"], ["Miami"])
+
+
+def test_datetime_columns_match_epoch_microseconds(system):
+    """Verifica se datetimes, com ou sem fuso, dão o mesmo lote que os microssegundos da época."""
+    accounts, amounts, times, locations = _random_columns(9, size=200)
+    epoch_us = np.array([(t - EPOCH) // timedelta(microseconds=1) for t in times], dtype=np.int64)
+    brt = timezone(timedelta(hours=-3))
+    aware = [t.replace(tzinfo=timezone.utc).astimezone(brt) for t in times]
+
+    expected = system.check_for_fraud_batch(amounts, epoch_us, locations, accounts, [3])
+    for column in (times, aware):
+        batch = system.check_for_fraud_batch(amounts, column, locations, accounts, [3])
+        assert np.array_equal(batch.risk_score, expected.risk_score)
+        assert np.array_equal(batch.is_blocked, expected.is_blocked)
@@ -0,0 +1,38 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.BulkRefundProcessor import BulkRefundProcessor
+
+
+def _bookings(size):
+    rng = random.Random(2)
+    departure = datetime(2025, 1, 10, 8, 0)
+    bookings = [
+        (rng.randint(1, 6), departure - timedelta(hours=rng.choice([2, 24, 47.9, 48, 100])),
+         rng.choice([120.0, 500.0]), rng.randint(0, 150), rng.choice([0, 300]))
+        for _ in range(size)
+    ]
+    return departure, bookings
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_refunds_match_book_flight_cancellations(workers):
+    departure, bookings = _bookings(250)
+    processor = BulkRefundProcessor(chunk_size=40, workers=workers)
+    results = list(processor.process(iter(bookings), departure))
+
+    scalar = FlightBookingSystem()
+    assert len(results) == len(bookings)
+    for result, (passengers, time, price, sales, points) in zip(results, bookings):
+        expected = scalar.book_flight(passengers, time, passengers, price, sales, True, departure, points)
+        assert result.refund_amount == expected.refund_amount
+        assert result.confirmation is False
+        assert result.total_price == 0
+        assert result.points_used is False
+
+
+def test_refund_batches_are_bounded_by_chunk_size():
+    departure, bookings = _bookings(25)
+    sizes = [len(batch) for batch in BulkRefundProcessor(chunk_size=10).refund_batches(bookings, departure)]
+    assert sizes == [10, 10, 5]
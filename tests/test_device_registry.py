@@ -0,0 +1,69 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceRegistry import DeviceRegistry
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+NAMES = ["Security", "Refrigerator", "Heating", "Cooling", "Lights", "Oven", "Washer", "TV", "Dryer"]
+
+
+def test_registry_path_matches_dict_path():
+    rng = random.Random(11)
+    system = SmartEnergyManagementSystem()
+    for _ in range(500):
+        priorities = {name: rng.randint(1, 3) for name in rng.sample(NAMES, rng.randint(0, len(NAMES)))}
+        registry = DeviceRegistry(priorities, scheduled_devices=rng.choice([(), ("Pump",)]))
+        now = datetime(2025, 1, 1, rng.choice([2, 12, 23]), 0)
+        schedules = [DeviceSchedule(rng.choice(NAMES + ["Pump"]), now + timedelta(minutes=rng.choice([0, 5])))
+                     for _ in range(rng.randint(0, 3))]
+        arguments = (rng.choice([0.2, 0.8]), 0.5)
+        rest = (now, rng.choice([15.0, 21.0, 26.0]), (19.0, 23.0), 20.0, rng.choice([0.0, 20.0, 21.5, 40.0]), schedules)
+
+        expected = system.manage_energy(*arguments, priorities, *rest)
+        result = system.manage_energy(*arguments, registry, *rest)
+        assert result.device_status == expected.device_status
+        assert dict(result.device_status) == expected.device_status
+        assert result.energy_saving_mode == expected.energy_saving_mode
+        assert result.temperature_regulation_active == expected.temperature_regulation_active
+        assert result.total_energy_used == expected.total_energy_used
+
+
+def test_status_view_behaves_like_a_read_only_dict():
+    registry = DeviceRegistry({"Security": 1, "Oven": 3})
+    result = SmartEnergyManagementSystem().manage_energy(
+        0.8, 0.5, registry, datetime(2025, 1, 1, 12, 0), 26.0, (19.0, 23.0), 100.0, 0.0, []
+    )
+    status = result.device_status
+
+    assert status == {"Security": True, "Oven": False, "Cooling": True}
+    assert len(status) == 3
+    assert "Heating" not in status
+    assert status.get("Heating") is None
+    with pytest.raises(KeyError):
+        status["Heating"]
+    with pytest.raises(TypeError):
+        status["Oven"] = True
+    assert dict(registry) == {"Security": 1, "Oven": 3}
+
+
+def test_unknown_scheduled_device_does_not_change_registry():
+    registry = DeviceRegistry({"Security": 1})
+    names, bits = list(registry.names), dict(registry.bits)
+    now = datetime(2025, 1, 1, 12, 0)
+    result = SmartEnergyManagementSystem().manage_energy(
+        0.2, 0.5, registry, now, 21.0, (19.0, 23.0), 100.0, 0.0, [DeviceSchedule("Pump", now)]
+    )
+
+    assert result.device_status == {"Security": True, "Heating": False, "Cooling": False, "Pump": True}
+    assert list(result.device_status)[-1] == "Pump"
+    assert registry.names == names and registry.bits == bits
+    assert registry.bit_of("Pump") == 0
+
+
+def test_scheduled_devices_get_bits_without_being_installed():
+    registry = DeviceRegistry({"Security": 1}, scheduled_devices=["Pump"])
+
+    assert registry.bit_of("Pump")
+    assert not registry.installed_mask & registry.bit_of("Pump")
+    assert dict(registry) == {"Security": 1}
@@ -1,4 +1,7 @@
 import pytest
+import random
+from datetime import datetime
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
 from src.energy.EnergyManagementResult import EnergyManagementResult 
 
 def test_energy_management_result_integrity():
@@ -30,4 +33,46 @@ def test_energy_management_result_integrity():
     assert f"energy_saving_mode={expected_saving_mode}" in repr_string
     assert f"temperature_regulation_active={expected_temp_active}" in repr_string
     assert f"total_energy_used={expected_total_used}" in repr_string
-    assert "XX" not in repr_string
\ No newline at end of file
+    assert "XX" not in repr_string
+
+def _shed_with_rescan_loop(device_status, device_priorities, total_energy_used_today, energy_usage_limit):
+    """Laço de corte anterior, que refazia a lista de candidatos a cada volta."""
+    devices_were_on = True
+    while total_energy_used_today >= energy_usage_limit and devices_were_on:
+        devices_to_turn_off = [
+            device for device, priority in device_priorities.items()
+            if device_status.get(device, False) and priority > 1
+        ]
+        if not devices_to_turn_off:
+            devices_were_on = False
+            continue
+        for device in devices_to_turn_off:
+            if total_energy_used_today < energy_usage_limit:
+                break
+            device_status[device] = False
+            total_energy_used_today -= 1
+    return device_status, total_energy_used_today
+
+
+def test_single_pass_shedding_matches_previous_loop():
+    """
+    Testa que o corte em uma passada dá o mesmo resultado do laço anterior.
+    """
+    rng = random.Random(7)
+    system = SmartEnergyManagementSystem()
+    for _ in range(300):
+        priorities = {f"D{i}": rng.randint(1, 3) for i in range(rng.randint(0, 15))}
+        limit = rng.choice([5.0, 20.0, 20.5])
+        total = rng.choice([0.0, 19.5, 20.0, 23.25, 40.0])
+        price = rng.choice([0.2, 0.8])
+        result = system.manage_energy(
+            price, 0.5, priorities, datetime(2025, 1, 1, 12, 0),
+            21.0, (19.0, 23.0), limit, total, [],
+        )
+
+        status = {device: price <= 0.5 or priority <= 1 for device, priority in priorities.items()}
+        status["Heating"] = False
+        status["Cooling"] = False
+        expected_status, expected_total = _shed_with_rescan_loop(status, priorities, total, limit)
+        assert result.device_status == expected_status
+        assert result.total_energy_used == expected_total
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.EnergySimulator import EnergySimulator
+
+START = datetime(2025, 1, 1, 0, 0)
+PRIORITIES = {"Security": 1, "Refrigerator": 1, "Heating": 2, "Lights": 2, "Oven": 3, "TV": 1}
+SCHEDULES = [DeviceSchedule("Oven", START + timedelta(hours=7)),
+             DeviceSchedule("Pump", START + timedelta(days=1, hours=23, minutes=30)),
+             DeviceSchedule("Lights", START + timedelta(hours=5, seconds=30))]
+
+
+def _series(steps):
+    rng = np.random.default_rng(1)
+    prices = np.repeat(rng.choice([0.2, 0.5, 0.7], steps // 30 + 1), 30)[:steps]
+    temperatures = np.repeat(rng.choice([16.0, 19.0, 21.0, 23.0, 25.0], steps // 45 + 1), 45)[:steps]
+    energy_used = np.minimum(np.arange(steps) % 1440 * 0.03, 40.0)
+    return prices, temperatures, energy_used
+
+
+def _simulator(chunk_size=1000):
+    return EnergySimulator(PRIORITIES, 0.5, (19.0, 23.0), 30.0, SCHEDULES, chunk_size=chunk_size)
+
+
+def test_simulation_matches_manage_energy_every_step():
+    prices, temperatures, energy_used = _series(3 * 1440)
+    result = _simulator().run(START, prices, temperatures, energy_used)
+
+    system = SmartEnergyManagementSystem()
+    assert len(result) == len(prices)
+    for index in range(len(prices)):
+        expected = system.manage_energy(prices[index], 0.5, PRIORITIES, START + timedelta(minutes=index),
+                                        temperatures[index], (19.0, 23.0), 30.0, energy_used[index], SCHEDULES)
+        step = result[index]
+        assert step.device_status == expected.device_status
+        assert step.energy_saving_mode == expected.energy_saving_mode
+        assert step.temperature_regulation_active == expected.temperature_regulation_active
+        assert step.total_energy_used == expected.total_energy_used
+
+
+def test_csv_and_npy_inputs_match_in_memory_run(tmp_path):
+    prices, temperatures, energy_used = _series(2000)
+    expected = _simulator().run(START, prices, temperatures, energy_used)
+
+    csv_path = tmp_path / "series.csv"
+    with open(csv_path, "w", encoding="utf-8") as file:
+        file.write("temperature,price,energy_used\n")
+        for row in zip(temperatures, prices, energy_used):
+            file.write(",".join(repr(float(value)) for value in row) + "\n")
+    paths = []
+    for name, values in (("prices", prices), ("temperatures", temperatures), ("energy", energy_used)):
+        paths.append(tmp_path / f"{name}.npy")
+        np.save(paths[-1], values)
+
+    for result in (_simulator(chunk_size=333).run_csv(csv_path, START), _simulator().run_npy(START, *paths)):
+        assert np.array_equal(result.status_bits, expected.status_bits)
+        assert np.array_equal(result.present_bits, expected.present_bits)
+        assert np.array_equal(result.total_energy_used, expected.total_energy_used)
+    assert expected.device_status("Oven")[7 * 60]
+
+
+def test_mismatched_series_are_rejected():
+    with pytest.raises(ValueError):
+        _simulator().run(START, [0.1, 0.2], [20.0], [1.0, 2.0])
+
+
+def test_aware_start_time_uses_the_local_clock():
+    brt = timezone(timedelta(hours=-3))
+    start = START.replace(tzinfo=brt)
+    schedules = [DeviceSchedule("Oven", start + timedelta(hours=7)),
+                 DeviceSchedule("Lights", (start + timedelta(hours=23, minutes=10)).astimezone(timezone.utc))]
+    prices, temperatures, energy_used = _series(1440)
+    result = EnergySimulator(PRIORITIES, 0.5, (19.0, 23.0), 30.0, schedules).run(start, prices, temperatures, energy_used)
+
+    system = SmartEnergyManagementSystem()
+    for index in range(len(prices)):
+        expected = system.manage_energy(prices[index], 0.5, PRIORITIES, start + timedelta(minutes=index),
+                                        temperatures[index], (19.0, 23.0), 30.0, energy_used[index], schedules)
+        assert result[index].device_status == expected.device_status
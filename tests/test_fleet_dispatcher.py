@@ -0,0 +1,63 @@
+import multiprocessing
+import numpy as np
+import pytest
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from src.energy.FleetEnergyDispatcher import FleetEnergyDispatcher
+from src.energy.FleetEnergyManagementSystem import FleetEnergyManagementSystem
+
+CATALOG = ["Security", "Refrigerator", "Heating", "Lights", "Oven", "Washer", "TV", "Dryer", "Pump"]
+NOW = datetime(2025, 1, 1, 18, 0)
+
+
+def _fleet_inputs(fleet, homes):
+    rng = np.random.default_rng(homes)
+    installed = rng.random((homes, len(fleet.device_names))) < 0.7
+    return (
+        rng.choice([0.3, 0.8], homes), 0.5, rng.integers(1, 4, installed.shape), installed, NOW,
+        rng.choice([15.0, 21.0, 26.0], homes), (19.0, 23.0), 20.0, rng.choice([0.0, 20.0, 40.0], homes),
+        rng.random(installed.shape) < 0.05,
+    )
+
+
+@pytest.fixture(scope="module")
+def dispatcher():
+    with FleetEnergyDispatcher(CATALOG, workers=2, partitions_per_worker=3) as dispatcher:
+        yield dispatcher
+
+
+def test_dispatch_matches_single_process_fleet(dispatcher):
+    inputs = _fleet_inputs(dispatcher.fleet, 1001)
+    expected = FleetEnergyManagementSystem(CATALOG).manage_fleet(*inputs)
+    result = dispatcher.dispatch(*inputs)
+
+    assert result.missed_partitions == []
+    assert np.array_equal(result.device_status, expected.device_status)
+    assert np.array_equal(result.present, expected.present)
+    assert np.array_equal(result.energy_saving_mode, expected.energy_saving_mode)
+    assert np.array_equal(result.temperature_regulation_active, expected.temperature_regulation_active)
+    assert np.array_equal(result.total_energy_used, expected.total_energy_used)
+
+
+def test_missed_deadline_reports_partitions():
+    # Um pool injetado permite ocupar os workers para que nenhuma partição termine antes do prazo
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        dispatcher = FleetEnergyDispatcher(CATALOG, workers=2, partitions_per_worker=3, executor=pool)
+        inputs = _fleet_inputs(dispatcher.fleet, 600)
+        busy = [pool.submit(time.sleep, 0.3) for _ in range(2)]
+        result = dispatcher.dispatch(*inputs, deadline=0.0)
+        for future in busy:
+            future.result()
+
+        assert len(result.missed_partitions) == 6
+        for start, stop in result.missed_partitions:
+            assert np.isnan(result.total_energy_used[start:stop]).all()
+            assert not result.device_status[start:stop].any()
+
+        # As partições atrasadas da chamada anterior não atrapalham a seguinte
+        expected = FleetEnergyManagementSystem(CATALOG).manage_fleet(*inputs)
+        following = dispatcher.dispatch(*inputs, deadline=30.0)
+        assert following.missed_partitions == []
+        assert np.array_equal(following.total_energy_used, expected.total_energy_used)
+        dispatcher.close()
@@ -0,0 +1,51 @@
+import random
+import numpy as np
+import pytest
+from datetime import datetime
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.FleetEnergyManagementSystem import FleetEnergyManagementSystem
+
+CATALOG = ["Security", "Refrigerator", "Heating", "Lights", "Oven", "Washer", "TV", "Dryer"]
+
+
+@pytest.mark.parametrize("hour", [3, 12, 23])
+@pytest.mark.parametrize("price", [0.3, 0.8])
+def test_fleet_matches_manage_energy_per_home(hour, price):
+    rng = random.Random(hour * 10 + int(price * 10))
+    fleet = FleetEnergyManagementSystem(CATALOG)
+    now = datetime(2025, 1, 1, hour, 0)
+    homes = [{device: rng.randint(1, 3) for device in CATALOG if rng.random() < 0.7} for _ in range(200)]
+    temperatures = np.array([rng.choice([15.0, 19.0, 21.0, 23.0, 26.0]) for _ in homes])
+    limits = np.array([rng.choice([5.0, 20.0, 20.5]) for _ in homes])
+    totals = np.array([rng.choice([0.0, 19.5, 20.0, 22.25, 40.0]) for _ in homes])
+    due = np.zeros((len(homes), len(fleet.device_names)), dtype=bool)
+    schedules = []
+    for home in range(len(homes)):
+        names = rng.sample(fleet.device_names, rng.randint(0, 2))
+        schedules.append([DeviceSchedule(name, now) for name in names])
+        due[home, [fleet.columns[name] for name in names]] = True
+
+    priorities, installed = fleet.priority_matrix(homes)
+    batch = fleet.manage_fleet(price, 0.5, priorities, installed, now, temperatures,
+                               (np.full(len(homes), 19.0), np.full(len(homes), 23.0)), limits, totals, due)
+
+    system = SmartEnergyManagementSystem()
+    assert len(batch) == len(homes)
+    for home, device_priorities in enumerate(homes):
+        expected = system.manage_energy(price, 0.5, device_priorities, now, temperatures[home], (19.0, 23.0),
+                                        limits[home], totals[home], schedules[home])
+        result = batch[home]
+        assert result.device_status == expected.device_status
+        assert result.energy_saving_mode == expected.energy_saving_mode
+        assert result.temperature_regulation_active == expected.temperature_regulation_active
+        assert result.total_energy_used == expected.total_energy_used
+
+
+def test_priority_matrix_rejects_unknown_or_reordered_devices():
+    fleet = FleetEnergyManagementSystem(["Lights", "Oven"])
+    assert fleet.device_names == ["Lights", "Oven", "Heating", "Cooling"]
+    with pytest.raises(ValueError):
+        fleet.priority_matrix([{"Oven": 2, "Lights": 1}])
+    with pytest.raises(ValueError):
+        fleet.priority_matrix([{"Sauna": 2}])
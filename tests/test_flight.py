@@ -236,3 +236,19 @@ def test_kill_mutants_53_54_full_refund_at_exactly_48_hours(system):
     result = system.book_flight(passengers, booking_time, 10, current_price, previous_sales, True, departure_time, 0)
    
     assert result.refund_amount == pytest.approx(expected_refund_base if expected_refund_base > 0 else 0.0)
+
+def test_booking_result_is_immutable(system):
+    result = system.book_flight(1, datetime.now(), 10, 500.0, 10, False, datetime.now() + timedelta(hours=72), 0)
+
+    with pytest.raises(AttributeError):
+        result.total_price = 0.0
+    with pytest.raises(AttributeError):
+        result.discount = 0.1
+
+def test_seat_rejection_returns_shared_singleton(system):
+    first = system.book_flight(5, datetime.now(), 2, 500.0, 10, False, datetime.now(), 0)
+    second = system.book_flight(9, datetime.now(), 0, 120.0, 80, True, datetime.now(), 500)
+
+    assert first is BookingResult.REJECTED
+    assert second is BookingResult.REJECTED
+    assert first == BookingResult(False, 0.0, 0.0, False)
@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, timedelta
 from src.fraud.Transaction import Transaction
 from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.FraudCheckResult import FraudCheckResult
 
 @pytest.fixture
 def system():
@@ -119,4 +120,29 @@ def test_frequent_transactions_limit_case(system):
     result = system.check_for_fraud(tx_current, prev_all, []) 
     
     assert result.is_blocked is False
-    assert result.risk_score == 0
\ No newline at end of file
+    assert result.risk_score == 0
+
+def test_rules_fired_is_off_by_default(system):
+    """Verifica se o detalhamento das regras não é gerado quando explain está desligado."""
+    result = system.check_for_fraud(Transaction(20000, datetime.now(), "BR"), [], [])
+    assert result.rules_fired is None
+    assert result.explain() is None
+
+
+def test_rules_fired_breakdown():
+    """Verifica se o detalhamento lista exatamente as regras que compõem o risco de 70."""
+    system = FraudDetectionSystem(explain=True)
+    now = datetime.now()
+    last = [Transaction(100, now - timedelta(minutes=10), "US")]
+    result = system.check_for_fraud(Transaction(20000, now, "BR"), last, [])
+    assert result.risk_score == 70
+    assert result.explain() == ["amount", "location"]
+    assert "rules_fired=['amount', 'location']" in repr(result)
+
+
+def test_rules_fired_marks_blacklist_override():
+    """Verifica se a substituição do risco pela lista negra aparece no detalhamento."""
+    system = FraudDetectionSystem(explain=True)
+    result = system.check_for_fraud(Transaction(20000, datetime.now(), "US"), [], ["US"])
+    assert result.risk_score == 100
+    assert result.rules_fired == FraudCheckResult.RULE_AMOUNT | FraudCheckResult.RULE_BLACKLIST
@@ -0,0 +1,101 @@
+import random
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.AccountFraudDetectionSystem import AccountFraudDetectionSystem
+from src.fraud.BatchFraudDetectionSystem import BatchFraudDetectionSystem
+from src.fraud.FraudRules import FraudRules
+
+
+def _as_tuple(result):
+    return (result.is_fraudulent, result.is_blocked, result.verification_required,
+            result.risk_score, result.rules_fired)
+
+
+def _stream(seed=5, size=400):
+    rng = random.Random(seed)
+    clock = datetime(2025, 1, 1)
+    history = []
+    for _ in range(size):
+        clock += timedelta(minutes=rng.choice([0, 1, 4, 9, 10, 11, 29, 30, 31]))
+        tx = Transaction(rng.choice([100, 5000, 10000, 10001]), clock, rng.choice(["BR", "US", "XX"]))
+        yield tx, list(history)
+        history.append(tx)
+
+
+def test_default_rules_match_hard_coded_checks():
+    """Verifica se as regras compiladas a partir da definição padrão são idênticas às regras fixas."""
+    hard_coded = FraudDetectionSystem(explain=True)
+    compiled = FraudDetectionSystem(explain=True, rules=FraudRules())
+    for tx, history in _stream():
+        assert _as_tuple(compiled.check_for_fraud(tx, history, ["XX"])) == \
+            _as_tuple(hard_coded.check_for_fraud(tx, history, ["XX"]))
+
+
+def test_custom_thresholds_from_json():
+    """Verifica se limites definidos em JSON mudam as regras e as janelas de tempo."""
+    rules = FraudRules.from_json(
+        '{"amount": {"threshold": 500, "points": 40}, "velocity": {"window_minutes": 10, "max_count": 1}}'
+    )
+    system = AccountFraudDetectionSystem(rules=rules)
+    now = datetime(2025, 1, 1, 12, 0)
+    system.ingest("a", Transaction(1, now - timedelta(minutes=11), "BR"))
+    system.ingest("a", Transaction(1, now - timedelta(minutes=9), "BR"))
+    system.ingest("a", Transaction(1, now - timedelta(minutes=8), "BR"))
+    result = system.check("a", Transaction(600, now, "BR"), [])
+    assert result.risk_score == 70
+    assert result.is_blocked is True
+
+
+def test_disabled_rule_never_fires():
+    """Verifica se uma regra definida como null é removida da função compilada."""
+    system = FraudDetectionSystem(rules=FraudRules({"blacklist": None}))
+    result = system.check_for_fraud(Transaction(100, datetime.now(), "US"), [], ["US"])
+    assert result.is_blocked is False
+    assert result.risk_score == 0
+
+
+def test_batch_honours_rules():
+    """Verifica se o caminho em lote usa os mesmos limites configurados, inclusive pontuações fracionárias."""
+    rules = FraudRules({"amount": {"threshold": 5000, "points": 12.5}, "location": {"window_minutes": 10}})
+    batch = BatchFraudDetectionSystem(rules=rules)
+    scalar = FraudDetectionSystem(rules=rules)
+    stream = list(_stream(size=200))
+    result = batch.check_for_fraud_batch(
+        [tx.amount for tx, _ in stream],
+        np.array([tx.timestamp for tx, _ in stream], dtype="datetime64[us]"),
+        [tx.location for tx, _ in stream],
+        ["acc"] * len(stream),
+        ["XX"],
+    )
+    for i, (tx, history) in enumerate(stream):
+        assert result[i].risk_score == scalar.check_for_fraud(tx, history, ["XX"]).risk_score
+
+
+@pytest.mark.parametrize("definition", [
+    {"unknown": {}},
+    {"amount": {"limit": 5}},
+    {"amount": {"threshold": "10000"}},
+    {"velocity": {"points": float("inf")}},
+    {"amount": 500},
+    {"location": [30, 20]},
+    ["amount"],
+    {"velocity": {"window_minutes": 0}},
+    {"location": {"window_minutes": -30}},
+    {"amount": {"threshold": -1}},
+    {"velocity": {"max_count": -1}},
+    {"blacklist": {"score": -100}},
+])
+def test_invalid_definitions_raise(definition):
+    """Verifica se definições com regras, campos ou valores inválidos são rejeitadas."""
+    with pytest.raises(ValueError):
+        FraudRules(definition)
+
+
+def test_zero_threshold_is_valid():
+    """Verifica se limites iguais a zero são aceitos (qualquer valor positivo dispara a regra)."""
+    rules = FraudRules({"amount": {"threshold": 0}, "velocity": {"max_count": 0}})
+    result = FraudDetectionSystem(rules=rules).check_for_fraud(Transaction(1, datetime.now(), "BR"), [], [])
+    assert result.risk_score == 50
@@ -0,0 +1,123 @@
+import asyncio
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudCheckService import FraudCheckService
+
+
+async def _check_all(service, requests):
+    async with service:
+        return await asyncio.gather(*(service.check(account, tx) for account, tx in requests))
+
+
+def _requests():
+    now = datetime(2025, 1, 1, 12, 0)
+    return [
+        ("a", Transaction(100, now, "US")),
+        ("a", Transaction(100, now + timedelta(minutes=5), "BR")),
+        ("b", Transaction(20000, now, "BR")),
+        ("c", Transaction(100, now, "Miami")),
+    ]
+
+
+def test_concurrent_checks_are_batched_in_order():
+    """Verifica se requisições concorrentes são agrupadas e cada uma recebe o próprio resultado."""
+    service = FraudCheckService(blacklisted_locations=["Miami"], max_batch_size=3, max_wait_ms=50)
+    results = asyncio.run(_check_all(service, _requests()))
+
+    assert [result.risk_score for result in results] == [0, 20, 50, 100]
+    metrics = service.metrics.snapshot()
+    assert metrics["requests"] == 4
+    assert metrics["batches"] == 2
+    assert metrics["queue_depth"] == 0
+    assert metrics["max_queue_depth"] == 4
+    assert metrics["p99_ms"] >= metrics["p50_ms"] >= 0
+
+
+def test_executor_evaluates_outside_event_loop():
+    """Verifica se a avaliação em um executor de threads produz os mesmos resultados."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        service = FraudCheckService(blacklisted_locations=["Miami"], executor=executor)
+        results = asyncio.run(_check_all(service, _requests()))
+    assert [result.risk_score for result in results] == [0, 20, 50, 100]
+
+
+def test_evaluation_errors_reach_callers():
+    """Verifica se um erro na avaliação do lote é propagado para quem chamou check()."""
+    async def scenario():
+        async with FraudCheckService() as service:
+            now = datetime(2025, 1, 1)
+            await service.check("a", Transaction(100, now, "BR"))
+            with pytest.raises(ValueError):
+                await service.check("a", Transaction(100, now - timedelta(minutes=1), "BR"))
+
+    asyncio.run(scenario())
+
+
+def test_check_requires_running_service():
+    """Verifica se check() falha quando o serviço não foi iniciado."""
+    with pytest.raises(RuntimeError):
+        asyncio.run(FraudCheckService().check("a", Transaction(1, datetime.now(), "BR")))
+
+
+def test_bad_item_fails_only_its_own_request():
+    """Verifica se um item fora de ordem no lote não rejeita as requisições válidas de outras contas."""
+    async def scenario(service):
+        now = datetime(2025, 1, 1)
+        async with service:
+            await service.check("a", Transaction(100, now, "BR"))
+            return await asyncio.gather(
+                service.check("b", Transaction(100, now, "BR")),
+                service.check("a", Transaction(100, now - timedelta(minutes=1), "BR")),
+                service.check("c", Transaction(20000, now, "BR")),
+                return_exceptions=True,
+            )
+
+    service = FraudCheckService(max_batch_size=3, max_wait_ms=50)
+    b, a, c = asyncio.run(scenario(service))
+    assert isinstance(a, ValueError)
+    assert (b.risk_score, c.risk_score) == (0, 50)
+    # A transação de b foi avaliada e guardada uma única vez
+    assert service.system.check("b", Transaction(100, datetime(2025, 1, 1, 0, 1), "US"), []).risk_score == 20
+
+
+class _SlowSystem:
+    def check_batch(self, items, blacklisted_locations, return_exceptions=False):
+        time.sleep(0.2)
+        return [None] * len(items)
+
+
+def test_default_evaluation_does_not_block_event_loop():
+    """Verifica se, sem executor, um lote lento não trava as outras corrotinas."""
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        async with FraudCheckService(_SlowSystem(), max_wait_ms=0) as service:
+            await service.check("a", Transaction(1, datetime(2025, 1, 1), "BR"))
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(scenario()) >= 5
+
+
+def test_cancelled_service_cancels_pending_requests():
+    """Verifica se cancelar o serviço no meio de um lote cancela as requisições em vez de deixá-las pendentes."""
+    async def scenario():
+        service = FraudCheckService(_SlowSystem(), max_batch_size=1, max_wait_ms=0)
+        await service.start()
+        requests = [asyncio.create_task(service.check(account, Transaction(1, datetime(2025, 1, 1), "BR")))
+                    for account in "ab"]
+        await asyncio.sleep(0.05)
+        service._worker.cancel()
+        return await asyncio.wait_for(asyncio.gather(*requests, return_exceptions=True), 1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in asyncio.run(scenario()))
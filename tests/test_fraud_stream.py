@@ -0,0 +1,91 @@
+import io
+import json
+import pytest
+from datetime import datetime, timedelta
+from src.common.iteration import chunked
+from src.fraud.FraudStreamPipeline import FraudStreamPipeline, account_of
+
+
+def _feed():
+    start = datetime(2025, 1, 1, 12, 0)
+    records = [
+        {"id": 1, "account_id": "a", "amount": 100, "timestamp": start.isoformat(), "location": "US"},
+        {"id": 2, "account_id": "b", "amount": 20000, "timestamp": start.isoformat(), "location": "BR"},
+        {"id": 3, "account_id": "a", "amount": 20000,
+         "timestamp": (start + timedelta(minutes=10)).isoformat(), "location": "BR"},
+        {"id": 4, "account_id": "b", "amount": 100,
+         "timestamp": (start + timedelta(minutes=40)).isoformat(), "location": "Miami"},
+    ]
+    return "".join(json.dumps(record) + "\n" for record in records) + "\n"
+
+
+def _run(pipeline):
+    sink = io.StringIO()
+    count = pipeline.run(io.StringIO(_feed()), sink)
+    return count, [json.loads(line) for line in sink.getvalue().splitlines()]
+
+
+def test_stream_outputs_one_result_per_record():
+    """Verifica se cada registro gera um resultado na mesma ordem, com o estado por conta."""
+    count, results = _run(FraudStreamPipeline(["Miami"], chunk_size=3))
+    assert count == 4
+    assert [result["id"] for result in results] == [1, 2, 3, 4]
+    assert [result["risk_score"] for result in results] == [0, 50, 70, 100]
+    assert results[3]["is_blocked"] is True
+    assert results[2]["account_id"] == "a"
+
+
+def test_workers_produce_same_output():
+    """Verifica se dividir as contas entre processos gera exatamente a mesma saída."""
+    assert _run(FraudStreamPipeline(["Miami"], workers=2)) == _run(FraudStreamPipeline(["Miami"]))
+
+
+def test_chunked_is_lazy_and_bounded():
+    """Verifica se chunked divide o iterável em blocos de tamanho limitado."""
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_invalid_options_raise():
+    """Verifica se tamanhos de bloco ou números de workers inválidos são rejeitados."""
+    with pytest.raises(ValueError):
+        FraudStreamPipeline(chunk_size=0)
+    with pytest.raises(ValueError):
+        FraudStreamPipeline(workers=0)
+
+
+def test_account_of_matches_full_parse():
+    """Verifica se a conta extraída sem decodificar a linha inteira é a mesma de json.loads."""
+    records = [
+        {"account_id": "a", "location": "BR"},
+        {"account_id": 42, "amount": 1},
+        {"account_id": "c\"d", "location": "\"account_id\": \"x\""},
+        {"meta": {"account_id": "q"}, "account_id": "r"},
+        {"account_id": 1.5},
+        {"account_id": "ã"},
+    ]
+    for record in records:
+        line = json.dumps(record)
+        assert account_of(line) == record["account_id"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bad_records_become_error_lines(workers):
+    """Verifica se registros inválidos viram linhas de erro sem derrubar o stream nem os vizinhos."""
+    lines = [
+        '{"id": 1, "account_id": "a", "amount": 100, "timestamp": "2025-01-01T12:00:00", "location": "BR"}\n',
+        '{"id": 2, "account_id": "a", "amount": \n',
+        '{"id": 3, "account_id": "a", "amount": 100, "timestamp": "2025-01-01T11:00:00", "location": "BR"}\n',
+        '{"id": 4, "account_id": "a", "amount": 100, "timestamp": "2025-01-01T12:10:00+00:00", "location": "BR"}\n',
+        '{"id": 5, "account_id": "b", "timestamp": "2025-01-01T12:00:00", "location": "BR"}\n',
+        '{"id": 6, "account_id": "b", "amount": 100, "timestamp": "2025-01-01T09:20:00-03:00", "location": "BR"}\n',
+    ]
+    sink = io.StringIO()
+    count = FraudStreamPipeline(workers=workers, chunk_size=10).run(io.StringIO("".join(lines)), sink)
+    results = [json.loads(line) for line in sink.getvalue().splitlines()]
+
+    assert count == 6
+    assert ["error" in result for result in results] == [False, True, True, False, True, False]
+    assert results[1] == {"error": results[1]["error"]}
+    assert results[2]["id"] == 3 and results[2]["error"].startswith("ValueError: Transação fora de ordem")
+    assert results[4]["error"] == "KeyError: 'amount'"
+    assert results[3]["risk_score"] == 0 and results[5]["id"] == 6
@@ -0,0 +1,89 @@
+import json
+import os
+from generate_graph import build_function_cfg, build_functions, image_name
+
+BRANCHY = "def f(x):\n    if x > 0:\n        return 1\n    elif x < 0:\n        raise ValueError(x)\n    return 0\n"
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _cache(output):
+    with open(output / "functions_cache.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_outputs_keep_the_directory_structure(tmp_path):
+    source = tmp_path / "src"
+    _write(source / "a" / "b_c.py", "def f(x):\n    return x\n")
+    _write(source / "a_b" / "c.py", "def f(x):\n    return -x\n")
+
+    assert image_name(str(source), str(source / "a" / "b_c.py")) == os.path.join("a", "b_c")
+    assert image_name(str(source), str(source / "a_b" / "c.py")) == os.path.join("a_b", "c")
+
+    report = build_functions(str(source), str(tmp_path / "out"))
+    dots = [entry["dot"] for entry in report["functions"].values()]
+    assert len(set(dots)) == 2
+    assert all(os.path.exists(dot) for dot in dots)
+
+
+def test_book_flight_metrics_and_second_run_rebuilds_nothing(tmp_path):
+    script = os.path.join("src", "flight", "FlightBookingSystem.py")
+    first = build_functions("src", str(tmp_path), [script], ["book_flight"])
+    entry = first["functions"]["flight/FlightBookingSystem.py::FlightBookingSystem.book_flight"]
+
+    assert entry["cyclomatic_complexity"] == 8
+    assert len(entry["branches"]) == 14
+    assert first["built"] == list(first["functions"])
+
+    second = build_functions("src", str(tmp_path), [script], ["book_flight"])
+    assert second["built"] == []
+    assert second["functions"] == first["functions"]
+
+
+def test_return_and_raise_blocks_join_one_virtual_exit():
+    metrics, dot = build_function_cfg("f", BRANCHY)
+
+    # Two returns and a raise joined to one virtual exit: 2 decisions -> complexity 3
+    assert metrics["cyclomatic_complexity"] == 3
+    assert metrics["edges"] - metrics["nodes"] + 2 < 3
+    assert dot.startswith("digraph")
+
+
+def test_only_changed_functions_are_rebuilt_and_lines_follow_the_file(tmp_path):
+    source = tmp_path / "src"
+    _write(source / "m.py", BRANCHY + "\n\ndef g(y):\n    return y\n")
+    output = tmp_path / "out"
+    build_functions(str(source), str(output))
+
+    # g changes and f moves down two lines: only g is rebuilt and f's branch lines follow it
+    _write(source / "m.py", "import os\n\n" + BRANCHY + "\n\ndef g(y):\n    return -y\n")
+    report = build_functions(str(source), str(output))
+
+    assert report["built"] == ["m.py::g"]
+    f = report["functions"]["m.py::f"]
+    assert f["line"] == 3
+    assert sorted({branch["line"] for branch in f["branches"]}) == [4, 6]
+    assert {branch["line"] for branch in _cache(output)["m.py::f"]["branches"]} == {2, 4}
+
+
+def test_names_and_scripts_limit_the_run_and_keep_the_rest_of_the_cache(tmp_path):
+    source = tmp_path / "src"
+    _write(source / "m.py", BRANCHY + "\n\nclass C:\n    def f(self):\n        return 1\n")
+    _write(source / "n.py", "def h():\n    return 2\n")
+    output = tmp_path / "out"
+    build_functions(str(source), str(output))
+
+    by_name = build_functions(str(source), str(output), names=["C.f"])
+    assert list(by_name["functions"]) == ["m.py::C.f"]
+    assert set(_cache(output)) == {"m.py::f", "m.py::C.f", "n.py::h"}
+
+    by_script = build_functions(str(source), str(output), [str(source / "n.py")])
+    assert list(by_script["functions"]) == ["n.py::h"]
+    assert set(_cache(output)) == {"m.py::f", "m.py::C.f", "n.py::h"}
+
+    os.remove(source / "n.py")
+    build_functions(str(source), str(output))
+    assert set(_cache(output)) == {"m.py::f", "m.py::C.f"}
@@ -0,0 +1,72 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.IncrementalEnergyManager import IncrementalEnergyManager
+
+PRIORITIES = {"Security": 1, "Refrigerator": 1, "Heating": 2, "Lights": 2, "Oven": 3, "Washer": 3, "TV": 2}
+START = datetime(2025, 1, 1, 21, 0)
+
+
+def _full(manager, schedules):
+    return SmartEnergyManagementSystem().manage_energy(
+        manager.current_price, manager.price_threshold, manager.device_priorities, manager.current_time,
+        manager.current_temperature, manager.desired_temperature_range, manager.energy_usage_limit,
+        manager.total_energy_used_today, schedules,
+    )
+
+
+def _assert_matches(manager, schedules):
+    expected = _full(manager, schedules)
+    result = manager.result()
+    assert result.device_status == expected.device_status
+    assert result.energy_saving_mode == expected.energy_saving_mode
+    assert result.temperature_regulation_active == expected.temperature_regulation_active
+    assert result.total_energy_used == expected.total_energy_used
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_event_sequences_match_full_recomputation(seed):
+    rng = random.Random(seed)
+    schedules = [DeviceSchedule(rng.choice(["Oven", "Washer", "Dryer"]), START + timedelta(minutes=30 * i))
+                 for i in range(12)]
+    manager = IncrementalEnergyManager(PRIORITIES, 0.5, (19.0, 23.0), 30.0, 0.4, START, 21.0, 28.0, schedules)
+    status = manager.device_status
+    _assert_matches(manager, schedules)
+
+    for _ in range(300):
+        event = rng.randrange(5)
+        if event == 0:
+            diff = manager.on_price(rng.choice([0.3, 0.5, 0.6]))
+        elif event == 1:
+            diff = manager.on_clock(manager.current_time + timedelta(minutes=rng.choice([0, 15, 30])))
+        elif event == 2:
+            diff = manager.on_temperature(rng.choice([15.0, 19.0, 21.0, 23.5]))
+        elif event == 3:
+            diff = manager.on_meter(rng.choice([10.0, 29.5, 30.0, 32.5, 36.0]))
+        elif rng.random() < 0.5 or len(schedules) < 2:
+            schedule = DeviceSchedule(rng.choice(["Lights", "Fan"]), manager.current_time)
+            schedules.append(schedule)
+            diff = manager.add_schedule(schedule)
+        else:
+            diff = manager.remove_schedule(schedules.pop(rng.randrange(len(schedules))))
+
+        for device, value in diff.items():
+            if value is None:
+                del status[device]
+            else:
+                status[device] = value
+        assert status == manager.device_status
+        _assert_matches(manager, schedules)
+
+
+def test_events_emit_only_changed_devices():
+    manager = IncrementalEnergyManager(PRIORITIES, 0.5, (19.0, 23.0), 100.0, 0.4, datetime(2025, 1, 1, 12, 0), 21.0, 0.0)
+
+    assert manager.on_price(0.45) == {}
+    assert manager.on_price(0.6) == {"Lights": False, "Oven": False, "Washer": False, "TV": False}
+    assert manager.on_temperature(15.0) == {"Heating": True, "Cooling": None}
+    assert manager.on_clock(datetime(2025, 1, 1, 12, 5)) == {}
+    with pytest.raises(ValueError):
+        manager.remove_schedule(DeviceSchedule("Oven", datetime(2025, 1, 1, 12, 5)))
@@ -0,0 +1,90 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from src.flight.FlightLeg import FlightLeg
+from src.flight.ItineraryBookingSystem import ItineraryBookingSystem
+from src.flight.SeatInventory import SeatInventory
+
+NOW = datetime(2025, 1, 1, 8, 0)
+
+
+@pytest.fixture(params=["inline", "threads"])
+def system(request):
+    inventory = SeatInventory()
+    inventory.add_flight("GRU-LIS", capacity=10)
+    inventory.add_flight("LIS-CDG", capacity=10, available=2)
+    inventory.add_flight("CDG-BER", capacity=10)
+    if request.param == "inline":
+        yield ItineraryBookingSystem(inventory)
+    else:
+        with ThreadPoolExecutor(4) as executor:
+            yield ItineraryBookingSystem(inventory, executor)
+
+
+def _legs(*flight_ids):
+    return [FlightLeg(flight_id, 500.0, 10, NOW + timedelta(hours=72 + 6 * i))
+            for i, flight_id in enumerate(flight_ids)]
+
+
+def test_itinerary_confirms_every_leg_and_sums_prices(system):
+    result = system.book_itinerary(_legs("GRU-LIS", "LIS-CDG", "CDG-BER"), 2, NOW)
+
+    single = system.book_flight(2, NOW, 10, 500.0, 10, False, NOW + timedelta(hours=72), 0)
+    assert result.confirmation is True
+    assert result.failed_legs == ()
+    assert result.points_used is False
+    assert result.total_price == pytest.approx(3 * single.total_price)
+    assert [leg.total_price for leg in result.legs] == [single.total_price] * 3
+    assert [system.inventory.available(flight) for flight in ("GRU-LIS", "LIS-CDG", "CDG-BER")] == [8, 0, 8]
+
+
+def test_points_balance_is_spent_once_across_legs(system):
+    # Cada trecho custa 500 * 0.08 * 2 = 80.0 (em ponto flutuante, um pouco mais: 8001 pontos o zeram)
+    result = system.book_itinerary(_legs("GRU-LIS", "LIS-CDG", "CDG-BER"), 2, NOW, reward_points_available=10000)
+
+    assert result.confirmation is True
+    assert result.points_spent == 10000
+    assert [leg.total_price for leg in result.legs] == [0.0, pytest.approx(60.01), pytest.approx(80.0)]
+    assert [leg.points_used for leg in result.legs] == [True, True, False]
+    assert result.total_price == pytest.approx(140.01)
+
+
+def test_rejected_itinerary_spends_no_points(system):
+    result = system.book_itinerary(_legs("GRU-LIS", "LIS-CDG"), 3, NOW, reward_points_available=500)
+    assert result.confirmation is False
+    assert result.points_spent == 0
+
+
+def test_rejected_leg_rolls_back_the_others(system):
+    result = system.book_itinerary(_legs("GRU-LIS", "LIS-CDG", "CDG-BER"), 3, NOW)
+
+    assert result.confirmation is False
+    assert result.total_price == 0.0
+    assert result.failed_legs == (1,)
+    assert [system.inventory.available(flight) for flight in ("GRU-LIS", "LIS-CDG", "CDG-BER")] == [10, 2, 10]
+
+
+def test_failing_leg_rolls_back_and_raises(system):
+    with pytest.raises(KeyError):
+        system.book_itinerary(_legs("GRU-LIS", "unknown", "CDG-BER"), 1, NOW)
+
+    assert system.inventory.available("GRU-LIS") == 10
+    assert system.inventory.available("CDG-BER") == 10
+    with pytest.raises(ValueError):
+        system.book_itinerary([], 1, NOW)
+
+
+class _BrokenReleaseInventory(SeatInventory):
+    def release(self, flight_id, seats):
+        raise OSError(f"estoque indisponível para {flight_id}")
+
+
+def test_failed_rollback_is_reported():
+    inventory = _BrokenReleaseInventory()
+    inventory.add_flight("GRU-LIS", capacity=10)
+    inventory.add_flight("LIS-CDG", capacity=10, available=0)
+    system = ItineraryBookingSystem(inventory)
+
+    with pytest.raises(RuntimeError, match="GRU-LIS") as raised:
+        system.book_itinerary(_legs("GRU-LIS", "LIS-CDG"), 1, NOW)
+    assert isinstance(raised.value.__cause__, OSError)
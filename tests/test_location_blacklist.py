@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.LocationInterner import LocationInterner
+from src.fraud.LocationBlacklist import LocationBlacklist
+
+
+@pytest.fixture
+def interner():
+    """Cria um internador de localizações vazio antes de cada teste"""
+    return LocationInterner()
+
+
+def test_intern_returns_stable_ids(interner):
+    """Verifica se a mesma localização sempre recebe o mesmo id e se lookup não registra novas."""
+    assert interner.intern("BR") == 0
+    assert interner.intern("US") == 1
+    assert interner.intern("BR") == 0
+    assert interner.lookup("AR") is None
+    assert interner.name(1) == "US"
+    assert len(interner) == 2
+
+
+def test_blacklist_accepts_names_and_ids(interner):
+    """Verifica se a lista negra responde tanto por nome quanto por id internado."""
+    blacklist = LocationBlacklist(["Las Vegas", "Miami"], interner)
+    assert "Miami" in blacklist
+    assert interner.lookup("Las Vegas") in blacklist
+    assert "New York" not in blacklist
+    assert interner.lookup("New York") is None
+
+
+def test_replace_swaps_contents_without_new_detector(interner):
+    """Verifica se replace troca o conteúdo e o mesmo detector passa a usar a nova lista."""
+    system = FraudDetectionSystem()
+    blacklist = LocationBlacklist(["US"], interner)
+    tx = interner.intern_transaction(Transaction(100, datetime.now(), "BR"))
+
+    assert system.check_for_fraud(tx, [], blacklist).risk_score == 0
+    blacklist.replace(["BR"])
+    result = system.check_for_fraud(tx, [], blacklist)
+    assert result.is_blocked is True
+    assert result.risk_score == 100
+    blacklist.discard("BR")
+    assert len(blacklist) == 0
+
+
+def test_location_change_rule_with_interned_ids(interner):
+    """Verifica se a regra de mudança de localização funciona com ids inteiros."""
+    system = FraudDetectionSystem()
+    now = datetime.now()
+    last = interner.intern_transaction(Transaction(100, now - timedelta(minutes=10), "US"))
+    tx = interner.intern_transaction(Transaction(100, now, "BR"))
+    assert isinstance(tx.location, int)
+    assert system.check_for_fraud(tx, [last], LocationBlacklist()).risk_score == 20
+
+
+def test_blacklist_accepts_numpy_integer_ids(interner):
+    """Verifica se ids np.int64 (como os de um lote colunar) funcionam como ids comuns."""
+    blacklist = LocationBlacklist([np.int64(interner.intern("Miami"))], interner)
+    assert "Miami" in blacklist
+    assert np.int64(0) in blacklist
+    blacklist.discard(np.int64(0))
+    assert len(blacklist) == 0
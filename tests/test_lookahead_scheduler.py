@@ -0,0 +1,53 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeferrableJob import DeferrableJob
+from src.energy.LookaheadScheduler import LookaheadScheduler
+
+START = datetime(2025, 1, 1, 0, 0)
+SLOT = timedelta(minutes=15)
+
+
+def _jobs(rng, count):
+    return [DeferrableJob(f"D{i}", SLOT * rng.randint(1, 12), rng.uniform(0.5, 3.0),
+                          START + SLOT * rng.randint(8, 96), rng.randint(1, 3),
+                          START + SLOT * rng.randint(0, 20))
+            for i in range(count)]
+
+
+def test_plan_picks_cheapest_window_before_deadline():
+    rng = random.Random(5)
+    prices = [rng.uniform(0.1, 0.9) for _ in range(96)]
+    scheduler = LookaheadScheduler(START, prices, SLOT)
+    jobs = _jobs(rng, 200)
+
+    for job, start in zip(jobs, scheduler.plan(jobs)):
+        length = job.duration // SLOT
+        first = (job.earliest_start - START) // SLOT
+        candidates = [(sum(prices[s:s + length]), s) for s in range(first, (job.deadline - START) // SLOT - length + 1)]
+        if not candidates:
+            assert start is None
+            continue
+        assert start >= first
+        assert start + length <= (job.deadline - START) // SLOT
+        assert sum(prices[start:start + length]) == pytest.approx(min(candidates)[0])
+
+
+def test_capacity_is_respected_and_essential_priority_wins():
+    prices = [0.9] * 8 + [0.1] * 4 + [0.9] * 12
+    scheduler = LookaheadScheduler(START, prices, SLOT, capacity=1.0)
+    low = DeferrableJob("Dryer", SLOT * 4, 4.0, START + SLOT * 24, priority=3)
+    high = DeferrableJob("Washer", SLOT * 4, 4.0, START + SLOT * 24, priority=1)
+    too_big = DeferrableJob("Kiln", SLOT * 2, 10.0, START + SLOT * 24)
+    late = DeferrableJob("Pump", SLOT * 4, 1.0, START + SLOT * 2)
+
+    starts = scheduler.plan([low, high, too_big, late])
+    assert starts[1] == 8
+    assert starts[0] is not None and starts[0] != 8
+    assert starts[2] is None
+    assert starts[3] is None
+
+    schedules = scheduler.schedule([low, high])
+    assert [schedule.device_name for schedule in schedules] == ["Dryer", "Washer"]
+    assert schedules[1].scheduled_time == START + SLOT * 8
+    assert scheduler.cost(high, 8) == pytest.approx(0.4)
@@ -0,0 +1,65 @@
+import random
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.PricingCache import PricingCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cached_results_match_book_flight():
+    cache = PricingCache(max_entries=50)
+    scalar = FlightBookingSystem()
+    rng = random.Random(4)
+    now = datetime(2025, 1, 1, 8, 0)
+    for _ in range(3000):
+        request = (
+            rng.randint(1, 6), now + timedelta(seconds=rng.randint(0, 600)), rng.randint(0, 6),
+            rng.choice([100.0, 500.0]), rng.choice([0, 10]), rng.random() < 0.3,
+            now + timedelta(hours=rng.choice([10, 24, 30, 48, 72])), rng.choice([0, 500]),
+        )
+        cached = cache.book_flight(*request)
+        expected = scalar.book_flight(*request)
+        assert (cached.confirmation, cached.total_price, cached.refund_amount, cached.points_used) == \
+            (expected.confirmation, expected.total_price, expected.refund_amount, expected.points_used)
+    assert cache.hits > cache.misses
+    assert len(cache) <= 50
+    assert cache.evictions > 0
+
+
+def test_quotes_seconds_apart_share_an_entry():
+    cache = PricingCache()
+    now = datetime(2025, 1, 1, 8, 0)
+    departure = now + timedelta(hours=72)
+    first = cache.book_flight(2, now, 10, 500.0, 10, False, departure, 0)
+    second = cache.book_flight(2, now + timedelta(seconds=30), 10, 500.0, 10, False, departure, 0)
+    assert second is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_ttl_expires_entries():
+    clock = FakeClock()
+    cache = PricingCache(ttl=5, clock=clock)
+    now = datetime(2025, 1, 1, 8, 0)
+    cache.book_flight(1, now, 10, 500.0, 10, False, now + timedelta(hours=72), 0)
+    clock.now = 6
+    cache.book_flight(1, now, 10, 500.0, 10, False, now + timedelta(hours=72), 0)
+    assert cache.misses == 2
+
+
+def test_invalidate_by_price_or_sales():
+    cache = PricingCache()
+    now = datetime(2025, 1, 1, 8, 0)
+    departure = now + timedelta(hours=72)
+    cache.book_flight(1, now, 10, 500.0, 10, False, departure, 0)
+    cache.book_flight(1, now, 10, 600.0, 10, False, departure, 0)
+    cache.book_flight(1, now, 10, 600.0, 20, False, departure, 0)
+    assert cache.invalidate(current_price=500.0) == 1
+    assert cache.invalidate(previous_sales=20) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
@@ -0,0 +1,58 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.ScheduleIndex import ScheduleIndex
+
+START = datetime(2025, 1, 1, 0, 0)
+
+
+def test_exact_index_matches_list_scan_in_manage_energy():
+    rng = random.Random(3)
+    schedules = [DeviceSchedule(f"D{rng.randrange(20)}", START + timedelta(minutes=rng.randrange(600)))
+                 for _ in range(300)]
+    index = ScheduleIndex()
+    for schedule in schedules:
+        index.add(schedule)
+
+    system = SmartEnergyManagementSystem()
+    for minute in range(0, 600, 7):
+        now = START + timedelta(minutes=minute)
+        arguments = (0.2, 0.5, {"Security": 1, "D1": 2}, now, 21.0, (19.0, 23.0), 100.0, 0.0)
+        assert (system.manage_energy(*arguments, index).device_status
+                == system.manage_energy(*arguments, schedules).device_status)
+
+
+def test_tolerance_catches_times_between_ticks():
+    index = ScheduleIndex(tolerance=timedelta(seconds=5))
+    index.add(DeviceSchedule("Washer", START + timedelta(seconds=2)))
+
+    assert index.due(START) == []
+    assert index.due(START + timedelta(seconds=5)) == ["Washer"]
+    assert index.due(START + timedelta(seconds=10)) == []
+
+
+def test_recurring_schedules_roll_forward():
+    index = ScheduleIndex(tolerance=timedelta(minutes=1))
+    handle = index.add(DeviceSchedule("Pump", START + timedelta(hours=6)), every=timedelta(days=1))
+
+    assert index.due(START + timedelta(hours=6)) == ["Pump"]
+    assert index.due(START + timedelta(days=3, hours=6, seconds=30)) == ["Pump"]
+    assert index.due(START + timedelta(days=3, hours=7)) == []
+    assert index.due(START + timedelta(days=4, hours=6)) == ["Pump"]
+
+    assert index.remove(handle).device_name == "Pump"
+    assert index.due(START + timedelta(days=5, hours=6)) == []
+    assert len(index) == 0
+    with pytest.raises(KeyError):
+        index.remove(handle)
+
+
+def test_remove_one_shot_keeps_the_others():
+    index = ScheduleIndex()
+    first = index.add(DeviceSchedule("Oven", START))
+    index.add(DeviceSchedule("Dryer", START))
+
+    index.remove(first)
+    assert index.due(START) == ["Dryer"]
@@ -0,0 +1,91 @@
+import threading
+import pytest
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.SeatInventory import SeatInventory
+
+
+@pytest.fixture
+def system():
+    inventory = SeatInventory()
+    inventory.add_flight("AD4050", capacity=10)
+    return FlightBookingSystem(inventory)
+
+
+def _book(system, passengers):
+    now = datetime(2025, 1, 1, 8, 0)
+    return system.book("AD4050", passengers, now, 500.0, 10, now + timedelta(hours=72), 0)
+
+
+def test_book_decrements_only_when_confirmed(system):
+    assert _book(system, 4).confirmation is True
+    assert system.inventory.available("AD4050") == 6
+    assert _book(system, 7).confirmation is False
+    assert system.inventory.available("AD4050") == 6
+
+
+def test_cancel_refunds_and_releases_seats(system):
+    _book(system, 3)
+    now = datetime(2025, 1, 1, 8, 0)
+    result = system.cancel("AD4050", 2, now, 500.0, 10, now + timedelta(hours=72))
+    assert result.refund_amount == pytest.approx(80.0)
+    assert result.confirmation is False
+    assert system.inventory.available("AD4050") == 9
+    with pytest.raises(ValueError):
+        system.cancel("AD4050", 2, now, 500.0, 10, now + timedelta(hours=72))
+
+
+def test_concurrent_bookings_never_overbook(system):
+    confirmed = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(50):
+            if _book(system, 1).confirmation:
+                with lock:
+                    confirmed.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(confirmed) == 10
+    assert system.inventory.available("AD4050") == 0
+
+
+def test_reserve_and_release_are_bounded():
+    inventory = SeatInventory()
+    inventory.add_flight("LA3300", capacity=2, available=1)
+    assert inventory.reserve("LA3300", 2) is False
+    assert inventory.reserve("LA3300", 1) is True
+    inventory.release("LA3300", 2)
+    with pytest.raises(ValueError):
+        inventory.release("LA3300", 1)
+    with pytest.raises(KeyError):
+        inventory.available("unknown")
+    with pytest.raises(ValueError):
+        inventory.add_flight("LA3300", capacity=2)
+
+
+@pytest.mark.parametrize("seats", [0, -5])
+def test_non_positive_seat_counts_are_rejected(system, seats):
+    now = datetime(2025, 1, 1, 8, 0)
+    with pytest.raises(ValueError):
+        system.inventory.reserve("AD4050", seats)
+    with pytest.raises(ValueError):
+        system.inventory.release("AD4050", seats)
+    with pytest.raises(ValueError):
+        system.book("AD4050", seats, now, 500.0, 10, now + timedelta(hours=72), 0)
+    with pytest.raises(ValueError):
+        system.cancel("AD4050", seats, now, 500.0, 10, now + timedelta(hours=72))
+    assert system.inventory.available("AD4050") == 10
+
+
+def test_release_never_exceeds_capacity(system):
+    system.inventory.reserve("AD4050", 3)
+    with pytest.raises(ValueError):
+        system.inventory.release("AD4050", 4)
+    system.inventory.release("AD4050", 3)
+    assert system.inventory.available("AD4050") == 10
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.fraud.Transaction import Transaction
+from src.fraud.AccountFraudDetectionSystem import AccountFraudDetectionSystem
+from src.fraud.FraudCheckService import FraudCheckService
+from src.fraud.LocationBlacklist import LocationBlacklist
+from src.fraud.ShardedFraudExecutor import ShardedFraudExecutor, shard_of
+
+
+def _items(size=300):
+    rng = random.Random(3)
+    clock = {f"acc{i}": datetime(2025, 1, 1) for i in range(20)}
+    items = []
+    for _ in range(size):
+        account = rng.choice(list(clock))
+        clock[account] += timedelta(minutes=rng.choice([0, 1, 5, 29, 31, 61]))
+        items.append((account, Transaction(rng.choice([100, 20000]), clock[account], rng.choice(["BR", "US", "XX"]))))
+    return items
+
+
+def _as_tuples(results):
+    return [(r.is_fraudulent, r.is_blocked, r.verification_required, r.risk_score) for r in results]
+
+
+@pytest.mark.parametrize("shards", [1, 3])
+def test_sharded_results_match_single_system(shards):
+    """Verifica se os resultados com shards são iguais aos de um único sistema com estado."""
+    items = _items()
+    expected = AccountFraudDetectionSystem().check_batch(items, ["XX"])
+    with ShardedFraudExecutor(shards, ["XX"]) as executor:
+        results = executor.check_batch(items[:100]) + executor.check_batch(items[100:])
+    assert _as_tuples(results) == _as_tuples(expected)
+
+
+def test_blacklist_changes_reach_workers():
+    """Verifica se uma LocationBlacklist alterada entre lotes é reenviada aos workers."""
+    blacklist = LocationBlacklist(["US"])
+    now = datetime(2025, 1, 1)
+    with ShardedFraudExecutor(2) as executor:
+        first = executor.check_batch([("a", Transaction(1, now, "BR"))], blacklist)
+        blacklist.replace(["BR"])
+        second = executor.check_batch([("a", Transaction(1, now, "BR"))], blacklist)
+    assert first[0].risk_score == 0
+    assert second[0].risk_score == 100
+
+
+def test_worker_errors_are_raised_in_caller():
+    """Verifica se um erro dentro de um worker chega ao chamador sem travar os próximos lotes."""
+    now = datetime(2025, 1, 1)
+    with ShardedFraudExecutor(2) as executor:
+        executor.check_batch([("a", Transaction(1, now, "BR"))])
+        with pytest.raises(ValueError):
+            executor.check_batch([("a", Transaction(1, now - timedelta(minutes=1), "BR"))])
+        assert executor.check_batch([("b", Transaction(1, now, "BR"))])[0].risk_score == 0
+
+
+def test_executor_backs_async_service():
+    """Verifica se o executor com shards pode ser usado como sistema do FraudCheckService."""
+    async def scenario(executor):
+        async with FraudCheckService(executor, ["XX"]) as service:
+            return await asyncio.gather(*(service.check(account, tx) for account, tx in _items(50)))
+
+    with ShardedFraudExecutor(2) as executor:
+        results = asyncio.run(scenario(executor))
+    assert _as_tuples(results) == _as_tuples(AccountFraudDetectionSystem().check_batch(_items(50), ["XX"]))
+
+
+def test_shard_of_is_stable():
+    """Verifica se o shard de uma conta é determinístico e está dentro do intervalo."""
+    assert shard_of("acc1", 8) == shard_of("acc1", 8)
+    assert all(0 <= shard_of(f"acc{i}", 4) < 4 for i in range(100))
+
+
+def test_sharded_results_carry_rules_fired():
+    """Verifica se o detalhamento das regras sobrevive ao empacotamento entre processos."""
+    items = _items(100)
+    expected = AccountFraudDetectionSystem(explain=True).check_batch(items, ["XX"])
+    with ShardedFraudExecutor(2, ["XX"], explain=True) as executor:
+        results = executor.check_batch(items)
+    assert [r.rules_fired for r in results] == [r.rules_fired for r in expected]
+    assert any(r.rules_fired for r in results)
+
+
+def _exit_on_die(system, blacklist, lines):
+    if "die" in lines:
+        os._exit(3)
+    return lines
+
+
+def test_dead_worker_is_reported_clearly():
+    """Verifica se um worker que morre vira RuntimeError, tanto no lote quanto no close()."""
+    executor = ShardedFraudExecutor(2, line_handler=_exit_on_die)
+    assert executor.check_lines(["x", "y"], str) == ["x", "y"]
+    with pytest.raises(RuntimeError):
+        executor.check_lines(["die"] * 4, str)
+    with pytest.raises(RuntimeError, match="terminaram inesperadamente"):
+        executor.close()
+
+
+@pytest.mark.parametrize("shards", [1, 2])
+def test_bad_item_does_not_poison_batch(shards):
+    """Verifica se um item fora de ordem só afeta o próprio resultado, e não os das outras contas."""
+    now = datetime(2025, 1, 1)
+    with ShardedFraudExecutor(shards) as executor:
+        executor.check_batch([("a", Transaction(1, now, "BR"))])
+        batch = [("b", Transaction(1, now, "BR")),
+                 ("a", Transaction(1, now - timedelta(minutes=1), "BR")),
+                 ("c", Transaction(20000, now, "BR"))]
+        results = executor.check_batch(batch, return_exceptions=True)
+        with pytest.raises(ValueError):
+            executor.check_batch([("d", Transaction(1, now, "BR")),
+                                  ("a", Transaction(1, now - timedelta(minutes=1), "BR"))])
+        later = now + timedelta(minutes=1)
+        again = executor.check_batch([("b", Transaction(1, later, "US")), ("d", Transaction(1, later, "US"))])
+    assert isinstance(results[1], ValueError)
+    assert [results[0].risk_score, results[2].risk_score] == [0, 50]
+    # b e d foram avaliadas e guardadas apesar do erro de a: a mudança de localização é detectada
+    assert [result.risk_score for result in again] == [20, 20]
+
+
+@pytest.mark.parametrize("shards", [1, 2])
+def test_timezone_aware_timestamps(shards):
+    """Verifica se horários com fuso dão o mesmo resultado com qualquer número de shards."""
+    utc = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    brt = timezone(timedelta(hours=-3))
+    items = [("a", Transaction(100, utc, "US")),
+             ("a", Transaction(100, (utc + timedelta(minutes=10)).astimezone(brt), "BR"))]
+    with ShardedFraudExecutor(shards) as executor:
+        results = executor.check_batch(items)
+    assert [result.risk_score for result in results] == [0, 20]
+
+
+def test_one_and_two_shards_agree_on_mixed_input():
+    """Verifica se horários com e sem fuso, valores inteiros e valores inválidos dão o mesmo resultado com 1 ou 2 shards."""
+    now = datetime(2025, 1, 1, 12)
+    brt = timezone(timedelta(hours=-3))
+    items = [("a", Transaction(100, now, "US")),
+             ("a", Transaction(20000, (now + timedelta(minutes=10)).replace(tzinfo=timezone.utc).astimezone(brt), "BR")),
+             ("b", Transaction("100", now, "US")),
+             ("b", Transaction(100.0, now.replace(tzinfo=timezone.utc), "US")),
+             ("c", Transaction(None, now, "US"))]
+
+    outcomes = []
+    for shards in (1, 2):
+        with ShardedFraudExecutor(shards) as executor:
+            results = executor.check_batch(items, return_exceptions=True)
+        outcomes.append([type(result).__name__ if isinstance(result, Exception) else _as_tuples([result])[0]
+                         for result in results])
+    assert outcomes[0] == outcomes[1]
+    assert outcomes[0][2] == outcomes[0][4] == "TypeError"
+    assert outcomes[0][1][3] == 70
@@ -0,0 +1,48 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.TransactionBatch import TransactionBatch
+
+
+def test_transaction_and_result_have_no_instance_dict():
+    """Verifica se Transaction e FraudCheckResult usam __slots__ e mantêm o mesmo repr."""
+    tx = Transaction(100, datetime(2025, 1, 1, 12, 0), "BR")
+    result = FraudCheckResult(False, True, False, 30)
+    assert not hasattr(tx, "__dict__")
+    assert not hasattr(result, "__dict__")
+    assert repr(tx) == "Transaction(amount=100, timestamp='2025-01-01 12:00:00', location='BR')"
+    assert repr(result) == ("FraudCheckResult(is_fraudulent=False, is_blocked=True, "
+                            "verification_required=False, risk_score=30)")
+
+
+def test_batch_round_trips_transactions():
+    """Verifica se as transações lidas do lote têm os mesmos valores e localizações internadas."""
+    timestamps = [datetime(2025, 1, 1, 12, 0, 0, 1), datetime(2025, 1, 1, 12, 30)]
+    batch = TransactionBatch([
+        Transaction(15000, timestamps[0], "New York"),
+        Transaction(20.5, timestamps[1], "Miami"),
+    ])
+
+    assert len(batch) == 2
+    assert [tx.timestamp for tx in batch] == timestamps
+    assert batch[0].amount == 15000
+    assert batch.interner.name(batch[1].location) == "Miami"
+    assert batch.location_ids.typecode == "q"
+
+
+def test_batch_slices_and_keeps_aware_instants():
+    """Verifica se fatias viram sub-lotes e se horários com fuso voltam como o mesmo instante."""
+    brasilia = timezone(timedelta(hours=-3))
+    transactions = [Transaction(i, datetime(2025, 1, 1, 12, i, tzinfo=brasilia), "BR") for i in range(4)]
+    batch = TransactionBatch(transactions)
+
+    part = batch[1:3]
+    assert isinstance(part, TransactionBatch)
+    assert [tx.amount for tx in part] == [1, 2]
+    assert part.interner is batch.interner
+    assert [tx.timestamp for tx in batch] == [tx.timestamp for tx in transactions]
+    assert batch[0].timestamp.tzinfo is timezone.utc
+
+    with pytest.raises(ValueError):
+        batch.append(Transaction(5, datetime(2025, 1, 1, 13, 0), "BR"))